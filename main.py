@@ -7,6 +7,7 @@ constants, game initialization, entity management, and the game loop.
 @author RELLIS Developments
 """
 # Standard Imports
+import argparse
 import os
 import sys
 
@@ -14,7 +15,33 @@ import sys
 import pygame
 
 # Local Imports
-from src.managers import ScreenManager, SoundManager
+from src.constants import FPS, PROFILE_PATH, PROFILE_SAMPLE_RATE
+from src.managers import ScreenManager, SoundManager, SamplerManager, memory, metrics, tracer
+
+# Parse the command line options
+parser = argparse.ArgumentParser(description="Play Leafy Legions.")
+parser.add_argument("--metrics", metavar="PATH", default=None,
+                    help="write the work counted in each frame to this CSV (.csv) or JSON-lines file")
+parser.add_argument("--trace", metavar="PATH", default=None,
+                    help="trace the latest frames, saved as a Chrome trace to this file on exit or when F4 is pressed")
+parser.add_argument("--profile", metavar="PATH", nargs="?", const=PROFILE_PATH, default=None,
+                    help=f"sample the call stacks from the start, saved as collapsed stacks to this file on exit "
+                         f"(default: {PROFILE_PATH}), F6 starts and stops sampling at any time")
+parser.add_argument("--profile-rate", metavar="HZ", type=float, default=PROFILE_SAMPLE_RATE,
+                    help="call stacks sampled per second")
+parser.add_argument("--memory", metavar="PATH", default=None,
+                    help="trace allocations, logging the memory used by each wave and where it grew to this file")
+args = parser.parse_args()
+if args.metrics:
+    metrics.open(args.metrics)
+if args.memory:
+    memory.start(args.memory)
+if args.trace:
+    tracer.start()
+sampler_manager = SamplerManager(rate=args.profile_rate)
+profile_path: str = args.profile or PROFILE_PATH
+if args.profile:
+    sampler_manager.start()
 
 # Initialize Pygame
 pygame.init()
@@ -28,44 +55,86 @@ pygame.display.set_caption("Leafy Legions")
 # Create an instance of ScreenManager
 screen_manager = ScreenManager(display)
 sound_manager = screen_manager.sound_manager
+profile_manager = screen_manager.profile_manager
+histogram_manager = screen_manager.histogram_manager
 
 # Set the default screen to the Main Menu
 screen_manager.set_screen("MainMenuScreen")
 
+# The display clock only limits the frame rate,
+# game speed is handled by each GameManager's simulation clock
+clock = pygame.time.Clock()
+
 # Main game loop
 while screen_manager.is_running():
+    profile_manager.begin_frame()
 
     # Handle Events
-    for event in pygame.event.get():
-
-        # If QUIT Event:
-        if event.type == pygame.QUIT:
-            # Quit current screen, ending the program
-            screen_manager.quit()
-
-        # If CLICK Event:
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            # Send mouse clicks to the current screen to get handled
-            if screen_manager.current_screen:
-                mouse_pos: tuple[int, int] = pygame.mouse.get_pos()
-                screen_manager.current_screen.handle_click_events(mouse_pos)
-
-        # If KEYBOARD Event
-        elif event.type == pygame.KEYDOWN:
-            key_pressed: int = event.key
-            unicode_char: str = event.unicode
-            screen_manager.current_screen.handle_key_events(key_pressed, unicode_char)
+    with profile_manager.phase("Events"):
+        for event in pygame.event.get():
+
+            # If QUIT Event:
+            if event.type == pygame.QUIT:
+                # Quit current screen, ending the program
+                screen_manager.quit()
+
+            # If CLICK Event:
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                # Send mouse clicks to the current screen to get handled
+                if screen_manager.current_screen:
+                    mouse_pos: tuple[int, int] = pygame.mouse.get_pos()
+                    screen_manager.current_screen.handle_click_events(mouse_pos)
+
+            # If F3 is pressed, show or hide the profiler overlay on any screen
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profile_manager.toggle()
+
+            # If F4 is pressed while tracing, save the trace so far (i.e. right after a hitch)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and args.trace:
+                tracer.save(args.trace)
+                print(f"Trace saved to {args.trace}")
+
+            # If F5 is pressed, print the frame times so far
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                print(histogram_manager.get_report())
+
+            # If F6 is pressed, start sampling the call stacks, or stop and save the samples
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F6:
+                if sampler_manager.is_running():
+                    sampler_manager.stop()
+                    sampler_manager.save(profile_path)
+                    print(f"Profile saved to {profile_path}")
+                else:
+                    sampler_manager.start()
+                    print("Profiling...")
+
+            # If KEYBOARD Event
+            elif event.type == pygame.KEYDOWN:
+                key_pressed: int = event.key
+                unicode_char: str = event.unicode
+                screen_manager.current_screen.handle_key_events(key_pressed, unicode_char)
 
     # If a screen is running, render the current screen
     if screen_manager.current_screen:
         screen_manager.run_current_screen()
 
-    pygame.display.flip()
+    profile_manager.draw(display)
+    with profile_manager.phase("Flip"):
+        pygame.display.flip()
+    profile_manager.end_frame()
+    metrics.end_frame()
+    histogram_manager.end_frame(screen_manager.current_screen)
 
-    # Use 60 FPS
-    # Divide by the game speed (for 2x support)
-    pygame.time.delay(60 // screen_manager.game_speed)
+    # Limit the display to FPS frames per second
+    clock.tick(FPS)
 
 # If no screens are being displayed, close pygame and app
+metrics.close()
+memory.stop()
+if args.trace:
+    tracer.save(args.trace)
+if sampler_manager.is_running():
+    sampler_manager.stop()
+    sampler_manager.save(profile_path)
 pygame.quit()
 sys.exit()
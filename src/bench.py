@@ -0,0 +1,293 @@
+"""
+Leafy Legions: Microbenchmarks
+
+This module times the hot paths of the simulation and the renderer
+(GameManager, WaveManager, GameplayScreen, BaseScreen) on boards of increasing density,
+using SDL's dummy video and audio drivers, so it runs without a window
+
+Usage:
+    python -m src.bench
+    python -m src.bench --density 10,1000 --filter render --vectorized --csv bench.csv
+"""
+# Standard Imports
+import argparse
+import contextlib
+import csv
+import os
+import random
+from statistics import median
+import timeit
+from typing import Any, Callable
+
+# Use the dummy drivers before pygame is imported by the screens
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Library Imports
+import pygame
+
+# Local Imports
+# The managers must be imported before the entities, as the entities depend on them
+from src.constants import GRID_WIDTH, GRID_HEIGHT, GRID_SIZE
+from src.managers import GameManager, SoundManager, WaveManager, ReplayManager, ProfileManager
+from src.entities import Entity, Plant, Zombie, Projectile, registry
+from src.screens import GameplayScreen
+
+DENSITIES: tuple[int, ...] = (10, 100, 1000, 5000)
+
+# A benchmark prepares the screen for a density (or None if it does not depend on the board),
+# and returns the code to set up each run, the code to time, and how many times to call it per run
+# (None to call it as many times as fit in about 0.2 seconds)
+Benchmark = Callable[[GameplayScreen, int | None], tuple[Callable[[], None], Callable[[], None], int | None]]
+
+
+class BenchScreenManager:
+    """
+    A stand-in for the ScreenManager, with the audio disabled and no database,
+    so screens can be created without a window or a network connection.
+    """
+    def __init__(self, display: pygame.Surface) -> None:
+        """
+        Initialize a BenchScreenManager object.
+
+        Args:
+            display (pygame.Surface): The display to render to.
+        """
+        self.display = display
+        self.sound_manager = SoundManager(enabled=False)
+        self.profile_manager = ProfileManager()
+        self.database_manager = None
+        self.user_logged_in = "benchmark"
+        self.game_speed = 1
+
+
+def create_entities(game_manager: GameManager, density: int, seed: int = 0) -> list[Entity]:
+    """
+    Create entities spread over the board: up to a third plants, one per cell of the grid at most
+    (as in a game), and the rest split evenly between zombies and projectiles.
+
+    Args:
+        game_manager (GameManager): The game manager the entities belong to.
+        density (int): The number of entities to create.
+        seed (int): The seed of their classes and positions. Default: 0
+
+    Returns:
+        list[Entity]: The entities, not yet added to the game manager.
+    """
+    rng = random.Random(seed)
+    board_width = GRID_WIDTH * GRID_SIZE
+    plant_count = min(density // 3, GRID_WIDTH * GRID_HEIGHT)
+    entities = []
+    for cell in rng.sample(range(GRID_WIDTH * GRID_HEIGHT), plant_count):
+        plant_class = rng.choice(registry.get_classes(Plant))
+        entities.append(plant_class(game_manager, cell % GRID_WIDTH * GRID_SIZE, cell // GRID_WIDTH * GRID_SIZE))
+    for index in range(density - plant_count):
+        base_class = (Zombie, Projectile)[index % 2]
+        entity_class = rng.choice(registry.get_classes(base_class))
+        y = rng.randrange(GRID_HEIGHT) * GRID_SIZE
+        if base_class is Zombie:
+            x = rng.randrange(board_width // 2, board_width)
+        else:
+            x = rng.randrange(GRID_SIZE, board_width // 2)
+        entities.append(entity_class(game_manager, x, y))
+    return entities
+
+
+def new_game(screen: GameplayScreen) -> GameManager:
+    """
+    Give a screen a new game with an empty board, using the same engine as its current game.
+    Each run starts from a new game, so entities pooled or keyframes taken by earlier runs do not skew it.
+
+    Args:
+        screen (GameplayScreen): The screen to give a new game.
+
+    Returns:
+        GameManager: The game manager of the new game.
+    """
+    vectorized = screen.game_manager.batch is not None
+    screen.game_manager = GameManager(screen.sound_manager, vectorized=vectorized, seed=0)
+    screen.game_manager.replay = ReplayManager(screen.game_manager.random.seed, vectorized=vectorized)
+    screen.wave_manager = WaveManager(screen.game_manager)
+    return screen.game_manager
+
+
+def populate(screen: GameplayScreen, density: int) -> None:
+    """
+    Give a screen a new game with a board of the given density.
+
+    Args:
+        screen (GameplayScreen): The screen to populate.
+        density (int): The number of entities on the board.
+    """
+    game_manager = new_game(screen)
+    game_manager.add_all(create_entities(game_manager, density))
+
+
+def bench_render_entities(screen: GameplayScreen, density: int) -> tuple[Callable, Callable, int | None]:
+    """
+    Simulate ticks of a populated board (GameplayScreen.render_entities).
+    """
+    return lambda: populate(screen, density), screen.render_entities, 10
+
+
+def bench_draw_entities(screen: GameplayScreen, density: int) -> tuple[Callable, Callable, int | None]:
+    """
+    Draw every entity of a populated board (GameplayScreen.draw_entities).
+    """
+    populate(screen, density)
+    return lambda: None, lambda: screen.draw_entities(screen.game_manager.get_entities()), None
+
+
+def bench_add(screen: GameplayScreen, density: int) -> tuple[Callable, Callable, int | None]:
+    """
+    Add every entity of a board, one at a time (GameManager.add).
+    """
+    entities = []
+
+    def setup() -> None:
+        entities[:] = create_entities(new_game(screen), density)
+
+    def add_entities() -> None:
+        for entity in entities:
+            screen.game_manager.add(entity)
+    return setup, add_entities, 1
+
+
+def bench_remove(screen: GameplayScreen, density: int) -> tuple[Callable, Callable, int | None]:
+    """
+    Remove every entity of a populated board, one at a time, then commit (GameManager.remove).
+    """
+    entities = []
+
+    def setup() -> None:
+        populate(screen, density)
+        entities[:] = screen.game_manager.get_entities()
+
+    def remove_entities() -> None:
+        for entity in entities:
+            screen.game_manager.remove(entity)
+        screen.game_manager.commit()
+    return setup, remove_entities, 1
+
+
+def bench_get_entities(screen: GameplayScreen, density: int) -> tuple[Callable, Callable, int | None]:
+    """
+    Get every entity of a populated board, then the zombies (GameManager.get_entities).
+    """
+    populate(screen, density)
+    game_manager = screen.game_manager
+
+    def get_entities() -> None:
+        game_manager.get_entities()
+        game_manager.get_entities(Zombie)
+    return lambda: None, get_entities, None
+
+
+def bench_begin_wave(screen: GameplayScreen, density: int) -> tuple[Callable, Callable, int | None]:
+    """
+    Begin wave 20 on a populated board, including its replay keyframe (WaveManager.begin_wave).
+    """
+    def setup() -> None:
+        populate(screen, density)
+        screen.wave_manager.set_wave(19, 0)
+    return setup, lambda: screen.wave_manager.begin_wave(), 1
+
+
+def bench_display_message(screen: GameplayScreen, _) -> tuple[Callable, Callable, int | None]:
+    """
+    Draw the coin counter of the GameplayScreen (BaseScreen.display_message).
+    """
+    def display_message() -> None:
+        screen.display_message(message="Coins: 1,000", font_color=screen.colors.WHITE,
+                               text_position=(15, 20), text_align="topleft")
+    return lambda: None, display_message, None
+
+
+def bench_display_button(screen: GameplayScreen, _) -> tuple[Callable, Callable, int | None]:
+    """
+    Draw a button of the pause screen (BaseScreen.display_button).
+    """
+    def display_button() -> None:
+        screen.display_button("Return to Game", (460, 300), button_size=(200, 50))
+    return lambda: None, display_button, None
+
+
+# Each benchmark, and whether it depends on the density of the board
+BENCHMARKS: dict[str, tuple[Benchmark, bool]] = {
+    "GameplayScreen.render_entities": (bench_render_entities, True),
+    "GameplayScreen.draw_entities": (bench_draw_entities, True),
+    "GameManager.add": (bench_add, True),
+    "GameManager.remove": (bench_remove, True),
+    "GameManager.get_entities": (bench_get_entities, True),
+    "WaveManager.begin_wave": (bench_begin_wave, True),
+    "BaseScreen.display_message": (bench_display_message, False),
+    "BaseScreen.display_button": (bench_display_button, False),
+}
+
+
+def run_benchmark(benchmark: Benchmark, screen: GameplayScreen, density: int | None, repeat: int) -> dict[str, Any]:
+    """
+    Time a benchmark at a density.
+
+    Args:
+        benchmark (Benchmark): The benchmark to time.
+        screen (GameplayScreen): The screen to benchmark on.
+        density (int | None): The number of entities on the board, or None if the benchmark does not depend on it.
+        repeat (int): The number of runs, only the best and median run are kept.
+
+    Returns:
+        dict[str, Any]: The number of calls per run, and the best and median time of a call, in microseconds.
+    """
+    with contextlib.redirect_stdout(None):  # Entities print what happens to them
+        setup, statement, number = benchmark(screen, density)
+        timer = timeit.Timer(statement, setup)
+        if number is None:
+            number, _ = timer.autorange()
+        times = [run_time / number * 1e6 for run_time in timer.repeat(repeat=repeat, number=number)]
+    return {"calls": number, "best_us": min(times), "median_us": median(times)}
+
+
+def main() -> None:
+    """
+    Run the benchmarks from the command line and print their results.
+    """
+    parser = argparse.ArgumentParser(description="Time the hot paths of Leafy Legions on boards of increasing density.")
+    parser.add_argument("--density", default=",".join(map(str, DENSITIES)),
+                        help="comma-separated numbers of entities on the board")
+    parser.add_argument("--filter", default="", help="only run the benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each benchmark")
+    parser.add_argument("--vectorized", action="store_true", help="use the vectorized (NumPy) engine")
+    parser.add_argument("--csv", default=None, help="also write the results to this CSV file")
+    args = parser.parse_args()
+    densities = [int(density) for density in args.density.split(",")]
+
+    pygame.init()
+    display = pygame.display.set_mode((1120, 720))
+    screen_manager = BenchScreenManager(display)
+    screen = GameplayScreen(screen_manager, display)
+    screen.autosave.close()  # Benchmarks never save the game
+    if args.vectorized:
+        screen.game_manager = GameManager(screen_manager.sound_manager, vectorized=True)
+
+    rows = []
+    print(f"{'Benchmark':<32}  {'Density':>7}  {'Calls':>7}  {'Best (us)':>12}  {'Median (us)':>12}")
+    for name, (benchmark, uses_density) in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        for density in densities if uses_density else [None]:
+            row = {"benchmark": name, "density": density,
+                   **run_benchmark(benchmark, screen, density, args.repeat)}
+            rows.append(row)
+            print(f"{name:<32}  {density if density is not None else '-':>7}  {row['calls']:>7}  "
+                  f"{row['best_us']:>12,.1f}  {row['median_us']:>12,.1f}")
+
+    if args.csv and rows:
+        with open(args.csv, "w", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,3 +8,24 @@ GRID_WIDTH: int = 9
 GRID_HEIGHT: int = 5
 GRID_SIZE: int = 125
 GRID_OFFSET: int = 100
+VISIBLE_DISTANCE: int = 1090  # Furthest x-coordinate plants shoot at (just before the right edge of the screen)
+
+FPS: int = 60  # Display frames per second
+TICK_RATE: int = 16  # Simulation ticks per second
+MAX_STEPS_PER_FRAME: int = 8  # Maximum ticks simulated in a single frame (per unit of game speed)
+
+MAX_GAME_SPEED: int = 0  # Simulate as many ticks as fit in MAX_SPEED_BUDGET_MS every frame
+GAME_SPEEDS: tuple[int, ...] = (1, 2, 4, 8, 16, MAX_GAME_SPEED)  # The speeds the fast-forward button cycles through
+MAX_SPEED_BUDGET_MS: float = 12.0  # Real time spent simulating each frame at MAX_GAME_SPEED, leaving time to draw
+PROFILE_WINDOW: int = 120  # Frames the profiler overlay (F3) averages its timings over
+TRACE_CAPACITY: int = 250_000  # Spans kept by the tracer, about the last 10 minutes of play
+PROFILE_SAMPLE_RATE: float = 200.0  # Call stacks sampled per second by the sampling profiler (F6)
+PROFILE_PATH: str = "profile.folded"  # Where the sampling profiler saves its samples, unless --profile is given
+MEMORY_TOP_SITES: int = 10  # Allocation sites logged per wave by the memory diagnostics (--memory)
+
+REPLAY_DIR: str = "replays"  # Where the replay of each game is saved
+SAVE_DIR: str = "saves"  # Where each player's game is autosaved
+AUTOSAVE_INTERVAL_S: float = 30.0  # Real time between autosaves
+
+SPAWN_INTERVAL_S: float = 0.5  # Shortest time between two zombies entering the same lane
+WAVE_SPAWN_TIME_S: float = 10.0  # Longest time a wave takes to enter the board (large waves enter lanes faster)
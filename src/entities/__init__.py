@@ -14,6 +14,7 @@ from .polymorph_zombie import PolymorphZombie
 from .apple_projectile import AppleProjectile
 from .big_plant import BigPlant
 from .rose_plant import RosePlant
+from .registry import EntityRegistry
 
 __all__ = [
     'Entity',
@@ -26,7 +27,14 @@ __all__ = [
     'PolymorphZombie',
     'AppleProjectile',
     'BigPlant',
-    'RosePlant'
+    'RosePlant',
+    'EntityRegistry',
+    'registry'
 ]
 
+# Every entity class, filed under the base class the GameManager stores it with
+registry = EntityRegistry(base_classes=[Zombie, Plant, Projectile, Shovel],
+                          entity_classes=[Entity, Shovel, Zombie, Projectile, Plant, SpeedyZombie, HulkingZombie,
+                                          PolymorphZombie, AppleProjectile, BigPlant, RosePlant])
+
 print("Loaded Module: Entities")
@@ -5,21 +5,32 @@ This module contains the Entity class
 for managing every Entity in the Gameplay board
 """
 # Standard Imports
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 # Local Imports
-from src.managers import SoundManager
+from src.constants import GRID_SIZE
 
 # The following packages are imported only for type hinting.
 # They are not used in this package, preventing circular dependency errors.
 if TYPE_CHECKING:
-    from src.managers import GameManager
+    from src.managers import GameManager, SoundManager
 
 
 class Entity:
     """
     An Entity is anything on the game board
+
+    The stats shared by every entity of a class are class attributes,
+    instances only hold their own (mutable) state in __slots__.
     """
+    __slots__ = ('game_manager', 'x', 'y', 'handle', 'index', 'alive', 'batch', 'batch_slot',
+                 'animation_offset')
+
+    name: str = ""  # The display name of this class of entity
+    images: tuple[str, ...] = ()  # The image files of this class of entity, one per animation frame
+    description: str = ""  # The almanac description of this class of entity
+    image_size: tuple[int, int] = (GRID_SIZE, GRID_SIZE)  # The size this class of entity is drawn at
+
     def __init__(self, game_manager: 'GameManager', x: int, y: int) -> None:
         """
         Initializes any Entity object.
@@ -30,11 +41,54 @@ class Entity:
             y (int): The initial y-coordinate of the entity.
         """
         self.game_manager = game_manager
+        self.reset(x, y)
+
+    @classmethod
+    def get_defaults(cls) -> dict[str, Any]:
+        """
+        Get the state of a new entity of the class, as set by reset,
+        so entities can be created without calling __init__ (i.e. when loading a saved game).
+
+        Returns:
+            dict[str, Any]: The value of each slot set by reset, by attribute name (private slots are name-mangled).
+        """
+        entity = cls.__new__(cls)
+        entity.reset(0, 0)
+        defaults = {}
+        for owner in cls.__mro__:
+            for slot in vars(owner).get("__slots__", ()):
+                if slot.startswith("__"):
+                    slot = f"_{owner.__name__.lstrip('_')}{slot}"
+                if hasattr(entity, slot):
+                    defaults[slot] = getattr(entity, slot)
+        return defaults
+
+    @property
+    def entity_class(self) -> type['Entity']:
+        """
+        The class of the entity. While an entity is batched, its type is a view of its class (see BatchManager).
+        """
+        return type(self)
+
+    @property
+    def sound_manager(self) -> 'SoundManager':
+        """
+        The sound manager of the GameManager managing this entity.
+        """
+        return self.game_manager.sound_manager
+
+    def reset(self, x: int, y: int) -> None:
+        """
+        Reset the state of the entity, so that it can be reused as a new entity.
+
+        Args:
+            x (int): The new x-coordinate of the entity.
+            y (int): The new y-coordinate of the entity.
+        """
+        self.batch = None  # The BatchManager arrays holding this entity's state, if it is batched
+        self.batch_slot: int = -1  # The index of this entity in the batch arrays
+        self.handle: int = -1  # The GameManager handle of this entity
+        self.index: int = -1  # The index of this entity in the GameManager's list of its class
+        self.alive: bool = False  # Whether this entity is on the board (and not waiting to be removed)
         self.x = x
         self.y = y
-        if game_manager:
-            self.sound_manager = game_manager.sound_manager
-
-        self.attributes = {
-            "images": []
-        }
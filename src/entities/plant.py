@@ -7,9 +7,6 @@ a type of Entity on the Gameplay board
 # Standard Imports
 from typing import TYPE_CHECKING
 
-# Library Imports
-import pygame
-
 # Local Imports
 from src.entities import Entity, Projectile
 
@@ -24,6 +21,16 @@ class Plant(Entity):
     A Plant is a stationary entity that is placed
     on the game board to defend against zombies.
     """
+    __slots__ = ('health', '__next_attack')
+
+    name: str = "Cowboy"
+    images: tuple[str, ...] = ("plant.png",)
+    description: str = "A sharpshooting sentinel, it wrangles foes with quick reflexes."
+    max_health: int = 150  # The health of a new plant of this class
+    projectile_type: type[Projectile] = Projectile  # The type of projectile to shoot
+    cost: int = 15  # The cost of this plant
+    attack_speed: float = 1.0
+
     def __init__(self, game_manager: 'GameManager', x: int, y: int) -> None:
         """
         Initializes a Plant object.
@@ -34,20 +41,20 @@ class Plant(Entity):
             y (int): The initial y-coordinate of the plant.
         """
         super().__init__(game_manager, x, y)
-        self.health: int = 150  # Health of this plant
-        self.projectile_type: type[Projectile] = Projectile  # The type of projectile to shoot
-        self.cost: int = 15  # The cost of this plant
-
-        self.attack_speed: float = 1.0
-        self.__last_attack: int = 0
         if game_manager:
             self.sound_manager.play_sound('plant.ogg')
 
-        self.attributes = {
-            "name": "Cowboy",
-            "images": ["plant.png"],
-            "description": "A sharpshooting sentinel, it wrangles foes with quick reflexes."
-        }
+    def reset(self, x: int, y: int) -> None:
+        """
+        Reset the state of the plant, as a new plant.
+
+        Args:
+            x (int): The new x-coordinate of the plant.
+            y (int): The new y-coordinate of the plant.
+        """
+        super().reset(x, y)
+        self.health: int = self.max_health  # Health of this plant
+        self.__next_attack: int = 0  # The tick at which the next attack is allowed
 
     def __can_attack(self) -> bool:
         """
@@ -56,16 +63,33 @@ class Plant(Entity):
         Returns:
             bool: True if the plant can attack, False otherwise.
         """
-        current_time: int = pygame.time.get_ticks()
-        return current_time - self.__last_attack >= 1000 / (self.attack_speed * self.game_manager.game_speed)
+        return self.game_manager.clock.ticks >= self.__next_attack
+
+    def get_next_attack(self) -> int:
+        """
+        Get the tick at which the plant is next able to attack.
+
+        Returns:
+            int: The tick of the next attack.
+        """
+        return self.__next_attack
+
+    def set_next_attack(self, tick: int) -> None:
+        """
+        Set the tick at which the plant is next able to attack (i.e. when loading a saved game).
+
+        Args:
+            tick (int): The tick of the next attack.
+        """
+        self.__next_attack = tick
 
     def shoot_projectile(self) -> None:
         """
         Shoot a projectile to attack a zombie.
         """
         if self.__can_attack():
-            self.__last_attack = pygame.time.get_ticks()
+            clock = self.game_manager.clock
+            self.__next_attack = clock.ticks + clock.to_ticks(1 / self.attack_speed)
             self.sound_manager.play_sound('shoot.ogg')
 
-            new_projectile = self.projectile_type(self.game_manager, self.x + 75, self.y)
-            self.game_manager.add(new_projectile)
+            self.game_manager.spawn(self.projectile_type, self.x + 75, self.y)
@@ -4,41 +4,37 @@ Leafy Legions: Projectile (Entity)
 This module contains the Projectile class,
 a type of Entity on the Gameplay board
 """
-# Standard Imports
-from typing import TYPE_CHECKING
-
 # Local Imports
+from src.constants import GRID_SIZE
 from src.entities import Entity, Zombie
 
-# The following packages are imported only for type hinting.
-# They are not used in this package, preventing circular dependency errors.
-if TYPE_CHECKING:
-    from src.managers import GameManager
-
 
 class Projectile(Entity):
     """
     A Projectile is a moving entity that is shot
     from plants on the game board to hurt zombies.
     """
+    __slots__ = ()
+
+    images: tuple[str, ...] = ("projectile.png",)
+    image_size: tuple[int, int] = (25, 25)
+    speed: float = 5.0
+    damage: int = 25
 
-    def __init__(self, game_manager: 'GameManager', x: int, y: int) -> None:
+    def get_reach(self, zombie: Zombie) -> float:
         """
-        Initializes a Projectile object.
+        Get how far past a zombie's left edge this projectile can be and still hit it.
+        This is the zombie's width, or the distance both closed in a single tick if that is longer,
+        so fast projectiles and zombies can never pass through each other between two ticks.
 
         Args:
-            game_manager (GameManager): An instance of the GameManager managing the projectile.
-            x (int): The initial x-coordinate of the projectile.
-            y (int): The initial y-coordinate of the projectile.
-        """
-        super().__init__(game_manager, x, y)
-        self.image_size: tuple[int, int] = (25, 25)
-        self.speed: float = 5.0
-        self.damage = 25
+            zombie (Zombie): The zombie being hit.
 
-        self.attributes = {
-            "images": ["projectile.png"]
-        }
+        Returns:
+            float: The reach of the projectile, in pixels.
+        """
+        zombie_speed = 0 if zombie.collided_with_plant else zombie.speed
+        return max(GRID_SIZE, self.speed + zombie_speed)
 
     def attack_zombie(self, zombie: Zombie):
         """
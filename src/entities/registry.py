@@ -0,0 +1,119 @@
+"""
+Leafy Legions: EntityRegistry
+
+This module contains the EntityRegistry class,
+an index of every Entity class, built once when the entities are imported
+"""
+# Standard Imports
+from typing import TYPE_CHECKING, Any
+
+# The following packages are imported only for type hinting.
+# They are not used in this package, preventing circular dependency errors.
+if TYPE_CHECKING:
+    from src.entities import Entity
+
+# The class-level stats copied into the registry, when a class has them
+STAT_NAMES: tuple[str, ...] = ("cost", "max_health", "speed", "damage", "attack_speed", "projectile_type")
+
+
+class EntityRegistry:
+    """
+    The EntityRegistry maps each Entity class to its base class (category),
+    stats, images and display metadata, so they can be looked up without
+    introspecting or instantiating the classes.
+    """
+    def __init__(self, base_classes: list[type['Entity']], entity_classes: list[type['Entity']] = ()) -> None:
+        """
+        Initialize an EntityRegistry object.
+
+        Args:
+            base_classes (list[type[Entity]]): The categories of entities, i.e. Zombie and Plant.
+                Subclasses are filed under the first base class they inherit from.
+            entity_classes (list[type[Entity]]): The classes to register. Default: () (none)
+        """
+        self.base_classes = base_classes
+        self.__base_of: dict[type['Entity'], type['Entity'] | None] = {}  # Base class of each class
+        self.__info: dict[type['Entity'], dict[str, Any]] = {}  # Metadata of each class
+        self.__by_name: dict[str, type['Entity']] = {}  # Class of each class name
+        self.__by_base: dict[type['Entity'], list[type['Entity']]] = {base: [] for base in base_classes}
+        for entity_class in entity_classes:
+            self.register(entity_class)
+
+    def register(self, entity_class: type['Entity']) -> None:
+        """
+        Add an entity class to the registry.
+
+        Args:
+            entity_class (type[Entity]): The class to add.
+        """
+        base_class = next((base for base in self.base_classes if issubclass(entity_class, base)), None)
+        self.__base_of[entity_class] = base_class
+        self.__by_name[entity_class.__name__] = entity_class
+        if base_class is not None:
+            self.__by_base[base_class].append(entity_class)
+
+        self.__info[entity_class] = {
+            "name": entity_class.name,
+            "images": entity_class.images,
+            "description": entity_class.description,
+            "image_size": entity_class.image_size,
+            "base_class": base_class,
+            "stats": {stat: getattr(entity_class, stat) for stat in STAT_NAMES if hasattr(entity_class, stat)}
+        }
+
+    def get_base(self, entity_class: type['Entity']) -> type['Entity'] | None:
+        """
+        Get the base class (category) of an entity class.
+        Classes that were not registered at import (i.e. defined later) are registered on first use.
+
+        Args:
+            entity_class (type[Entity]): The class to look up.
+
+        Returns:
+            type[Entity] | None: The base class, or None if the class has none of the base classes.
+        """
+        try:
+            return self.__base_of[entity_class]
+        except KeyError:
+            self.register(entity_class)
+            return self.__base_of[entity_class]
+
+    def get_info(self, entity_class: type['Entity']) -> dict[str, Any]:
+        """
+        Get the metadata of an entity class.
+
+        Args:
+            entity_class (type[Entity]): The class to look up.
+
+        Returns:
+            dict[str, Any]: The name, images, description, image size, base class and stats of the class.
+        """
+        if entity_class not in self.__info:
+            self.register(entity_class)
+        return self.__info[entity_class]
+
+    def get_class(self, name: str) -> type['Entity'] | None:
+        """
+        Get a registered entity class by its class name.
+
+        Args:
+            name (str): The name of the class, i.e. "Zombie".
+
+        Returns:
+            type[Entity] | None: The class, or None if no class has that name.
+        """
+        return self.__by_name.get(name)
+
+    def get_classes(self, base_class: type['Entity'] | None = None) -> list[type['Entity']]:
+        """
+        Get the registered entity classes, in the order they were registered.
+
+        Args:
+            base_class (type[Entity] | None): Only get the classes of this base class. Default: None (all classes)
+
+        Returns:
+            list[type[Entity]]: The registered classes.
+        """
+        if base_class is None:
+            return list(self.__info)
+        return list(self.__by_base[base_class])
@@ -7,16 +7,13 @@ a type of Entity on the Gameplay board
 # System Imports
 from typing import TYPE_CHECKING
 
-# Library Imports
-import pygame
-
 # Local Imports
 from src.entities import Entity
 
 # The following packages are imported only for type hinting.
 # They are not used in this package, preventing circular dependency errors.
 if TYPE_CHECKING:
-    from src.managers import GameManager
+    from src.entities import Plant
 
 
 class Zombie(Entity):
@@ -24,29 +21,29 @@ class Zombie(Entity):
     A Zombie is a hostile entity that moves across the
     board and attacks plants on the game board.
     """
-    def __init__(self, game_manager: 'GameManager', x: int, y: int) -> None:
+    __slots__ = ('health', 'collided_with_plant', '__next_attack')
+
+    name: str = "Stumbler"
+    images: tuple[str, ...] = ("zombie_1.png", "zombie_2.png")
+    description: str = "Slow but relentless, it overwhelms defenses with sheer numbers."
+    image_size: tuple[int, int] = (56, 112)
+    max_health: int = 200  # The health of a new zombie of this class
+    speed: float = 2.0
+    attack_speed: float = 1.0
+    damage: int = 25
+
+    def reset(self, x: int, y: int) -> None:
         """
-        Initializes a Zombie object.
+        Reset the state of the zombie, so that it can be reused as a new zombie.
 
         Args:
-            game_manager (GameManager): An instance of the GameManager managing the zombie.
-            x (int): The initial x-coordinate of the zombie.
-            y (int): The initial y-coordinate of the zombie.
+            x (int): The new x-coordinate of the zombie.
+            y (int): The new y-coordinate of the zombie.
         """
-        super().__init__(game_manager, x, y)
-        self.image_size: tuple[int, int] = (56, 112)
-        self.health: int = 200
-        self.speed: float = 2.0
-        self.attack_speed: float = 1.0
-        self.damage: int = 25
+        super().reset(x, y)
+        self.health: int = self.max_health
         self.collided_with_plant: bool = False  # Flag to indicate collision with a plant
-
-        self.__last_attack: int = 0
-        self.attributes = {
-            "name": "Stumbler",
-            "images": ["zombie_1.png", "zombie_2.png"],
-            "description": "Slow but relentless, it overwhelms defenses with sheer numbers."
-        }
+        self.__next_attack: int = 0  # The tick at which the next attack is allowed
 
     def __can_attack(self) -> bool:
         """
@@ -55,8 +52,25 @@ class Zombie(Entity):
         Returns:
             bool: True if the zombie can attack, False otherwise.
         """
-        current_time: int = pygame.time.get_ticks()
-        return current_time - self.__last_attack >= 1000 / (self.attack_speed * self.game_manager.game_speed)
+        return self.game_manager.clock.ticks >= self.__next_attack
+
+    def get_next_attack(self) -> int:
+        """
+        Get the tick at which the zombie is next able to attack.
+
+        Returns:
+            int: The tick of the next attack.
+        """
+        return self.__next_attack
+
+    def set_next_attack(self, tick: int) -> None:
+        """
+        Set the tick at which the zombie is next able to attack (i.e. when loading a saved game).
+
+        Args:
+            tick (int): The tick of the next attack.
+        """
+        self.__next_attack = tick
 
     def attack_plant(self, plant: 'Plant') -> None:
         """
@@ -67,7 +81,8 @@ class Zombie(Entity):
         """
         self.collided_with_plant = True
         if self.__can_attack():
-            self.__last_attack = pygame.time.get_ticks()
+            clock = self.game_manager.clock
+            self.__next_attack = clock.ticks + clock.to_ticks(1 / self.attack_speed)
 
             plant.health -= self.damage
             print(f"Zombie attacking Plant ({plant.x}, {plant.y}). Health: {plant.health}")
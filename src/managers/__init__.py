@@ -4,18 +4,49 @@ Leafy Legions Managers Module
 This module is for importing game management utilities (i.e. GameManager)
 """
 from .color_manager import ColorManager
+from .metrics_manager import MetricsManager, metrics
+from .trace_manager import TraceManager, tracer
+from .memory_manager import MemoryManager, memory
 from .database_manager import DatabaseManager
 from .sound_manager import SoundManager
+from .clock_manager import ClockManager
+from .lane_manager import LaneManager
+from .batch_manager import BatchManager
+from .schedule_manager import ScheduleManager
+from .random_manager import RandomManager
+from .replay_manager import ReplayManager
 from .game_manager import GameManager
 from .wave_manager import WaveManager
+from .save_manager import SaveManager
+from .autosave_manager import AutosaveManager
+from .profile_manager import ProfileManager
+from .histogram_manager import HistogramManager
+from .sampler_manager import SamplerManager
 from .screen_manager import ScreenManager
 
 __all__ = [
     'ColorManager',
+    'MetricsManager',
+    'metrics',
+    'TraceManager',
+    'tracer',
+    'MemoryManager',
+    'memory',
     'DatabaseManager',
     'SoundManager',
+    'ClockManager',
+    'LaneManager',
+    'BatchManager',
+    'ScheduleManager',
+    'RandomManager',
+    'ReplayManager',
     'GameManager',
     'WaveManager',
+    'SaveManager',
+    'AutosaveManager',
+    'ProfileManager',
+    'HistogramManager',
+    'SamplerManager',
     'ScreenManager'
 ]
 
@@ -0,0 +1,100 @@
+"""
+Leafy Legions: AutosaveManager
+
+This module contains the AutosaveManager class
+for periodically saving the running game without stalling the render loop
+"""
+# Standard Imports
+import os
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+# Local Imports
+from src.constants import AUTOSAVE_INTERVAL_S
+
+# The following packages are imported only for type hinting.
+# They are not used in this package, preventing circular dependency errors.
+if TYPE_CHECKING:
+    from src.managers import SaveManager
+
+
+class AutosaveManager:
+    """
+    The AutosaveManager saves the game every few seconds.
+
+    Only the snapshot (SaveManager.to_bytes, which copies the game into immutable bytes) is taken
+    on the render loop, between ticks. Compressing and writing the snapshot happens on a background thread,
+    so the game keeps running while the disk is busy. If the previous snapshot is still waiting to be
+    written, it is replaced by the newer one.
+    """
+    def __init__(self, save_manager: 'SaveManager', path: str, interval: float = AUTOSAVE_INTERVAL_S) -> None:
+        """
+        Initialize an AutosaveManager object, and start its background thread.
+
+        Args:
+            save_manager (SaveManager): The save manager of the game.
+            path (str): The path of the autosave file.
+            interval (float): The real time between autosaves, in seconds. Default: AUTOSAVE_INTERVAL_S
+        """
+        self.save_manager = save_manager
+        self.path = path
+        self.interval = interval
+        self.__last_save: float = time.monotonic()
+        self.__snapshots: queue.Queue[bytes | None] = queue.Queue(maxsize=1)  # The snapshot waiting to be written
+        self.__closed: bool = False
+        self.__thread = threading.Thread(target=self.__write_snapshots, name="Autosave", daemon=True)
+        self.__thread.start()
+
+    def update(self) -> None:
+        """
+        Save the game if the interval has passed since the last save.
+        This should be called between ticks.
+        """
+        if time.monotonic() - self.__last_save >= self.interval:
+            self.save()
+
+    def save(self) -> None:
+        """
+        Snapshot the game, and hand the snapshot to the background thread to be written.
+        """
+        if self.__closed:
+            return
+        self.__last_save = time.monotonic()
+        snapshot = self.save_manager.to_bytes()
+        try:
+            self.__snapshots.get_nowait()  # Replace a snapshot that has not been written yet
+        except queue.Empty:
+            pass
+        self.__snapshots.put(snapshot)
+
+    def close(self) -> None:
+        """
+        Stop autosaving, waiting for the last snapshot to be written.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__snapshots.put(None)
+        self.__thread.join()
+
+    def delete(self) -> None:
+        """
+        Stop autosaving and delete the autosave (i.e. once the game is lost).
+        """
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __write_snapshots(self) -> None:
+        """
+        Write each snapshot to the autosave file, until the manager is closed (runs on the background thread).
+        """
+        while (snapshot := self.__snapshots.get()) is not None:
+            try:
+                self.save_manager.write(self.path, snapshot)
+            except OSError as e:
+                print(f"Could not autosave: {e}")
@@ -0,0 +1,368 @@
+"""
+Leafy Legions: BatchManager
+
+This module contains the BatchManager class
+for simulating zombies and projectiles in bulk, using NumPy arrays
+"""
+# Standard Imports
+import functools
+from typing import TYPE_CHECKING, Any
+
+# Library Imports
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it is only required by the vectorized engine
+    np = None
+
+# Local Imports
+from src.constants import GRID_SIZE
+from src.entities import Zombie, Projectile
+from src.managers import metrics
+
+# The following packages are imported only for type hinting.
+# They are not used in this package, preventing circular dependency errors.
+if TYPE_CHECKING:
+    from src.entities import Plant
+    from src.managers import GameManager
+
+    Entity = Zombie | Projectile
+
+# Separates the lanes when (y, x) pairs are flattened into a single sort key
+LANE_STRIDE: int = 100_000
+
+
+class BatchField:
+    """
+    An attribute of a batched entity, read from and written to the BatchManager arrays holding the entity.
+    """
+    def __init__(self, name: str) -> None:
+        """
+        Initialize a BatchField object.
+
+        Args:
+            name (str): The name of the attribute, and of its array.
+        """
+        self.name = name
+
+    def __get__(self, entity: 'Entity', owner: type = None) -> Any:
+        """
+        Read the attribute from the batch arrays.
+        """
+        if entity is None:
+            return self
+        return getattr(entity.batch, self.name)[entity.batch_slot].item()
+
+    def __set__(self, entity: 'Entity', value: Any) -> None:
+        """
+        Write the attribute to the batch arrays.
+        """
+        getattr(entity.batch, self.name)[entity.batch_slot] = value
+
+
+@functools.cache
+def get_batched_class(entity_class: type['Entity'], state: tuple[str, ...]) -> type['Entity']:
+    """
+    Get the batched view of an entity class: a subclass adding no slots, whose state is read from and written to
+    the batch arrays. Entities are switched to it while they are batched,
+    so entities that are not batched keep reading and writing their own slots.
+
+    Args:
+        entity_class (type[Entity]): The class of entity.
+        state (tuple[str, ...]): The attributes kept in the arrays.
+
+    Returns:
+        type[Entity]: The batched view of the class.
+    """
+    namespace = {"__slots__": (), "__module__": entity_class.__module__, "entity_class": entity_class}
+    namespace.update((name, BatchField(name)) for name in state)
+    return type(entity_class.__name__, (entity_class,), namespace)
+
+
+class EntityArrays:
+    """
+    Contiguous (struct-of-arrays) storage for one class of entities.
+    Batched entities read and write their state through these arrays (see get_batched_class).
+    """
+    def __init__(self, fields: dict[str, type], state: tuple[str, ...], capacity: int = 64) -> None:
+        """
+        Initialize an EntityArrays object.
+
+        Args:
+            fields (dict[str, type]): The name and dtype of each stored attribute.
+            state (tuple[str, ...]): The attributes that change while batched, read and written through the arrays.
+                The other attributes are copies of the class's stats.
+            capacity (int): The initial number of slots. Default: 64
+        """
+        self.fields = fields
+        self.state = state
+        self.size: int = 0
+        self.entities: list['Entity'] = []  # Entity in each slot
+        for name, dtype in fields.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def attach(self, entity: 'Entity') -> None:
+        """
+        Move an entity's state into the arrays.
+
+        Args:
+            entity (Entity): The entity to be batched.
+        """
+        values = {name: getattr(entity, name) for name in self.fields}
+
+        capacity = len(getattr(self, next(iter(self.fields))))
+        if self.size == capacity:
+            for name in self.fields:
+                setattr(self, name, np.resize(getattr(self, name), capacity * 2))
+
+        slot = self.size
+        for name, value in values.items():
+            getattr(self, name)[slot] = value
+        self.entities.append(entity)
+        self.size += 1
+        entity.batch, entity.batch_slot = self, slot
+        entity.__class__ = get_batched_class(type(entity), self.state)
+
+    def extend(self, entities: list['Entity']) -> None:
+        """
+        Move the state of many entities into the arrays, one column at a time.
+
+        Args:
+            entities (list[Entity]): The entities to be batched.
+        """
+        columns = {name: [getattr(entity, name) for entity in entities] for name in self.fields}
+
+        capacity = len(getattr(self, next(iter(self.fields))))
+        end = self.size + len(entities)
+        if end > capacity:
+            while capacity < end:
+                capacity *= 2
+            for name in self.fields:
+                setattr(self, name, np.resize(getattr(self, name), capacity))
+
+        for name, column in columns.items():
+            getattr(self, name)[self.size:end] = column
+        for slot, entity in enumerate(entities, self.size):
+            entity.batch, entity.batch_slot = self, slot
+            entity.__class__ = get_batched_class(type(entity), self.state)
+        self.entities.extend(entities)
+        self.size = end
+
+    def detach(self, entity: 'Entity') -> None:
+        """
+        Move an entity's state out of the arrays, filling its slot with the last entity.
+
+        Args:
+            entity (Entity): The entity to be removed from the arrays.
+        """
+        slot = entity.batch_slot
+        entity.__class__ = entity.entity_class
+        entity.batch, entity.batch_slot = None, -1
+        for name in self.state:
+            setattr(entity, name, getattr(self, name)[slot].item())
+
+        last = self.size - 1
+        if slot != last:
+            for name in self.fields:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            moved.batch_slot = slot
+        self.entities.pop()
+        self.size -= 1
+
+    def clear(self) -> None:
+        """
+        Remove every entity from the arrays.
+        """
+        # The entities are off the board, so their state is not copied out of the arrays
+        for entity in self.entities:
+            entity.__class__ = entity.entity_class
+            entity.batch, entity.batch_slot = None, -1
+        self.entities.clear()
+        self.size = 0
+
+    def view(self, name: str) -> 'np.ndarray':
+        """
+        Get the occupied part of an attribute's array.
+
+        Args:
+            name (str): The name of the attribute.
+
+        Returns:
+            np.ndarray: A view of the attribute for every batched entity.
+        """
+        return getattr(self, name)[:self.size]
+
+
+class BatchManager:
+    """
+    The BatchManager is an optional, vectorized engine for the GameManager.
+    It keeps zombies and projectiles in NumPy arrays and advances all of them
+    with a handful of array operations per tick.
+    """
+    def __init__(self, game_manager: 'GameManager') -> None:
+        """
+        Initialize a BatchManager object.
+
+        Args:
+            game_manager (GameManager): The game manager instance.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for the vectorized engine")
+
+        self.game_manager = game_manager
+        self.arrays: dict[type['Entity'], EntityArrays] = {
+            Zombie: EntityArrays({
+                "x": np.float64, "y": np.float64, "speed": np.float64,
+                "health": np.int64, "damage": np.int64, "collided_with_plant": np.bool_
+            }, state=("x", "health", "collided_with_plant")),
+            Projectile: EntityArrays({
+                "x": np.float64, "y": np.float64, "speed": np.float64, "damage": np.int64
+            }, state=("x",)),
+        }
+
+    def attach(self, entity: 'Entity', base_class: type['Entity']) -> None:
+        """
+        Batch an entity of a base class handled by the BatchManager.
+
+        Args:
+            entity (Entity): The entity to be batched.
+            base_class (type[Entity]): The base class of the entity.
+        """
+        self.arrays[base_class].attach(entity)
+
+    def extend(self, entities: list['Entity'], base_class: type['Entity']) -> None:
+        """
+        Batch many entities of a base class handled by the BatchManager.
+
+        Args:
+            entities (list[Entity]): The entities to be batched.
+            base_class (type[Entity]): The base class of the entities.
+        """
+        self.arrays[base_class].extend(entities)
+
+    def detach(self, entity: 'Entity', base_class: type['Entity']) -> None:
+        """
+        Stop batching an entity.
+
+        Args:
+            entity (Entity): The entity to be removed.
+            base_class (type[Entity]): The base class of the entity.
+        """
+        if entity.batch is not None:
+            self.arrays[base_class].detach(entity)
+
+    def clear(self, base_class: type['Entity']) -> None:
+        """
+        Stop batching every entity of a base class.
+
+        Args:
+            base_class (type[Entity]): The base class of entities to clear.
+        """
+        self.arrays[base_class].clear()
+
+    def is_past(self, min_x: float) -> bool:
+        """
+        Check if any zombie is at or past an x-coordinate.
+
+        Args:
+            min_x (float): The x-coordinate to check against.
+
+        Returns:
+            bool: True if a zombie has x <= min_x, False otherwise.
+        """
+        return bool(np.any(self.arrays[Zombie].view("x") <= min_x))
+
+    def step(self, plants: list['Plant'], visible_distance: float) -> None:
+        """
+        Simulate a single tick of the entities on the board.
+
+        Args:
+            plants (list[Plant]): The plants on the board.
+            visible_distance (float): The furthest x-coordinate plants can shoot at.
+        """
+        zombies, projectiles = self.arrays[Zombie], self.arrays[Projectile]
+
+        # Plants and zombies, the few plants are handled one by one against every zombie in their lane
+        if zombies.size:
+            zombie_x, zombie_y = zombies.view("x"), zombies.view("y")
+            lane_masks = {}
+            for plant in plants:
+                in_lane = lane_masks.get(plant.y)
+                if in_lane is None:
+                    in_lane = lane_masks[plant.y] = zombie_y == plant.y
+
+                # Zombies inside the plant's cell attack it
+                in_cell = in_lane & (zombie_x <= plant.x) & (plant.x <= zombie_x + GRID_SIZE)
+                for index in np.flatnonzero(in_cell):
+                    zombies.entities[index].attack_plant(plant)
+                if not plant.alive:
+                    continue
+
+                # Plants shoot at any zombie visible in front of them
+                if np.any(in_lane & (zombie_x >= plant.x) & (zombie_x <= visible_distance)):
+                    plant.shoot_projectile()
+
+            # Move every zombie that is not blocked by a plant or out of bounds
+            blocked = zombies.view("collided_with_plant")
+            moving = ~blocked & (zombie_x > -GRID_SIZE)
+            zombie_x[moving] -= zombies.view("speed")[moving]
+            blocked[:] = False
+
+        if zombies.size and projectiles.size:
+            self.__collide(zombies, projectiles)
+
+        # Move every projectile, removing the ones that left the board
+        if projectiles.size:
+            projectile_x = projectiles.view("x")
+            in_bounds = projectile_x < 1125
+            projectile_x[in_bounds] += projectiles.view("speed")[in_bounds]
+            for index in np.flatnonzero(~in_bounds):
+                self.game_manager.remove(projectiles.entities[index])
+
+    def __collide(self, zombies: EntityArrays, projectiles: EntityArrays) -> None:
+        """
+        Find every projectile inside a zombie (zombie.x <= projectile.x <= zombie.x + GRID_SIZE),
+        or that passed through one since the last tick, and apply its damage.
+
+        Args:
+            zombies (EntityArrays): The batched zombies.
+            projectiles (EntityArrays): The batched projectiles.
+        """
+        zombie_x, zombie_y = zombies.view("x"), zombies.view("y")
+        projectile_x, projectile_y = projectiles.view("x"), projectiles.view("y")
+
+        # Sort zombies by lane then x, and find the closest zombie behind each projectile
+        order = np.argsort(zombie_y * LANE_STRIDE + zombie_x, kind="stable")
+        sorted_keys = (zombie_y * LANE_STRIDE + zombie_x)[order]
+        candidates = np.searchsorted(sorted_keys, projectile_y * LANE_STRIDE + projectile_x, side="right") - 1
+        targets = order[np.maximum(candidates, 0)]
+        # The projectile hits if it is inside the zombie, or passed through it since the last tick
+        # (the zombie's speed is an upper bound of the distance it moved, it might have been blocked)
+        reach = np.maximum(GRID_SIZE, projectiles.view("speed") + zombies.view("speed")[targets])
+        hits = (candidates >= 0) & (zombie_y[targets] == projectile_y) & (projectile_x <= zombie_x[targets] + reach)
+        metrics.count("collision_tests", len(projectile_x))  # Each projectile is tested against one zombie
+        if not hits.any():
+            return
+
+        hit_projectiles = np.flatnonzero(hits)
+        targets = targets[hits]
+        health = zombies.view("health")
+        np.subtract.at(health, targets, projectiles.view("damage")[hit_projectiles])
+        dead = np.unique(targets[health[targets] <= 0])
+
+        # Removals are deferred until the GameManager commits, so the slots are still valid here
+        dead_zombies = [zombies.entities[index] for index in dead]
+        spent_projectiles = [projectiles.entities[index] for index in hit_projectiles]
+        for zombie in dead_zombies:
+            self.game_manager.remove(zombie)
+        for projectile in spent_projectiles:
+            self.game_manager.remove(projectile)
+
+        if dead_zombies:
+            self.game_manager.add_coins(10 * len(dead_zombies))
+        self.game_manager.sound_manager.play_sound('hit.ogg')
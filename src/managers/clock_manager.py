@@ -0,0 +1,87 @@
+"""
+Leafy Legions: ClockManager
+
+This module contains the ClockManager class
+for managing the fixed-timestep simulation clock
+"""
+# Local Imports
+from src.constants import TICK_RATE, MAX_STEPS_PER_FRAME
+
+
+class ClockManager:
+    """
+    The ClockManager advances the game simulation in fixed-size ticks,
+    independently of how fast frames are being rendered.
+    """
+    def __init__(self, tick_rate: int = TICK_RATE, max_steps: int = MAX_STEPS_PER_FRAME) -> None:
+        """
+        Initialize a ClockManager object.
+
+        Args:
+            tick_rate (int): The number of simulation ticks per second.
+            max_steps (int): The maximum number of ticks simulated per frame (per unit of game speed).
+        """
+        self.tick_rate = tick_rate
+        self.tick_ms: float = 1000 / tick_rate
+        self.max_steps = max_steps
+        self.ticks: int = 0
+        self.__accumulator: float = 0.0
+
+    def advance(self, elapsed_ms: float, speed: int = 1) -> int:
+        """
+        Accumulate real time and calculate how many ticks should be simulated this frame.
+
+        If the simulation falls too far behind (i.e. a very slow frame), the backlog is dropped
+        instead of being caught up, so that slow frames cannot snowball into slower frames.
+
+        Args:
+            elapsed_ms (float): The real time elapsed since the previous frame, in milliseconds.
+            speed (int): The game speed multiplier. Default: 1
+
+        Returns:
+            int: The number of ticks to simulate.
+        """
+        self.__accumulator += elapsed_ms * speed
+        steps = int(self.__accumulator // self.tick_ms)
+
+        max_steps = self.max_steps * speed
+        if steps > max_steps:
+            self.__accumulator = 0.0
+            return max_steps
+
+        self.__accumulator -= steps * self.tick_ms
+        return steps
+
+    def step(self) -> None:
+        """
+        Advance the simulation clock by one tick.
+        """
+        self.ticks += 1
+
+    def get_time(self) -> float:
+        """
+        Get the simulated time elapsed.
+
+        Returns:
+            float: The simulated time, in milliseconds.
+        """
+        return self.ticks * self.tick_ms
+
+    def to_ticks(self, seconds: float) -> int:
+        """
+        Convert a duration in simulated seconds to a whole number of ticks.
+
+        Args:
+            seconds (float): The duration, in seconds.
+
+        Returns:
+            int: The duration in ticks (at least 1).
+        """
+        return max(1, round(seconds * self.tick_rate))
+
+    def reset(self) -> None:
+        """
+        Reset the simulation clock back to tick 0.
+        """
+        self.ticks = 0
+        self.__accumulator = 0.0
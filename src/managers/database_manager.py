@@ -14,6 +14,9 @@ import firebase_admin
 from firebase_admin import db, credentials
 from google.auth.exceptions import TransportError
 
+# Local Imports
+from src.managers import tracer
+
 
 class DatabaseManager:
     """
@@ -38,6 +41,7 @@ class DatabaseManager:
         # Caching to prevent spamming API calls
         self.high_scores_cache = []
 
+    @tracer.traced
     def get_high_scores(self) -> list[dict[str, str | int]]:
         """
         Fetch all high scores from the database in descending order.
@@ -73,6 +77,7 @@ class DatabaseManager:
 
         return self.high_scores_cache
 
+    @tracer.traced
     def create_user(self, username: str, password: str) -> bool:
         """
         Create a new user with a username, password (hashed), and default high score of 0.
@@ -101,6 +106,7 @@ class DatabaseManager:
 
         return True
 
+    @tracer.traced
     def verify_login(self, username: str, password: str) -> bool:
         """
         Verify a login by comparing the provided password with the hashed password in the database.
@@ -130,6 +136,7 @@ class DatabaseManager:
         # Use bcrypt to compare hashes (true means working):
         return bcrypt.checkpw(password.encode('utf-8'), str(stored_hash).encode('utf-8'))
 
+    @tracer.traced
     def update_high_score(self, username: str, new_high_score: int) -> None:
         """
         Update the high score based on the username
@@ -6,10 +6,16 @@ for managing everything happening after the
 user presses on the "Start" button
 """
 # Standard Imports
+from bisect import bisect_left, bisect_right
+import math
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 # Local Imports
-from src.entities import Plant, Zombie, Projectile
+from src.constants import GRID_SIZE, VISIBLE_DISTANCE
+from src.entities import Plant, Zombie, Projectile, registry
+from src.managers import ClockManager, LaneManager, BatchManager, ScheduleManager, RandomManager, ReplayManager, metrics
+from src.managers.replay_manager import ReplayCommand
 
 # The following packages are imported only for type hinting.
 # They are not used in this package, preventing circular dependency errors.
@@ -18,24 +24,66 @@ if TYPE_CHECKING:
 
 Entity = Zombie | Plant | Projectile
 
+# Entity handles store the slot in their lowest bits and the slot's generation above them
+HANDLE_SLOT_BITS: int = 24
+HANDLE_SLOT_MASK: int = (1 << HANDLE_SLOT_BITS) - 1
+
+# Maximum number of removed entities kept for reuse, per class
+POOL_SIZE: int = 1024
+
+_get_x = attrgetter('x')
+
 
 class GameManager:
     """
     The GameManager class is responsible for managing entities on the game board,
     along with the application and game running statuses.
     """
-    def __init__(self, sound_manager: 'SoundManager') -> None:
+    def __init__(self, sound_manager: 'SoundManager', vectorized: bool = False, seed: int | None = None) -> None:
         """
         Initialize a GameManager object.
+
+        Args:
+            sound_manager (SoundManager): The sound manager of the application.
+            vectorized (bool): Whether to simulate zombies and projectiles with NumPy arrays. Default: False
+            seed (int | None): The seed of the game's random number streams. Default: None (a random seed)
         """
         self.__entities: dict[type[Entity], list[Entity]] = {
             Zombie: [],  # List to store instances of the Zombie class
             Plant: [],  # List to store instances of the Plant class
             Projectile: [],  # List to store instances of the Projectile class
         }
+        self.__removed: list[Entity] = []  # Entities removed since the last commit
+
+        # Handles are (generation << HANDLE_SLOT_BITS) | slot, the generation changes whenever a slot is freed
+        self.__slots: list[Entity | None] = []
+        self.__generations: list[int] = []
+        self.__free_slots: list[int] = []
+
+        # Removed zombies/projectiles waiting to be reused, by exact class
+        self.__pools: dict[type[Entity], list[Entity]] = {}
+        self.__pooled_classes: tuple[type[Entity], ...] = (Zombie, Projectile)
+
+        self.lanes = LaneManager(list(self.__entities))  # Entities of each row, sorted by x
+        self.schedule = ScheduleManager()  # Plants and blocked zombies, woken when their cooldown expires
+
+        # Projectiles, woken on the tick they are predicted to hit a zombie
+        self.impacts = ScheduleManager()
+        self.__unpredicted: list[Projectile] = []  # Projectiles whose impact has to be (re)predicted
+        self.__dirty_lanes: set[int] = set()  # Lanes whose projectiles might now hit a zombie sooner
+        self.__max_zombie_speed: float = 0.0  # The fastest zombie added so far
+        self.__max_projectile_speed: float = 0.0  # The fastest projectile added so far
+        self.__max_reach: float = GRID_SIZE  # The longest reach of any projectile (see Projectile.get_reach)
+
+        # When vectorized, zombies and projectiles are kept in the BatchManager instead of the lanes
+        self.batch = BatchManager(self) if vectorized else None
         self.__game_running: bool = False
         self.sound_manager = sound_manager
         self.__coins: int = 25  # Default: 25 coins
+        self.clock = ClockManager()  # Simulation clock, entities read the time from here
+        self.game_speed: int = 1
+        self.random = RandomManager(seed)  # Every random number drawn during the game comes from here
+        self.replay: ReplayManager | None = None  # Records the player's commands, if set
 
     def __validate_entity(self, entity: Entity) -> type[Entity]:
         """
@@ -51,33 +99,523 @@ class GameManager:
         Raises:
             ValueError: If the entity type is not registered in the GameManager.
         """
-        entity_type: type[Entity] = type(entity)
-        for base_class in self.__entities:
-            if issubclass(entity_type, base_class):
-                return base_class
+        entity_type: type[Entity] = entity.entity_class
+        base_class = registry.get_base(entity_type)
+        if base_class in self.__entities:
+            return base_class
         raise ValueError(f"Entity type {entity_type} is not registered in GameManager")
 
     def add(self, entity: Entity) -> None:
         """
-        Add an entity to the GameManager.
+        Add an entity to the GameManager, giving it a handle.
 
         Args:
             entity (Entity): The entity to be added.
         """
         base_class: type[Entity] = self.__validate_entity(entity)
-        self.__entities[base_class].append(entity)
+        self.__register(entity, base_class)
+
+        if self.batch and base_class in self.batch.arrays:
+            self.batch.attach(entity, base_class)
+        else:
+            self.lanes.add(entity, base_class)
+
+        if not self.batch:
+            self.__track(entity, base_class)
+
+    def add_all(self, entities: list[Entity]) -> None:
+        """
+        Add many entities to the GameManager (i.e. when loading a saved game),
+        indexing each lane or batch and reordering the schedule once instead of once per entity.
+
+        Args:
+            entities (list[Entity]): The entities to be added.
+        """
+        groups: dict[type[Entity], list[Entity]] = {base_class: [] for base_class in self.__entities}
+        base_classes: dict[type[Entity], type[Entity]] = {}
+        for entity in entities:
+            entity_type = type(entity)
+            base_class = base_classes.get(entity_type)
+            if base_class is None:
+                base_class = base_classes[entity_type] = self.__validate_entity(entity)
+            groups[base_class].append(entity)
+
+        for base_class, group in groups.items():
+            self.__register_all(group, base_class)
+            if self.batch and base_class in self.batch.arrays:
+                self.batch.extend(group, base_class)
+            else:
+                self.lanes.extend(group, base_class)
+
+        if not self.batch:
+            self.__track_all(groups)
+
+    def __register(self, entity: Entity, base_class: type[Entity]) -> None:
+        """
+        Add an entity to the list of its base class, and give it a handle.
+
+        Args:
+            entity (Entity): The entity to be added.
+            base_class (type[Entity]): The base class of the entity.
+        """
+        entities_list = self.__entities[base_class]
+        entity.index = len(entities_list)
+        entities_list.append(entity)
+
+        # Reuse a free handle slot if there is one, its generation tells apart the previous owners
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+            self.__slots[slot] = entity
+        else:
+            slot = len(self.__slots)
+            self.__slots.append(entity)
+            self.__generations.append(0)
+        entity.handle = (self.__generations[slot] << HANDLE_SLOT_BITS) | slot
+        entity.alive = True
+
+    def __register_all(self, entities: list[Entity], base_class: type[Entity]) -> None:
+        """
+        Add many entities of a base class to its list, and give them handles.
+
+        Args:
+            entities (list[Entity]): The entities to be added.
+            base_class (type[Entity]): The base class of the entities.
+        """
+        entities_list = self.__entities[base_class]
+        slots, generations, free_slots = self.__slots, self.__generations, self.__free_slots
+        for index, entity in enumerate(entities, len(entities_list)):
+            entity.index = index
+            if free_slots:
+                slot = free_slots.pop()
+                slots[slot] = entity
+            else:
+                slot = len(slots)
+                slots.append(entity)
+                generations.append(0)
+            entity.handle = (generations[slot] << HANDLE_SLOT_BITS) | slot
+            entity.alive = True
+        entities_list.extend(entities)
+
+    def __track(self, entity: Entity, base_class: type[Entity]) -> None:
+        """
+        Schedule a newly added entity, and update the state that depends on it (lane engine only).
+
+        Args:
+            entity (Entity): The entity that was added.
+            base_class (type[Entity]): The base class of the entity.
+        """
+        if base_class is Plant:
+            self.schedule.schedule(entity.handle, entity.get_next_attack())
+            for zombie in self.lanes.between(Zombie, entity.y, entity.x - GRID_SIZE, entity.x):
+                self.__check_blocked(zombie)
+        elif base_class is Zombie:
+            self.__check_blocked(entity)
+            if entity.x <= VISIBLE_DISTANCE:
+                self.__wake_lane(entity.y)
+            self.__max_zombie_speed = max(self.__max_zombie_speed, entity.speed)
+            self.__max_reach = max(GRID_SIZE, self.__max_projectile_speed + self.__max_zombie_speed)
+            self.__dirty_lanes.add(entity.y)
+        elif base_class is Projectile:
+            self.__unpredicted.append(entity)
+            self.__max_projectile_speed = max(self.__max_projectile_speed, entity.speed)
+            self.__max_reach = max(GRID_SIZE, self.__max_projectile_speed + self.__max_zombie_speed)
+
+    def __track_all(self, groups: dict[type[Entity], list[Entity]]) -> None:
+        """
+        Schedule many newly added entities, and update the state that depends on them, once per lane
+        instead of once per entity (lane engine only).
+
+        Args:
+            groups (dict[type[Entity], list[Entity]]): The entities that were added, by base class.
+        """
+        plants, zombies, projectiles = groups[Plant], groups[Zombie], groups[Projectile]
+        self.schedule.schedule_all((plant.handle, plant.get_next_attack()) for plant in plants)
+
+        # Block the zombies of each lane with new entities in a single pass over its zombies and plants,
+        # which are both sorted by x: the first plant at or ahead of each zombie only moves forward
+        for y in {entity.y for entity in zombies} | {entity.y for entity in plants}:
+            lane_plants = self.lanes.get_lane(Plant, y)
+            plant_index = 0
+            for zombie in self.lanes.get_lane(Zombie, y):
+                x = zombie.x
+                while plant_index < len(lane_plants) and lane_plants[plant_index].x < x:
+                    plant_index += 1
+                self.__set_blocked(zombie, plant_index < len(lane_plants)
+                                   and lane_plants[plant_index].x <= x + GRID_SIZE)
+
+        if zombies:
+            for y in {zombie.y for zombie in zombies if zombie.x <= VISIBLE_DISTANCE}:
+                self.__wake_lane(y)
+            self.__max_zombie_speed = max(self.__max_zombie_speed, max(zombie.speed for zombie in zombies))
+            self.__dirty_lanes.update(zombie.y for zombie in zombies)
+        if projectiles:
+            self.__unpredicted.extend(projectiles)
+            self.__max_projectile_speed = max(self.__max_projectile_speed,
+                                              max(projectile.speed for projectile in projectiles))
+        self.__max_reach = max(GRID_SIZE, self.__max_projectile_speed + self.__max_zombie_speed)
+
+    def spawn(self, entity_class: type[Entity], x: int, y: int) -> Entity:
+        """
+        Add a new entity to the GameManager, reusing a removed entity of the same class if possible.
+
+        Args:
+            entity_class (type[Entity]): The class of entity to spawn.
+            x (int): The initial x-coordinate of the entity.
+            y (int): The initial y-coordinate of the entity.
+
+        Returns:
+            Entity: The spawned entity.
+        """
+        pool = self.__pools.get(entity_class)
+        if pool:
+            entity = pool.pop()
+            entity.reset(x, y)
+        else:
+            entity = entity_class(self, x, y)
+        self.add(entity)
+        return entity
+
+    def __recycle(self, entity: Entity) -> None:
+        """
+        Keep a removed entity so it can be reused by spawn.
+
+        Args:
+            entity (Entity): The removed entity.
+        """
+        if not isinstance(entity, self.__pooled_classes):
+            return
+        pool = self.__pools.setdefault(entity.entity_class, [])
+        if len(pool) < POOL_SIZE:
+            pool.append(entity)
 
     def remove(self, entity: Entity) -> None:
         """
         Remove an entity from the GameManager.
+        The entity is marked as dead right away, but it is only taken off the board
+        on the next commit, so lists being iterated over are never changed mid-loop.
 
         Args:
             entity (Entity): The entity to be removed.
         """
-        for entities_list in self.__entities.values():
-            if entity in entities_list:
-                base_class: type[Entity] = self.__validate_entity(entity)
-                self.__entities[base_class].remove(entity)
+        if not entity.alive:
+            return
+        entity.alive = False
+        self.__removed.append(entity)
+
+    def commit(self) -> None:
+        """
+        Take every entity removed since the last commit off the board.
+        This should be called at the end of every tick.
+        """
+        for entity in self.__removed:
+            if entity.index >= 0:  # The entity might have already been cleared
+                self.__discard(entity, self.__validate_entity(entity))
+        self.__removed.clear()
+
+    def __discard(self, entity: Entity, base_class: type[Entity]) -> None:
+        """
+        Take an entity off the board in constant time, by moving the last
+        entity of its class into its place and freeing its handle.
+
+        Args:
+            entity (Entity): The entity to be discarded.
+            base_class (type[Entity]): The base class of the entity.
+        """
+        entities_list = self.__entities[base_class]
+        last_entity = entities_list.pop()
+        if last_entity is not entity:
+            entities_list[entity.index] = last_entity
+            last_entity.index = entity.index
+        entity.index = -1
+
+        if self.batch and base_class in self.batch.arrays:
+            self.batch.detach(entity, base_class)
+        else:
+            self.lanes.remove(entity, base_class)
+
+        if not self.batch:
+            self.schedule.cancel(entity.handle)
+            self.impacts.cancel(entity.handle)
+            if base_class is Plant:
+                # Zombies blocked by the plant are free to move on
+                for zombie in self.lanes.between(Zombie, entity.y, entity.x - GRID_SIZE, entity.x):
+                    self.__check_blocked(zombie)
+        self.__free_handle(entity)
+        self.__recycle(entity)
+
+    def __free_handle(self, entity: Entity) -> None:
+        """
+        Free the handle of an entity, invalidating every copy of it.
+
+        Args:
+            entity (Entity): The entity whose handle should be freed.
+        """
+        slot = entity.handle & HANDLE_SLOT_MASK
+        self.__slots[slot] = None
+        self.__generations[slot] += 1
+        self.__free_slots.append(slot)
+        entity.alive = False
+
+    def get(self, handle: int) -> Entity | None:
+        """
+        Get the entity that a handle refers to.
+
+        Args:
+            handle (int): The handle of the entity.
+
+        Returns:
+            Entity | None: The entity, or None if it has been removed since the handle was given out.
+        """
+        slot = handle & HANDLE_SLOT_MASK
+        if slot >= len(self.__slots) or self.__generations[slot] != handle >> HANDLE_SLOT_BITS:
+            return None
+        return self.__slots[slot]
+
+    def update(self) -> None:
+        """
+        Simulate a single tick of the entities on the board, then advance the clock.
+
+        Entities only interact with entities in the same row, so each lane
+        is checked on its own using the lane index.
+        """
+        if self.batch:
+            # The vectorized engine handles the whole tick with array operations
+            self.batch.step(self.__entities[Plant], VISIBLE_DISTANCE)
+        else:
+            self.__update_lanes()
+        self.clock.step()
+        self.commit()
+
+    def __check_blocked(self, zombie: Zombie) -> None:
+        """
+        Block a zombie that is inside a plant's cell (zombie.x <= plant.x <= zombie.x + GRID_SIZE),
+        scheduling its attacks, or unblock it if it no longer is.
+
+        Args:
+            zombie (Zombie): The zombie to check.
+        """
+        plant = self.lanes.first(Plant, zombie.y, zombie.x)
+        self.__set_blocked(zombie, plant is not None and plant.x <= zombie.x + GRID_SIZE)
+
+    def __set_blocked(self, zombie: Zombie, blocked: bool) -> None:
+        """
+        Block a zombie, scheduling its attacks, or unblock it.
+
+        Args:
+            zombie (Zombie): The zombie to block or unblock.
+            blocked (bool): Whether the zombie is inside a plant's cell.
+        """
+        if blocked and not zombie.collided_with_plant:
+            zombie.collided_with_plant = True
+            self.schedule.schedule(zombie.handle, zombie.get_next_attack())
+        elif not blocked and zombie.collided_with_plant:
+            zombie.collided_with_plant = False
+            self.schedule.cancel(zombie.handle)
+            self.__dirty_lanes.add(zombie.y)  # Projectiles might now reach the moving zombie sooner
+
+    def __wake_lane(self, y: int) -> None:
+        """
+        Wake up the plants of a lane that were waiting for a zombie to become visible.
+
+        Args:
+            y (int): The y-coordinate of the lane.
+        """
+        for handle in self.schedule.wake(y):
+            plant = self.get(handle)
+            if plant is not None:
+                self.schedule.schedule(handle, plant.get_next_attack())
+
+    def __predict_impact(self, projectile: Projectile) -> None:
+        """
+        Predict the tick a projectile hits a zombie, assuming every zombie in its lane keeps its current speed,
+        and schedule the projectile for that tick. This must be called between the zombies moving in two ticks.
+
+        A prediction is never later than the actual impact: zombies can only be slowed down (blocked) or removed
+        without notice, which is caught when the projectile is woken up early and predicted again. Zombies added
+        or unblocked in a lane make every projectile in the lane be predicted again.
+
+        Args:
+            projectile (Projectile): The projectile to predict.
+        """
+        x, speed = projectile.x, projectile.speed
+        max_closing_speed = speed + self.__max_zombie_speed
+        best: int | None = None
+
+        for zombie in self.lanes.following(Zombie, projectile.y, x - self.__max_reach):
+            # The zombies are sorted by x, so none of the remaining ones can be reached any sooner
+            if best is not None and zombie.x - x + speed > best * max_closing_speed:
+                break
+            zombie_speed = 0 if zombie.collided_with_plant else zombie.speed
+            if x - (zombie.x - zombie_speed) > projectile.get_reach(zombie):
+                continue  # The projectile is already past the zombie
+
+            # After n more ticks, the projectile is at x + (n - 1) * speed and the zombie at zombie.x - n * zombie_speed
+            # (the tolerance rounds float error towards predicting too early, which is harmless)
+            ticks = max(1, math.ceil((zombie.x - x + speed) / (speed + zombie_speed) - 1e-9))
+            if best is None or ticks < best:
+                best = ticks
+
+        if best is None:
+            self.impacts.cancel(projectile.handle)
+        else:
+            self.impacts.schedule(projectile.handle, self.clock.ticks - 1 + best)
+
+    def __predict_impacts(self) -> None:
+        """
+        Predict the impacts of new projectiles, projectiles that missed, and projectiles in dirty lanes.
+        """
+        predictions = 0
+        for projectile in self.__unpredicted:
+            if projectile.alive:
+                self.__predict_impact(projectile)
+                predictions += 1
+        self.__unpredicted.clear()
+
+        for y in self.__dirty_lanes:
+            for projectile in self.lanes.get_lane(Projectile, y):
+                if projectile.alive:
+                    self.__predict_impact(projectile)
+                    predictions += 1
+        self.__dirty_lanes.clear()
+        metrics.count("impact_predictions", predictions)
+
+    def __update_lanes(self) -> None:
+        """
+        Simulate a single tick of the entities on the board, one lane at a time.
+
+        Plants and blocked zombies are only woken up by the schedule when their cooldown
+        has expired, so idle entities cost nothing between their attacks. Likewise, projectiles
+        are only checked against zombies on the tick they are predicted to hit one.
+        """
+        lanes = self.lanes
+
+        for handle in self.schedule.pop_due(self.clock.ticks):
+            entity = self.get(handle)
+            if entity is None or not entity.alive:
+                continue
+
+            if isinstance(entity, Zombie):
+                # The zombie is blocked by the plant in its cell (which may have just died this tick)
+                plant = lanes.first(Plant, entity.y, entity.x)
+                if plant is not None:
+                    entity.attack_plant(plant)
+                    self.schedule.schedule(handle, entity.get_next_attack())
+                continue
+
+            # Ensure the zombie is visible on the board, in front of the plant
+            target = lanes.first(Zombie, entity.y, entity.x)
+            if target is not None and target.x <= VISIBLE_DISTANCE:
+                entity.shoot_projectile()
+                self.schedule.schedule(handle, entity.get_next_attack())
+            else:
+                self.schedule.park(handle, entity.y)
+
+        # Predict before the zombies move, including the projectiles that were just shot
+        self.__predict_impacts()
+
+        for y, zombies in lanes.get_lanes(Zombie).items():
+            has_plants = bool(lanes.get_lane(Plant, y))
+            for zombie in zombies:
+                if zombie.collided_with_plant:
+                    continue
+                previous_x = zombie.x
+                zombie.update_position()
+                if zombie.x <= VISIBLE_DISTANCE < previous_x:
+                    self.__wake_lane(y)
+                if has_plants:
+                    self.__check_blocked(zombie)
+        lanes.sort(Zombie)
+
+        # Only the projectiles predicted to hit a zombie this tick are checked
+        due_projectiles: dict[int, list[Projectile]] = {}
+        for handle in self.impacts.pop_due(self.clock.ticks):
+            projectile = self.get(handle)
+            if projectile is not None and projectile.alive:
+                due_projectiles.setdefault(projectile.y, []).append(projectile)
+
+        collision_tests = 0
+        for y, projectiles in due_projectiles.items():
+            projectiles.sort(key=_get_x)
+            for zombie in lanes.between(Zombie, y, projectiles[0].x - self.__max_reach, projectiles[-1].x):
+                # If a Projectile is inside the Zombie (zombie.x <= projectile.x <= zombie.x + GRID_SIZE),
+                # or passed through it since the last tick (see Projectile.get_reach)
+                start = bisect_left(projectiles, zombie.x, key=_get_x)
+                end = bisect_right(projectiles, zombie.x + self.__max_reach, lo=start, key=_get_x)
+                collision_tests += end - start
+                for projectile in projectiles[start:end]:
+                    if not zombie.alive:
+                        break
+                    if projectile.alive and projectile.x - zombie.x <= projectile.get_reach(zombie):
+                        projectile.attack_zombie(zombie)
+
+            # Projectiles whose zombie was slowed down or removed are predicted again next tick
+            self.__unpredicted.extend(projectile for projectile in projectiles if projectile.alive)
+        metrics.count("collision_tests", collision_tests)
+
+        for projectile in self.__entities[Projectile]:
+            if projectile.alive:
+                projectile.update_position()
+        lanes.sort(Projectile)
+
+    def is_lost(self) -> bool:
+        """
+        Check if a zombie made it past the left edge of the board.
+
+        Returns:
+            bool: True if the game is lost, False otherwise.
+        """
+        if self.batch:
+            return self.batch.is_past(-GRID_SIZE)
+        # Lanes are sorted, so only the left-most zombie of each lane needs to be checked
+        return any(lane and lane[0].x <= -GRID_SIZE for lane in self.lanes.get_lanes(Zombie).values())
+
+    def place_plant(self, plant_class: type[Plant], x: int, y: int) -> Plant | None:
+        """
+        Place a new plant on the board, paying for it with coins.
+
+        Args:
+            plant_class (type[Plant]): The class of plant to place.
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+
+        Returns:
+            Plant | None: The new plant, or None if the cell is taken or there are not enough coins.
+        """
+        # There's already a plant in that cell
+        if self.lanes.between(Plant, y, x, x):
+            return None
+
+        # The player does not have enough coins
+        if self.__coins < plant_class.cost:
+            return None
+
+        new_plant = plant_class(self, x, y)
+        self.add(new_plant)
+        self.remove_coins(new_plant.cost)
+        if self.replay:
+            self.replay.record(self.clock.ticks, ReplayCommand.PLACE, plant_class.__name__, x, y)
+        print(f"New {plant_class.__name__} {new_plant.x, new_plant.y}. Health: {new_plant.health}")
+        return new_plant
+
+    def dig_plant(self, x: int, y: int) -> Plant | None:
+        """
+        Remove the plant in a cell, refunding half of its cost.
+
+        Args:
+            x (int): The x-coordinate of the cell.
+            y (int): The y-coordinate of the cell.
+
+        Returns:
+            Plant | None: The removed plant, or None if there was no plant in that cell.
+        """
+        for plant in self.lanes.between(Plant, y, x, x):
+            self.remove(plant)
+            self.commit()
+            self.add_coins(plant.cost // 2)
+            if self.replay:
+                self.replay.record(self.clock.ticks, ReplayCommand.DIG, x, y)
+            return plant
+        return None
 
     def get_entities(self, entity_class: type[Entity] = None) -> list[Entity]:
         """
@@ -107,7 +645,19 @@ class GameManager:
             entity_class (type[Entity]): The class of entities to clear (e.g., Zombie or Plant).
         """
         if entity_class in self.__entities:
+            self.commit()
+            for entity in self.__entities[entity_class]:
+                entity.index = -1
+                self.__free_handle(entity)
+                self.__recycle(entity)
             self.__entities[entity_class].clear()
+            if self.batch and entity_class in self.batch.arrays:
+                self.batch.clear(entity_class)
+            else:
+                self.lanes.clear(entity_class)
+            if entity_class is Plant and not self.batch:
+                for zombie in self.__entities[Zombie]:
+                    self.__check_blocked(zombie)
         else:
             raise ValueError(f"Entity class {entity_class} is not registered in GameManager")
 
@@ -117,7 +667,17 @@ class GameManager:
         """
         for entity in self.__entities:
             self.clear_entities(entity)
+        self.__removed.clear()
+        self.schedule.clear()
+        self.impacts.clear()
+        self.__unpredicted.clear()
+        self.__dirty_lanes.clear()
+        self.__max_zombie_speed = 0.0
+        self.__max_projectile_speed = 0.0
+        self.__max_reach = GRID_SIZE
         self.__coins = 25
+        self.clock.reset()
+        self.random.reset()
 
     def get_coins(self) -> int:
         """
@@ -140,3 +700,9 @@ class GameManager:
         Remove users' coins
         """
         self.__coins -= coins
+
+    def set_coins(self, coins: int) -> None:
+        """
+        Set users' coins (i.e. when loading a saved game)
+        """
+        self.__coins = coins
@@ -0,0 +1,148 @@
+"""
+Leafy Legions: HistogramManager
+
+This module contains the Histogram and HistogramManager classes
+for recording how long every frame takes, and reporting the percentiles by screen and wave
+"""
+# Standard Imports
+from array import array
+import time
+from typing import TYPE_CHECKING
+
+# The following packages are imported only for type hinting.
+# They are not used in this package, preventing circular dependency errors.
+if TYPE_CHECKING:
+    from src.screens import BaseScreen
+
+# Histograms keep 2^PRECISION_BITS buckets per power of two, so values are recorded within 1/64 (1.6%)
+PRECISION_BITS: int = 7
+MAX_VALUE_BITS: int = 27  # Values are recorded up to 2^27 microseconds (over 2 minutes), larger values are clamped
+HALF_BUCKETS: int = 1 << (PRECISION_BITS - 1)
+
+PERCENTILES: tuple[float, ...] = (50.0, 90.0, 99.0, 99.9)
+
+
+class Histogram:
+    """
+    A Histogram counts values (i.e. frame times in microseconds) in log-linear buckets, like an HDR histogram:
+    values below 2^PRECISION_BITS have a bucket each, and every power of two above is split into the same
+    number of buckets. It takes the same memory (about 11 KB) however many values are recorded,
+    and recording a value is constant time.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize an empty Histogram object.
+        """
+        self.counts: array = array('Q', bytes(8 * self.get_index((1 << MAX_VALUE_BITS) - 1) + 8))
+        self.total: int = 0
+        self.max: int = 0
+
+    @staticmethod
+    def get_index(value: int) -> int:
+        """
+        Get the bucket of a value.
+
+        Args:
+            value (int): The value, at least 0.
+
+        Returns:
+            int: The index of the bucket.
+        """
+        shift = value.bit_length() - PRECISION_BITS
+        if shift <= 0:
+            return value
+        # The top PRECISION_BITS bits of the value, after the first power of two
+        return (shift + 1) * HALF_BUCKETS + (value >> shift) - HALF_BUCKETS
+
+    @staticmethod
+    def get_highest_value(index: int) -> int:
+        """
+        Get the highest value counted in a bucket.
+
+        Args:
+            index (int): The index of the bucket.
+
+        Returns:
+            int: The highest value of the bucket.
+        """
+        if index < 2 * HALF_BUCKETS:
+            return index
+        shift, offset = divmod(index, HALF_BUCKETS)
+        shift -= 1
+        return ((HALF_BUCKETS + offset + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """
+        Count a value.
+
+        Args:
+            value (int): The value, at least 0. Values too large for the histogram are counted in its last bucket.
+        """
+        self.counts[min(self.get_index(value), len(self.counts) - 1)] += 1
+        self.total += 1
+        self.max = max(self.max, value)
+
+    def get_percentile(self, percentile: float) -> int:
+        """
+        Get the value below which a percentage of the values fall.
+
+        Args:
+            percentile (float): The percentage, from 0 to 100.
+
+        Returns:
+            int: The highest value of the bucket the percentile falls in (no more than the maximum value),
+                or 0 if the histogram is empty.
+        """
+        target = max(1, round(self.total * percentile / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.get_highest_value(index), self.max)
+        return self.max
+
+
+class HistogramManager:
+    """
+    The HistogramManager times every frame, from the end of one frame to the end of the next
+    (the time the player sees each frame for), and records it in a histogram for the current screen,
+    and one for the current wave while a game is played.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize a HistogramManager object.
+        """
+        self.screens: dict[str, Histogram] = {}
+        self.waves: dict[int, Histogram] = {}
+        self.__last_frame_end: float | None = None
+
+    def end_frame(self, screen: 'BaseScreen | None') -> None:
+        """
+        Record the time since the previous frame ended.
+
+        Args:
+            screen (BaseScreen | None): The screen that was rendered.
+        """
+        frame_end = time.perf_counter()
+        if self.__last_frame_end is not None and screen is not None:
+            frame_time = int((frame_end - self.__last_frame_end) * 1e6)
+            self.screens.setdefault(type(screen).__name__, Histogram()).record(frame_time)
+            wave_manager = getattr(screen, "wave_manager", None)
+            if wave_manager is not None:
+                self.waves.setdefault(wave_manager.get_wave(), Histogram()).record(frame_time)
+        self.__last_frame_end = frame_end
+
+    def get_report(self) -> str:
+        """
+        Get a table of the number of frames, percentiles and longest frame time of each screen and wave.
+
+        Returns:
+            str: The report, with times in milliseconds.
+        """
+        headers = "".join(f"{f'p{percentile:g}':>9}" for percentile in PERCENTILES)
+        lines = [f"{'Frame times (ms)':<24}{'Frames':>9}{headers}{'Max':>9}"]
+        rows = [*self.screens.items(), *((f"Wave {wave}", histogram) for wave, histogram in sorted(self.waves.items()))]
+        for name, histogram in rows:
+            percentiles = "".join(f"{histogram.get_percentile(percentile) / 1000:>9.2f}" for percentile in PERCENTILES)
+            lines.append(f"{name:<24}{histogram.total:>9,}{percentiles}{histogram.max / 1000:>9.2f}")
+        return "\n".join(lines)
@@ -0,0 +1,198 @@
+"""
+Leafy Legions: LaneManager
+
+This module contains the LaneManager class
+for indexing the entities in each row (lane) of the game board
+"""
+# Standard Imports
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterator
+
+# The following packages are imported only for type hinting.
+# They are not used in this package, preventing circular dependency errors.
+if TYPE_CHECKING:
+    from src.entities import Plant, Zombie, Projectile
+
+    Entity = Zombie | Plant | Projectile
+
+# Sort key for the entities in a lane
+_get_x = attrgetter('x')
+
+
+class LaneManager:
+    """
+    The LaneManager keeps the entities of each lane sorted by their x-coordinate,
+    so that entities in the same row can be found without checking the entire board.
+    """
+    def __init__(self, base_classes: list[type['Entity']]) -> None:
+        """
+        Initialize a LaneManager object.
+
+        Args:
+            base_classes (list[type[Entity]]): The base classes of entities to index (e.g., Zombie or Plant).
+        """
+        # {BaseClass: {y: [entities sorted by x]}}
+        self.__lanes: dict[type['Entity'], dict[float, list['Entity']]] = {
+            base_class: {} for base_class in base_classes
+        }
+
+    def add(self, entity: 'Entity', base_class: type['Entity']) -> None:
+        """
+        Add an entity to its lane, keeping the lane sorted.
+
+        Args:
+            entity (Entity): The entity to be added.
+            base_class (type[Entity]): The base class of the entity.
+        """
+        lanes = self.__lanes[base_class]
+        lane = lanes.get(entity.y)
+        if lane is None:
+            lane = lanes[entity.y] = []
+        insort(lane, entity, key=_get_x)
+
+    def extend(self, entities: list['Entity'], base_class: type['Entity']) -> None:
+        """
+        Add many entities to their lanes, sorting each lane once.
+
+        Args:
+            entities (list[Entity]): The entities to be added.
+            base_class (type[Entity]): The base class of the entities.
+        """
+        lanes = self.__lanes[base_class]
+        changed = set()
+        for entity in entities:
+            lane = lanes.get(entity.y)
+            if lane is None:
+                lane = lanes[entity.y] = []
+            lane.append(entity)
+            changed.add(entity.y)
+        for y in changed:
+            lanes[y].sort(key=_get_x)
+
+    def remove(self, entity: 'Entity', base_class: type['Entity']) -> None:
+        """
+        Remove an entity from its lane.
+
+        Args:
+            entity (Entity): The entity to be removed.
+            base_class (type[Entity]): The base class of the entity.
+        """
+        lane = self.__lanes[base_class].get(entity.y)
+        if not lane:
+            return
+
+        # Look for the entity amongst the entities sharing its x-coordinate
+        index = bisect_left(lane, entity.x, key=_get_x)
+        while index < len(lane) and lane[index].x == entity.x:
+            if lane[index] is entity:
+                del lane[index]
+                return
+            index += 1
+
+        # The entity moved since the lane was last sorted, fall back to a full search
+        for index, lane_entity in enumerate(lane):
+            if lane_entity is entity:
+                del lane[index]
+                return
+
+    def sort(self, base_class: type['Entity']) -> None:
+        """
+        Re-sort the lanes of a class after its entities have moved.
+        Lanes are nearly sorted between ticks, so this runs in close to linear time.
+
+        Args:
+            base_class (type[Entity]): The base class of entities that moved.
+        """
+        for lane in self.__lanes[base_class].values():
+            lane.sort(key=_get_x)
+
+    def get_lane(self, base_class: type['Entity'], y: float) -> list['Entity']:
+        """
+        Get the entities of a class in a lane, sorted by x-coordinate.
+
+        Args:
+            base_class (type[Entity]): The base class of entities to retrieve.
+            y (float): The y-coordinate of the lane.
+
+        Returns:
+            list[Entity]: The entities in the lane. This list should not be modified.
+        """
+        return self.__lanes[base_class].get(y, [])
+
+    def get_lanes(self, base_class: type['Entity']) -> dict[float, list['Entity']]:
+        """
+        Get every lane of a class.
+
+        Args:
+            base_class (type[Entity]): The base class of entities to retrieve.
+
+        Returns:
+            dict[float, list[Entity]]: The lanes, keyed by their y-coordinate.
+        """
+        return self.__lanes[base_class]
+
+    def between(self, base_class: type['Entity'], y: float, min_x: float, max_x: float) -> list['Entity']:
+        """
+        Get the entities of a class in a lane with min_x <= x <= max_x.
+
+        Args:
+            base_class (type[Entity]): The base class of entities to retrieve.
+            y (float): The y-coordinate of the lane.
+            min_x (float): The minimum x-coordinate (inclusive).
+            max_x (float): The maximum x-coordinate (inclusive).
+
+        Returns:
+            list[Entity]: The matching entities, sorted by x-coordinate.
+        """
+        lane = self.__lanes[base_class].get(y)
+        if not lane:
+            return []
+        start = bisect_left(lane, min_x, key=_get_x)
+        end = bisect_right(lane, max_x, lo=start, key=_get_x)
+        return lane[start:end]
+
+    def first(self, base_class: type['Entity'], y: float, min_x: float) -> 'Entity | None':
+        """
+        Get the entity of a class in a lane with the smallest x-coordinate that is at least min_x.
+
+        Args:
+            base_class (type[Entity]): The base class of entity to retrieve.
+            y (float): The y-coordinate of the lane.
+            min_x (float): The minimum x-coordinate (inclusive).
+
+        Returns:
+            Entity | None: The matching entity, or None if there is none.
+        """
+        lane = self.__lanes[base_class].get(y)
+        if not lane:
+            return None
+        index = bisect_left(lane, min_x, key=_get_x)
+        return lane[index] if index < len(lane) else None
+
+    def following(self, base_class: type['Entity'], y: float, min_x: float) -> Iterator['Entity']:
+        """
+        Iterate over the entities of a class in a lane with x >= min_x, in order of x-coordinate.
+
+        Args:
+            base_class (type[Entity]): The base class of entities to retrieve.
+            y (float): The y-coordinate of the lane.
+            min_x (float): The minimum x-coordinate (inclusive).
+
+        Returns:
+            Iterator[Entity]: The matching entities, sorted by x-coordinate. The lane should not be modified meanwhile.
+        """
+        lane = self.__lanes[base_class].get(y)
+        if not lane:
+            return iter(())
+        return islice(lane, bisect_left(lane, min_x, key=_get_x), None)
+
+    def clear(self, base_class: type['Entity']) -> None:
+        """
+        Clear the lanes of a class.
+
+        Args:
+            base_class (type[Entity]): The base class of entities to clear.
+        """
+        self.__lanes[base_class].clear()
@@ -0,0 +1,125 @@
+"""
+Leafy Legions: MemoryManager
+
+This module contains the MemoryManager class
+for logging the memory used in each wave, and where it was allocated
+"""
+# Standard Imports
+import os
+import tracemalloc
+from typing import TextIO
+
+# Local Imports
+from src.constants import MEMORY_TOP_SITES
+
+# Allocations made to import modules and take snapshots are not the game's
+SNAPSHOT_FILTERS: tuple[tracemalloc.Filter, ...] = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryManager:
+    """
+    The MemoryManager traces every allocation with tracemalloc, and takes a snapshot as each wave begins.
+    For every wave, it logs the memory in use, the peak, and the lines of code whose allocations grew the most
+    since the previous snapshot, which point at leaks (i.e. entities or surfaces that are never freed).
+
+    Tracing slows the game down noticeably, so nothing is traced until the manager is started.
+    """
+    def __init__(self, top: int = MEMORY_TOP_SITES) -> None:
+        """
+        Initialize a MemoryManager object.
+
+        Args:
+            top (int): The number of allocation sites logged per wave. Default: MEMORY_TOP_SITES
+        """
+        self.top = top
+        self.__file: TextIO | None = None
+        self.__snapshot: tracemalloc.Snapshot | None = None
+
+    def is_running(self) -> bool:
+        """
+        Check if allocations are being traced.
+
+        Returns:
+            bool: True if allocations are being traced, False otherwise.
+        """
+        return self.__file is not None
+
+    def start(self, path: str) -> None:
+        """
+        Start tracing allocations, logging each wave to a file (replacing it).
+
+        Args:
+            path (str): The path of the log file.
+        """
+        if self.__file is not None:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__file = open(path, "w")
+        tracemalloc.start()
+        self.__snapshot = self.take_snapshot()
+
+    @staticmethod
+    def take_snapshot() -> tracemalloc.Snapshot:
+        """
+        Take a snapshot of the allocations made by the game.
+
+        Returns:
+            tracemalloc.Snapshot: The snapshot, without the allocations made to import modules and take snapshots.
+        """
+        return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+    def snapshot(self, wave: int) -> None:
+        """
+        Log the memory in use and the allocation sites that grew the most since the last snapshot, if running.
+        This should be called as a wave begins.
+
+        Args:
+            wave (int): The wave that just ended, 0 if the first wave is beginning.
+        """
+        if self.__file is None:
+            return
+        snapshot = self.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        growth = snapshot.compare_to(self.__snapshot, "lineno")
+        total_growth = sum(stat.size_diff for stat in growth)
+
+        title = f"Wave {wave}" if wave else "Before wave 1"
+        lines = [f"{title}: {current / 2 ** 20:,.2f} MiB in use, peak {peak / 2 ** 20:,.2f} MiB, "
+                 f"{total_growth / 1024:+,.1f} KiB since the last wave"]
+        top_growth = sorted((stat for stat in growth if stat.size_diff > 0), key=lambda stat: stat.size_diff,
+                            reverse=True)[:self.top]
+        for stat in top_growth:
+            frame = stat.traceback[0]
+            # Files of the game are shown relative to it, i.e. src/entities/projectile.py
+            filename = frame.filename
+            if filename.startswith(os.getcwd()):
+                filename = os.path.relpath(filename)
+            lines.append(f"  {stat.size_diff / 1024:+10,.1f} KiB {stat.count_diff:+8,} blocks  "
+                         f"{filename}:{frame.lineno}")
+        self.__file.write("\n".join(lines) + "\n")
+        self.__file.flush()
+
+        self.__snapshot = snapshot
+        tracemalloc.reset_peak()  # The next peak is the peak of the next wave
+
+    def stop(self) -> None:
+        """
+        Stop tracing allocations, closing the log file.
+        """
+        if self.__file is None:
+            return
+        tracemalloc.stop()
+        self.__file.close()
+        self.__file = self.__snapshot = None
+
+
+# The memory diagnostics of the running game, shared by every manager and screen
+memory = MemoryManager()
@@ -0,0 +1,91 @@
+"""
+Leafy Legions: MetricsManager
+
+This module contains the MetricsManager class
+for counting the work done in each frame, and writing the counts to a file
+"""
+# Standard Imports
+import csv
+import json
+import os
+from typing import TextIO
+
+# The work counted in each frame
+COUNTERS: tuple[str, ...] = (
+    "collision_tests",  # Projectiles checked against a zombie (GameManager.update)
+    "impact_predictions",  # Projectiles whose impact was predicted (lane engine only)
+    "blits",  # Entities drawn (GameplayScreen.draw_entities)
+    "font_constructions",  # pygame.font.Font created (BaseScreen)
+    "image_loads",  # Images loaded from disk (BaseScreen.display_image, display_button_image)
+    "sound_creations",  # pygame.mixer.Sound created (SoundManager.play_sound)
+)
+
+
+class MetricsManager:
+    """
+    The MetricsManager keeps cheap counters of the work done in the current frame
+    (a frame of the game, or a tick of a headless game), and writes them to a CSV or JSON-lines file
+    at the end of every frame, one row per frame.
+
+    Counting is always on, as it is only a dictionary update; rows are only written once a file is opened.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize a MetricsManager object.
+        """
+        self.counts: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.frame: int = 0
+        self.__file: TextIO | None = None
+        self.__csv_writer: csv.DictWriter | None = None
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """
+        Add to a counter of the current frame.
+
+        Args:
+            counter (str): The name of the counter (see COUNTERS).
+            amount (int): The amount to add. Default: 1
+        """
+        self.counts[counter] += amount
+
+    def open(self, path: str) -> None:
+        """
+        Start writing the counts of every frame to a file, replacing it.
+
+        Args:
+            path (str): The path of the file, written as CSV if it ends with .csv, JSON lines otherwise.
+        """
+        self.close()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__file = open(path, "w", newline="")
+        if path.endswith(".csv"):
+            self.__csv_writer = csv.DictWriter(self.__file, fieldnames=["frame", *COUNTERS])
+            self.__csv_writer.writeheader()
+
+    def end_frame(self) -> None:
+        """
+        Write the counts of the frame, if a file is open, and start counting the next frame.
+        """
+        if self.__file:
+            row = {"frame": self.frame, **self.counts}
+            if self.__csv_writer:
+                self.__csv_writer.writerow(row)
+            else:
+                self.__file.write(json.dumps(row) + "\n")
+        self.frame += 1
+        for counter in self.counts:
+            self.counts[counter] = 0
+
+    def close(self) -> None:
+        """
+        Stop writing the counts, closing the file.
+        """
+        if self.__file:
+            self.__file.close()
+        self.__file = self.__csv_writer = None
+
+
+# The counters of the running game, shared by every manager and screen
+metrics = MetricsManager()
@@ -0,0 +1,167 @@
+"""
+Leafy Legions: ProfileManager
+
+This module contains the ProfileManager class
+for timing each phase of a frame, and drawing the timings over the game
+"""
+# Standard Imports
+from collections import deque
+from contextlib import contextmanager
+import time
+from typing import Iterator
+
+# Library Imports
+import pygame
+
+# Local Imports
+from src.constants import FPS, PROFILE_WINDOW
+from src.managers import ColorManager, tracer
+
+# The colors of the phases in the frame-budget bar, in the order the phases are first timed
+PHASE_COLORS: tuple[tuple[int, int, int], ...] = (
+    ColorManager.LIGHT_BLUE,
+    ColorManager.GREEN,
+    ColorManager.LIGHT_RED,
+    (241, 196, 15),
+    (155, 89, 182),
+    (26, 188, 156),
+    (230, 126, 34),
+)
+
+FRAME_BUDGET_MS: float = 1000 / FPS
+BAR_WIDTH: int = 240  # Width of the frame-budget bar, which spans two frame budgets
+LINE_HEIGHT: int = 18
+
+
+class ProfileManager:
+    """
+    The ProfileManager times the phases of every frame (i.e. "Events", "Simulation", "Flip"),
+    keeping the timings of the last few frames, so their average and worst times
+    can be drawn over the game while it runs.
+    """
+    def __init__(self, window: int = PROFILE_WINDOW) -> None:
+        """
+        Initialize a ProfileManager object.
+
+        Args:
+            window (int): The number of frames the timings are kept for. Default: PROFILE_WINDOW
+        """
+        self.window = window
+        self.visible: bool = False
+        self.counts: dict[str, int] = {}  # Counts shown under the timings, i.e. {"Zombies": 10}
+        self.__frames: deque[float] = deque(maxlen=window)  # Time taken by each of the last frames, in milliseconds
+        self.__phases: dict[str, deque[float]] = {}  # Time spent in each phase in each of the last frames
+        self.__frame: dict[str, float] = {}  # Time spent in each phase so far this frame
+        self.__frame_start: float | None = None
+        self.__font: pygame.font.Font | None = None
+
+    def begin_frame(self) -> None:
+        """
+        Start timing a frame.
+        """
+        self.__frame_start = time.perf_counter()
+        self.__frame.clear()
+
+    def end_frame(self) -> None:
+        """
+        Stop timing the frame, and add its timings to the last frames.
+        """
+        if self.__frame_start is None:
+            return
+        end_time = time.perf_counter()
+        self.__frames.append((end_time - self.__frame_start) * 1000)
+        tracer.record("Frame", self.__frame_start, end_time)
+        self.__frame_start = None
+
+        for name, timings in self.__phases.items():
+            timings.append(self.__frame.pop(name, 0.0))
+        for name, elapsed_time in self.__frame.items():
+            self.__phases[name] = deque((elapsed_time,), maxlen=self.window)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a phase of the frame, and trace it if the tracer is started.
+        A phase can be timed several times in a frame, its times are added up.
+
+        Args:
+            name (str): The name of the phase, i.e. "Simulation".
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            end_time = time.perf_counter()
+            self.__frame[name] = self.__frame.get(name, 0.0) + (end_time - start_time) * 1000
+            tracer.record(name, start_time, end_time)
+
+    def get_timings(self) -> dict[str, tuple[float, float]]:
+        """
+        Get the average and worst time of the frame and each of its phases, over the last frames.
+        Time spent outside of every phase is reported as "Other".
+
+        Returns:
+            dict[str, tuple[float, float]]: The average and worst time of "Frame", each phase and "Other",
+                in milliseconds.
+        """
+        if not self.__frames:
+            return {}
+        timings = {name: (sum(times) / len(times), max(times)) for name, times in self.__phases.items()}
+        frame_average = sum(self.__frames) / len(self.__frames)
+        other_average = max(frame_average - sum(average for average, _ in timings.values()), 0.0)
+        return {"Frame": (frame_average, max(self.__frames)), **timings, "Other": (other_average, 0.0)}
+
+    def toggle(self) -> None:
+        """
+        Show or hide the overlay.
+        """
+        self.visible = not self.visible
+
+    def draw(self, display: pygame.Surface) -> None:
+        """
+        Draw the overlay in the bottom-right corner of the display, if it is visible: the average and worst time
+        of each phase, the counts, and a bar splitting the average frame into its phases against the frame budget.
+
+        Args:
+            display (pygame.Surface): The display to draw on.
+        """
+        if not self.visible or not self.__frames:
+            return
+        if self.__font is None:
+            self.__font = pygame.font.Font(None, 20)
+
+        timings = self.get_timings()
+        phases = [name for name in timings if name not in ("Frame", "Other")]
+        colors = {name: PHASE_COLORS[index % len(PHASE_COLORS)] for index, name in enumerate(phases)}
+        colors["Other"] = ColorManager.GRAY
+        rows = [("Phase", "Avg ms", "Max ms")]
+        rows += [(name, f"{average:.2f}", f"{worst:.2f}" if name != "Other" else "")
+                 for name, (average, worst) in timings.items()]
+        rows += [(name, f"{count:,}") for name, count in self.counts.items()]
+
+        width = BAR_WIDTH + 20
+        height = (len(rows) + 1) * LINE_HEIGHT + 20
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for index, row in enumerate(rows):
+            # The names are aligned left and the numbers right, as the default font is not monospaced
+            # Phase names are drawn in the color of their part of the bar
+            for column, text in enumerate(row):
+                color = colors.get(row[0], ColorManager.WHITE) if column == 0 else ColorManager.WHITE
+                rendered = self.__font.render(text, True, color)
+                x = 10 if column == 0 else 70 + column * 80 - rendered.get_width()
+                panel.blit(rendered, (x, 10 + index * LINE_HEIGHT))
+
+        # Stack the average time of each phase in the bar, the white line marks the frame budget
+        bar_y = height - LINE_HEIGHT - 5
+        scale = BAR_WIDTH / (FRAME_BUDGET_MS * 2)
+        x = 10.0
+        for name, color in colors.items():
+            segment_width = min(timings[name][0] * scale, 10 + BAR_WIDTH - x)
+            pygame.draw.rect(panel, color, (x, bar_y, segment_width, LINE_HEIGHT - 4))
+            x += segment_width
+        pygame.draw.rect(panel, ColorManager.WHITE, (10, bar_y, BAR_WIDTH, LINE_HEIGHT - 4), width=1)
+        budget_x = 10 + BAR_WIDTH // 2
+        pygame.draw.line(panel, ColorManager.WHITE, (budget_x, bar_y - 3), (budget_x, bar_y + LINE_HEIGHT))
+
+        display.blit(panel, (display.get_width() - width - 10, display.get_height() - height - 10))
@@ -0,0 +1,73 @@
+"""
+Leafy Legions: RandomManager
+
+This module contains the RandomManager class
+for managing the seeded random number streams of a game
+"""
+# Standard Imports
+import random
+
+SEED_MASK: int = (1 << 64) - 1  # Seeds are stored as unsigned 64-bit integers in replays and saves
+
+
+class RandomManager:
+    """
+    The RandomManager hands out a separate random number stream to each subsystem
+    (i.e. "waves" or "animation"), all derived from a single game seed.
+    Since the streams are independent, drawing an animation does not change the waves,
+    and a game can be reproduced from its seed.
+    """
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        Initialize a RandomManager object.
+
+        Args:
+            seed (int | None): The seed of the game, masked to 64 bits (so negative seeds are allowed).
+                Default: None (a random seed)
+        """
+        self.seed: int = seed & SEED_MASK if seed is not None else random.getrandbits(63)
+        self.__streams: dict[str, random.Random] = {}
+
+    def get_stream(self, name: str) -> random.Random:
+        """
+        Get the random number stream of a subsystem.
+
+        Args:
+            name (str): The name of the subsystem, i.e. "waves".
+
+        Returns:
+            random.Random: The stream, seeded from the game seed and its name.
+        """
+        stream = self.__streams.get(name)
+        if stream is None:
+            stream = self.__streams[name] = random.Random(f"{self.seed}:{name}")
+        return stream
+
+    def get_state(self) -> dict[str, tuple]:
+        """
+        Get the state of every stream drawn from so far.
+
+        Returns:
+            dict[str, tuple]: The state of each stream (see random.Random.getstate), by name.
+        """
+        return {name: stream.getstate() for name, stream in self.__streams.items()}
+
+    def set_state(self, seed: int, state: dict[str, tuple]) -> None:
+        """
+        Restore the seed and streams saved by get_state.
+
+        Args:
+            seed (int): The seed of the game.
+            state (dict[str, tuple]): The state of each stream, by name.
+        """
+        self.seed = seed
+        self.__streams.clear()
+        for name, stream_state in state.items():
+            self.get_stream(name).setstate(stream_state)
+
+    def reset(self) -> None:
+        """
+        Rewind every stream back to its start.
+        """
+        for name, stream in self.__streams.items():
+            stream.seed(f"{self.seed}:{name}")
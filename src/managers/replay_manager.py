@@ -0,0 +1,351 @@
+"""
+Leafy Legions: ReplayManager
+
+This module contains the ReplayManager class
+for recording the player's commands during a game, and playing them back
+"""
+# Standard Imports
+from bisect import bisect_left, bisect_right
+from enum import IntEnum
+import struct
+from typing import TYPE_CHECKING, Any
+import zlib
+
+# Local Imports
+from src.constants import GRID_SIZE
+from src.entities import registry
+from src.managers.save_manager import SaveManager
+
+# The following packages are imported only for type hinting.
+# They are not used in this package, preventing circular dependency errors.
+if TYPE_CHECKING:
+    from src.managers import GameManager, WaveManager
+
+REPLAY_MAGIC: bytes = b"LLRP"
+REPLAY_VERSION: int = 1
+REPLAY_EXTENSION: str = ".llr"
+REPLAY_HEADER = struct.Struct("<BQ?")  # Version, seed, whether the game ran on the vectorized engine
+KEYFRAME_INTERVAL: int = 5  # Waves between keyframes
+
+# A recorded command: (tick, command, arguments)
+ReplayEntry = tuple[int, 'ReplayCommand', tuple]
+# A snapshot of the game, taken just after a wave began: (wave, tick, saved game (see SaveManager.to_bytes))
+Keyframe = tuple[int, int, bytes]
+
+
+class ReplayCommand(IntEnum):
+    """
+    Enum for the commands a player can give, as stored in replay files
+    """
+    END = 0  # The recording stopped (no arguments)
+    PLACE = 1  # Place a plant (plant class name, x, y)
+    DIG = 2  # Dig up a plant (x, y)
+    SPEED = 3  # Change the game speed (speed)
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """
+    Append an unsigned integer to a buffer, 7 bits per byte (small numbers take a single byte).
+
+    Args:
+        buffer (bytearray): The buffer to append to.
+        value (int): The integer, at least 0.
+    """
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """
+    Read an unsigned integer written by write_varint.
+
+    Args:
+        data (bytes): The data to read from.
+        offset (int): The position of the integer in the data.
+
+    Returns:
+        tuple[int, int]: The integer, and the position after it.
+    """
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class ReplayManager:
+    """
+    The ReplayManager records the commands given during a game with the tick they were given on,
+    so that together with the game's seed the game can be simulated again exactly.
+
+    The two engines do not simulate a game identically, so a replay also records the engine it was recorded on.
+
+    Replays are stored in a compact binary format: a header with the seed, the engine and the names of the
+    plant classes used, followed by one record per command, holding the number of ticks since
+    the previous command, the command, and its arguments (cells are stored as column/row).
+    Every few waves a keyframe (the game saved by the SaveManager, compressed in the file) is stored too,
+    listed in a seek index, so playback can jump to a wave without simulating the waves before it.
+    """
+    def __init__(self,
+                 seed: int,
+                 entries: list[ReplayEntry] | None = None,
+                 keyframes: list[Keyframe] | None = None,
+                 keyframe_interval: int = KEYFRAME_INTERVAL,
+                 vectorized: bool = False
+                 ) -> None:
+        """
+        Initialize a ReplayManager object.
+
+        Args:
+            seed (int): The seed of the recorded game.
+            entries (list[ReplayEntry] | None): The recorded commands, in order. Default: None (nothing recorded)
+            keyframes (list[Keyframe] | None): The recorded keyframes, in order. Default: None (nothing recorded)
+            keyframe_interval (int): Waves between keyframes, 0 to record none. Default: KEYFRAME_INTERVAL
+            vectorized (bool): Whether the game ran on the vectorized (NumPy) engine. Default: False
+        """
+        self.seed = seed
+        self.vectorized = vectorized
+        self.entries: list[ReplayEntry] = entries or []
+        self.keyframes: list[Keyframe] = keyframes or []
+        self.keyframe_interval = keyframe_interval
+        self.__cursor: int = 0  # The next entry to play back
+
+    def record(self, tick: int, command: ReplayCommand, *arguments: Any) -> None:
+        """
+        Record a command. Commands are played back before the tick they were given on is simulated.
+
+        Args:
+            tick (int): The tick the command was given on.
+            command (ReplayCommand): The command.
+            *arguments (Any): The arguments of the command (see ReplayCommand).
+        """
+        if self.is_finished():
+            return
+        self.entries.append((tick, command, arguments))
+
+    def finish(self, tick: int) -> None:
+        """
+        Stop recording.
+
+        Args:
+            tick (int): The tick the recording stopped on.
+        """
+        if not self.is_finished():
+            self.entries.append((tick, ReplayCommand.END, ()))
+
+    def add_keyframe(self, game_manager: 'GameManager', wave_manager: 'WaveManager') -> None:
+        """
+        Record a keyframe, if the wave that just began is due one.
+
+        Args:
+            game_manager (GameManager): The game manager of the recorded game.
+            wave_manager (WaveManager): The wave manager of the recorded game.
+        """
+        wave = wave_manager.get_wave()
+        if self.is_finished() or not self.keyframe_interval or wave % self.keyframe_interval:
+            return
+
+        # Only the snapshot is taken now, keyframes are compressed when the replay is encoded
+        data = SaveManager(game_manager, wave_manager).to_bytes()
+        self.keyframes.append((wave, game_manager.clock.ticks, data))
+
+    def seek(self, wave: int, game_manager: 'GameManager', wave_manager: 'WaveManager') -> bool:
+        """
+        Restore the last keyframe at or before a wave into a game, and play back the commands from there on.
+
+        Args:
+            wave (int): The wave to seek to.
+            game_manager (GameManager): The game manager to restore the keyframe into.
+            wave_manager (WaveManager): The wave manager to restore the keyframe into.
+
+        Returns:
+            bool: True if a keyframe was restored, and the game still has to be simulated up to the wave,
+                False if there is no keyframe before the wave (play back from the start).
+        """
+        index = bisect_right(self.keyframes, wave, key=lambda keyframe: keyframe[0])
+        if not index:
+            return False
+
+        _, tick, data = self.keyframes[index - 1]
+        SaveManager(game_manager, wave_manager).from_bytes(data)
+        # Commands on the keyframe's tick were given after the wave began, so they still have to be played back
+        self.__cursor = bisect_left(self.entries, tick, key=lambda entry: entry[0])
+        return True
+
+    def is_finished(self) -> bool:
+        """
+        Check if the recording has stopped.
+
+        Returns:
+            bool: True if the recording has stopped, False otherwise.
+        """
+        return bool(self.entries) and self.entries[-1][1] is ReplayCommand.END
+
+    def get_end_tick(self) -> int | None:
+        """
+        Get the tick the recording stopped on.
+
+        Returns:
+            int | None: The tick, or None if the recording has not stopped.
+        """
+        return self.entries[-1][0] if self.is_finished() else None
+
+    def apply(self, game_manager: 'GameManager') -> None:
+        """
+        Play back the commands given up to the current tick of a game.
+
+        Args:
+            game_manager (GameManager): The game manager to give the commands to.
+        """
+        entries, tick = self.entries, game_manager.clock.ticks
+        while self.__cursor < len(entries) and entries[self.__cursor][0] <= tick:
+            _, command, arguments = entries[self.__cursor]
+            self.__cursor += 1
+            match command:
+                case ReplayCommand.PLACE:
+                    class_name, x, y = arguments
+                    game_manager.place_plant(registry.get_class(class_name), x, y)
+                case ReplayCommand.DIG:
+                    game_manager.dig_plant(*arguments)
+                case ReplayCommand.SPEED:
+                    game_manager.game_speed = arguments[0]
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the replay.
+
+        Returns:
+            bytes: The encoded replay.
+        """
+        names = list(dict.fromkeys(arguments[0] for _, command, arguments in self.entries
+                                   if command is ReplayCommand.PLACE))
+
+        buffer = bytearray(REPLAY_MAGIC)
+        buffer += REPLAY_HEADER.pack(REPLAY_VERSION, self.seed, self.vectorized)
+        write_varint(buffer, len(names))
+        for name in names:
+            encoded_name = name.encode()
+            write_varint(buffer, len(encoded_name))
+            buffer += encoded_name
+
+        write_varint(buffer, len(self.entries))
+        previous_tick = 0
+        for tick, command, arguments in self.entries:
+            write_varint(buffer, tick - previous_tick)
+            buffer.append(command)
+            previous_tick = tick
+            match command:
+                case ReplayCommand.PLACE:
+                    class_name, x, y = arguments
+                    write_varint(buffer, names.index(class_name))
+                    buffer += bytes((x // GRID_SIZE, y // GRID_SIZE))
+                case ReplayCommand.DIG:
+                    x, y = arguments
+                    buffer += bytes((x // GRID_SIZE, y // GRID_SIZE))
+                case ReplayCommand.SPEED:
+                    write_varint(buffer, arguments[0])
+
+        # The seek index, followed by the keyframes themselves
+        compressed = [zlib.compress(data) for _, _, data in self.keyframes]
+        write_varint(buffer, len(self.keyframes))
+        for (wave, tick, _), data in zip(self.keyframes, compressed):
+            write_varint(buffer, wave)
+            write_varint(buffer, tick)
+            write_varint(buffer, len(data))
+        for data in compressed:
+            buffer += data
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ReplayManager':
+        """
+        Decode a replay.
+
+        Args:
+            data (bytes): The encoded replay.
+
+        Returns:
+            ReplayManager: The decoded replay, ready to be played back.
+
+        Raises:
+            ValueError: If the data is not a replay, or a replay of an unsupported version.
+        """
+        if data[:len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+            raise ValueError("Not a Leafy Legions replay")
+        version, seed, vectorized = REPLAY_HEADER.unpack_from(data, len(REPLAY_MAGIC))
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        offset = len(REPLAY_MAGIC) + REPLAY_HEADER.size
+
+        names = []
+        name_count, offset = read_varint(data, offset)
+        for _ in range(name_count):
+            length, offset = read_varint(data, offset)
+            names.append(data[offset:offset + length].decode())
+            offset += length
+
+        entries: list[ReplayEntry] = []
+        entry_count, offset = read_varint(data, offset)
+        tick = 0
+        for _ in range(entry_count):
+            delta, offset = read_varint(data, offset)
+            tick += delta
+            command = ReplayCommand(data[offset])
+            offset += 1
+            match command:
+                case ReplayCommand.PLACE:
+                    name_index, offset = read_varint(data, offset)
+                    column, row = data[offset], data[offset + 1]
+                    offset += 2
+                    arguments = (names[name_index], column * GRID_SIZE, row * GRID_SIZE)
+                case ReplayCommand.DIG:
+                    arguments = (data[offset] * GRID_SIZE, data[offset + 1] * GRID_SIZE)
+                    offset += 2
+                case ReplayCommand.SPEED:
+                    speed, offset = read_varint(data, offset)
+                    arguments = (speed,)
+                case _:
+                    arguments = ()
+            entries.append((tick, command, arguments))
+
+        index = []
+        keyframe_count, offset = read_varint(data, offset)
+        for _ in range(keyframe_count):
+            wave, offset = read_varint(data, offset)
+            tick, offset = read_varint(data, offset)
+            length, offset = read_varint(data, offset)
+            index.append((wave, tick, length))
+        keyframes: list[Keyframe] = []
+        for wave, tick, length in index:
+            keyframes.append((wave, tick, zlib.decompress(data[offset:offset + length])))
+            offset += length
+        return cls(seed, entries, keyframes, vectorized=vectorized)
+
+    def save(self, path: str) -> None:
+        """
+        Save the replay to a file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'ReplayManager':
+        """
+        Load a replay from a file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            ReplayManager: The loaded replay, ready to be played back.
+        """
+        with open(path, "rb") as replay_file:
+            return cls.from_bytes(replay_file.read())
@@ -0,0 +1,113 @@
+"""
+Leafy Legions: SamplerManager
+
+This module contains the SamplerManager class
+for profiling the game by sampling the call stack of its main thread
+"""
+# Standard Imports
+from collections import Counter
+import os
+import sys
+import threading
+from types import CodeType, FrameType
+
+# Local Imports
+from src.constants import PROFILE_SAMPLE_RATE
+
+
+class SamplerManager:
+    """
+    The SamplerManager is a statistical profiler: a background thread looks at the call stack of the main thread
+    a fixed number of times per second, and counts how often each stack is seen. Unlike cProfile, the profiled
+    code is not slowed down by every call, so the hot loops keep their real timings.
+
+    The counts are saved as collapsed stacks ("main.py:<module>;screen_manager.py:ScreenManager.run_current_screen 42"),
+    the input of flamegraph.pl, speedscope (https://www.speedscope.app) and similar tools.
+    """
+    def __init__(self, rate: float = PROFILE_SAMPLE_RATE, thread_id: int | None = None) -> None:
+        """
+        Initialize a SamplerManager object.
+
+        Args:
+            rate (float): The number of samples per second. Default: PROFILE_SAMPLE_RATE
+            thread_id (int | None): The identifier of the thread to sample. Default: None (the main thread)
+        """
+        self.interval: float = 1 / rate
+        self.thread_id: int = thread_id if thread_id is not None else threading.main_thread().ident
+        self.stacks: Counter[str] = Counter()  # Number of samples of each collapsed stack
+        # Label of each function seen, i.e. "game_manager.py:GameManager.update"
+        self.__labels: dict[CodeType, str] = {}
+        self.__stopped = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def is_running(self) -> bool:
+        """
+        Check if the profiler is sampling.
+
+        Returns:
+            bool: True if the profiler is sampling, False otherwise.
+        """
+        return self.__thread is not None
+
+    def start(self) -> None:
+        """
+        Start sampling, adding to the samples taken so far.
+        """
+        if self.__thread is not None:
+            return
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__sample, name="Sampler", daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop sampling, waiting for the background thread to finish.
+        """
+        if self.__thread is None:
+            return
+        self.__stopped.set()
+        self.__thread.join()
+        self.__thread = None
+
+    def collapse(self, frame: FrameType) -> str:
+        """
+        Collapse a call stack into a single line.
+
+        Args:
+            frame (FrameType): The innermost frame of the stack.
+
+        Returns:
+            str: The label of each function in the stack, outermost first, separated by semicolons.
+        """
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self.__labels.get(code)
+            if label is None:
+                label = self.__labels[code] = f"{os.path.basename(code.co_filename)}:{code.co_qualname}"
+            labels.append(label)
+            frame = frame.f_back
+        return ";".join(reversed(labels))
+
+    def __sample(self) -> None:
+        """
+        Sample the stack of the profiled thread until the profiler is stopped (runs on the background thread).
+        """
+        while not self.__stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self.collapse(frame)] += 1
+
+    def save(self, path: str) -> None:
+        """
+        Save the samples taken so far as collapsed stacks, the most sampled first.
+
+        Args:
+            path (str): The path of the file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as profile_file:
+            for stack, count in self.stacks.most_common():
+                profile_file.write(f"{stack} {count}\n")
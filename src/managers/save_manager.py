@@ -0,0 +1,346 @@
+"""
+Leafy Legions: SaveManager
+
+This module contains the SaveManager class
+for saving the state of a game to a compact binary file, and loading it back
+"""
+# Standard Imports
+import os
+import random
+import struct
+from typing import TYPE_CHECKING
+import zlib
+
+# Local Imports
+from src.entities import Plant, Zombie, Projectile, registry
+from src.managers import tracer
+
+# The following packages are imported only for type hinting.
+# They are not used in this package, preventing circular dependency errors.
+if TYPE_CHECKING:
+    from src.entities import Entity
+    from src.managers import GameManager, WaveManager
+    from src.managers.batch_manager import EntityArrays
+
+SAVE_MAGIC: bytes = b"LLSV"
+SAVE_VERSION: int = 1
+SAVE_EXTENSION: str = ".lls"
+
+# Little-endian records, see SaveManager for the layout
+HEADER = struct.Struct("<4sBQ?")  # Magic, version, seed, whether the game ran on the vectorized engine
+GAME = struct.Struct("<qqbIIdd")  # Coins, tick, game speed, wave, zombies in the wave, special zombie step and cap
+# Whether zombies are waiting to spawn, the schedule's seed, start tick, zombies spawned
+SPAWNS = struct.Struct("<?QqI")
+STREAM = struct.Struct("<625I?d")  # Mersenne Twister state and position, whether a gaussian is cached, the gaussian
+COUNT = struct.Struct("<I")
+
+# The columns saved for each base class of entity, after the column of class indices: (attribute, struct format)
+# The next attack tick is private to each entity, and read and written through its getter and setter
+ENTITY_COLUMNS: dict[type['Entity'], tuple[tuple[str, str], ...]] = {
+    Plant: (("x", "i"), ("y", "h"), ("health", "i"), ("next_attack", "q")),
+    Zombie: (("x", "d"), ("y", "h"), ("health", "i"), ("next_attack", "q")),
+    Projectile: (("x", "d"), ("y", "h")),
+}
+
+
+class SaveManager:
+    """
+    The SaveManager saves everything the GameManager and WaveManager hold to bytes, and restores it.
+
+    A save is made of a header (with the engine the game ran on), the game record (coins, clock, wave,
+    spawn schedule), the state of every random number stream, a table of the entity class names used,
+    then the plants, zombies and projectiles.
+    Entities are saved column by column (a count, then every class index, every x-coordinate, ...),
+    so each column is packed or unpacked in a single call, straight from the batch arrays when vectorized.
+    State that can be derived from the entities (lanes, schedules, blocked zombies) is rebuilt on load.
+    """
+    def __init__(self, game_manager: 'GameManager', wave_manager: 'WaveManager') -> None:
+        """
+        Initialize a SaveManager object.
+
+        Args:
+            game_manager (GameManager): The game manager to save and restore.
+            wave_manager (WaveManager): The wave manager to save and restore.
+        """
+        self.game_manager = game_manager
+        self.wave_manager = wave_manager
+
+    @tracer.traced
+    def to_bytes(self) -> bytes:
+        """
+        Save the game. This should be called between ticks.
+
+        Returns:
+            bytes: The saved game.
+        """
+        game_manager, wave_manager = self.game_manager, self.wave_manager
+        chunks = [
+            HEADER.pack(SAVE_MAGIC, SAVE_VERSION, game_manager.random.seed, game_manager.batch is not None),
+            GAME.pack(game_manager.get_coins(), game_manager.clock.ticks, game_manager.game_speed,
+                      wave_manager.get_wave(), wave_manager.get_num_zombies(),
+                      wave_manager.special_weight_step, wave_manager.special_weight_cap),
+            SPAWNS.pack(wave_manager.get_spawn_state() is not None, *(wave_manager.get_spawn_state() or (0, 0, 0)))
+        ]
+
+        streams = game_manager.random.get_state()
+        chunks.append(bytes((len(streams),)))
+        for name, (_, internal_state, gauss_next) in streams.items():
+            chunks.append(pack_name(name))
+            chunks.append(STREAM.pack(*internal_state, gauss_next is not None, gauss_next or 0.0))
+
+        # Batched entities are saved in the order of the batch arrays, so their columns can be copied as a whole
+        entity_lists = {}
+        for base_class in ENTITY_COLUMNS:
+            arrays = game_manager.batch.arrays.get(base_class) if game_manager.batch else None
+            entities = arrays.entities if arrays else game_manager.get_entities(base_class)
+            entity_lists[base_class] = [entity for entity in entities if entity.alive], arrays
+
+        class_names = list(dict.fromkeys(type(entity).__name__
+                                         for entities, _ in entity_lists.values() for entity in entities))
+        class_indices = {name: index for index, name in enumerate(class_names)}
+        chunks.append(bytes((len(class_names),)))
+        chunks.extend(pack_name(name) for name in class_names)
+
+        for base_class, columns in ENTITY_COLUMNS.items():
+            entities, arrays = entity_lists[base_class]
+            count = len(entities)
+            chunks.append(COUNT.pack(count))
+            chunks.append(struct.pack(f"<{count}B", *[class_indices[type(entity).__name__] for entity in entities]))
+            for name, column_format in columns:
+                chunks.append(struct.pack(f"<{count}{column_format}", *get_column(entities, arrays, name)))
+        return b"".join(chunks)
+
+    def from_bytes(self, data: bytes) -> None:
+        """
+        Restore a saved game, replacing the current one.
+        The whole save is read before the current game is touched, so a save that can not be loaded leaves it as is.
+        A restored game can not be replayed from its seed, so the game manager stops recording its replay.
+
+        Args:
+            data (bytes): The saved game.
+
+        Raises:
+            ValueError: If the data is not a saved game, a save of an unsupported version, a truncated or corrupt save,
+                a game saved on the other engine, or uses an entity class that does not exist.
+        """
+        try:
+            seed, game_record, spawn_state, streams, entities = self.__read(data)
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError("Corrupt Leafy Legions save") from e
+        coins, tick, game_speed, wave, num_zombies, special_weight_step, special_weight_cap = game_record
+
+        game_manager, wave_manager = self.game_manager, self.wave_manager
+        game_manager.reset()
+        game_manager.replay = None
+        game_manager.set_coins(coins)
+        game_manager.clock.ticks = tick
+        game_manager.game_speed = game_speed
+        game_manager.random.set_state(seed, streams)
+        wave_manager.set_wave(wave, num_zombies)
+        wave_manager.special_weight_step = special_weight_step
+        wave_manager.special_weight_cap = special_weight_cap
+        wave_manager.set_spawn_state(spawn_state)
+        game_manager.add_all(entities)
+
+    def __read(self, data: bytes) -> tuple[int, tuple, tuple[int, int, int] | None, dict[str, tuple], list['Entity']]:
+        """
+        Read every section of a saved game, without changing the current game.
+
+        Args:
+            data (bytes): The saved game.
+
+        Returns:
+            tuple[int, tuple, tuple[int, int, int] | None, dict[str, tuple], list[Entity]]: The seed, the game record
+                (see GAME), the spawn state, the state of each random number stream, and the entities (not added yet).
+
+        Raises:
+            ValueError: If the data is not a saved game, or can not be loaded into the current game.
+            struct.error, IndexError, UnicodeDecodeError: If the save is truncated or corrupt.
+        """
+        magic, version, seed, vectorized = HEADER.unpack_from(data)
+        if magic != SAVE_MAGIC:
+            raise ValueError("Not a Leafy Legions save")
+        if version != SAVE_VERSION:
+            raise ValueError(f"Unsupported save version {version}")
+        # The engines do not simulate a game identically, so a game is only continued on the engine it ran on
+        if vectorized != (self.game_manager.batch is not None):
+            raise ValueError(f"The game was saved on the {'vectorized' if vectorized else 'lane'} engine")
+        offset = HEADER.size
+
+        game_record = GAME.unpack_from(data, offset)
+        offset += GAME.size
+
+        spawning, *spawn_state = SPAWNS.unpack_from(data, offset)
+        offset += SPAWNS.size
+        spawn_state = tuple(spawn_state) if spawning else None
+
+        streams = {}
+        stream_count = data[offset]
+        offset += 1
+        for _ in range(stream_count):
+            name, offset = unpack_name(data, offset)
+            *internal_state, has_gauss, gauss_next = STREAM.unpack_from(data, offset)
+            offset += STREAM.size
+            # Version 3 is the state format of random.Random
+            streams[name] = (3, tuple(internal_state), gauss_next if has_gauss else None)
+            random.Random().setstate(streams[name])  # Raises ValueError if the state is invalid
+
+        entity_classes = []
+        class_count = data[offset]
+        offset += 1
+        for _ in range(class_count):
+            name, offset = unpack_name(data, offset)
+            entity_class = registry.get_class(name)
+            if entity_class is None:
+                raise ValueError(f"Unknown entity class {name}")
+            entity_classes.append(entity_class)
+
+        entities = []
+        for base_class, columns in ENTITY_COLUMNS.items():
+            (count,) = COUNT.unpack_from(data, offset)
+            offset += COUNT.size
+            class_column = struct.unpack_from(f"<{count}B", data, offset)
+            offset += count
+            if not all(issubclass(entity_classes[index], base_class) for index in set(class_column)):
+                raise ValueError(f"Corrupt Leafy Legions save, a {base_class.__name__} column holds another class")
+            values = {}
+            for name, column_format in columns:
+                column_struct = struct.Struct(f"<{count}{column_format}")
+                values[name] = column_struct.unpack_from(data, offset)
+                offset += column_struct.size
+            entities.extend(self.__create_entities(entity_classes, class_column, values))
+        return seed, game_record, spawn_state, streams, entities
+
+    def __create_entities(self,
+                          entity_classes: list[type['Entity']],
+                          class_column: tuple[int, ...],
+                          values: dict[str, tuple]
+                          ) -> list['Entity']:
+        """
+        Create the saved entities of a base class, without calling __init__: each column is written straight
+        into its slot, and the other slots are set to their default (see Entity.get_defaults).
+
+        Args:
+            entity_classes (list[type[Entity]]): The entity class of each class index.
+            class_column (tuple[int, ...]): The class index of each entity.
+            values (dict[str, tuple]): The saved columns, by attribute name.
+
+        Returns:
+            list[Entity]: The entities, ready to be added to the game manager.
+        """
+        column_slots = [name for name in values if name != "next_attack"]
+        skipped_slots = {*column_slots, "game_manager"}
+        class_slots = [[(slot, value) for slot, value in entity_class.get_defaults().items()
+                        if slot not in skipped_slots] for entity_class in entity_classes]
+
+        entities = [entity_classes[class_index].__new__(entity_classes[class_index]) for class_index in class_column]
+        for entity, class_index in zip(entities, class_column):
+            entity.game_manager = self.game_manager
+            for slot, value in class_slots[class_index]:
+                setattr(entity, slot, value)
+        for name in column_slots:
+            for entity, value in zip(entities, values[name]):
+                setattr(entity, name, value)
+        if "next_attack" in values:
+            for entity, next_attack in zip(entities, values["next_attack"]):
+                entity.set_next_attack(next_attack)
+        return entities
+
+    def save(self, path: str) -> None:
+        """
+        Save the game to a file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        self.write(path, self.to_bytes())
+
+    @staticmethod
+    @tracer.traced
+    def write(path: str, data: bytes) -> None:
+        """
+        Compress a saved game and write it to a file, replacing the file in a single step,
+        so a crash while writing never leaves a partly written save behind.
+        Only touches its arguments, so it can be called from any thread.
+
+        Args:
+            path (str): The path of the file.
+            data (bytes): The saved game (see to_bytes).
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as save_file:
+            save_file.write(zlib.compress(data))
+            save_file.flush()
+            os.fsync(save_file.fileno())
+        os.replace(temporary_path, path)
+
+    def load(self, path: str) -> None:
+        """
+        Restore a saved game from a file, replacing the current one.
+
+        Args:
+            path (str): The path of the file.
+
+        Raises:
+            ValueError: If the file is not a saved game, or can not be loaded (see from_bytes).
+        """
+        with open(path, "rb") as save_file:
+            data = save_file.read()
+        if not data.startswith(SAVE_MAGIC):
+            try:
+                data = zlib.decompress(data)
+            except zlib.error as e:
+                raise ValueError("Not a Leafy Legions save") from e
+        self.from_bytes(data)
+
+
+def get_column(entities: list['Entity'], arrays: 'EntityArrays | None', name: str) -> list:
+    """
+    Get an attribute of every entity.
+
+    Args:
+        entities (list[Entity]): The entities, in the order of their batch arrays if they are batched.
+        arrays (EntityArrays | None): The batch arrays holding the entities, if they are batched.
+        name (str): The name of the attribute.
+
+    Returns:
+        list: The attribute of each entity.
+    """
+    if name == "next_attack":
+        return [entity.get_next_attack() for entity in entities]
+    # The state of batched entities is read from the arrays in one go
+    if arrays and name in arrays.state:
+        return arrays.view(name).tolist()
+    return [getattr(entity, name) for entity in entities]
+
+
+def pack_name(name: str) -> bytes:
+    """
+    Encode a name, prefixed by its length.
+
+    Args:
+        name (str): The name, at most 255 bytes long.
+
+    Returns:
+        bytes: The encoded name.
+    """
+    encoded_name = name.encode()
+    return bytes((len(encoded_name),)) + encoded_name
+
+
+def unpack_name(data: bytes, offset: int) -> tuple[str, int]:
+    """
+    Decode a name encoded by pack_name.
+
+    Args:
+        data (bytes): The data to read from.
+        offset (int): The position of the name in the data.
+
+    Returns:
+        tuple[str, int]: The name, and the position after it.
+    """
+    length = data[offset]
+    return data[offset + 1:offset + 1 + length].decode(), offset + 1 + length
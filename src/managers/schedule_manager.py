@@ -0,0 +1,113 @@
+"""
+Leafy Legions: ScheduleManager
+
+This module contains the ScheduleManager class
+for waking entities only on the ticks they are able to act
+"""
+# Standard Imports
+import heapq
+from typing import Hashable, Iterable, Iterator
+
+
+class ScheduleManager:
+    """
+    The ScheduleManager is a priority queue of entity handles, keyed by the tick
+    each entity is next able to act (i.e. its attack cooldown has expired).
+    Entities that are ready but have nothing to act on can be parked under a key
+    (i.e. their lane) until something wakes that key up.
+    """
+    def __init__(self) -> None:
+        """
+        Initialize a ScheduleManager object.
+        """
+        self.__queue: list[tuple[int, int, int]] = []  # (tick, order, handle), a min-heap
+        self.__order: int = 0  # Keeps entities scheduled for the same tick in order
+        self.__wake_ticks: dict[int, int] = {}  # The tick each scheduled handle wakes up at
+        self.__parked: dict[Hashable, list[int]] = {}  # The handles parked under each key
+
+    def schedule(self, handle: int, tick: int) -> None:
+        """
+        Wake an entity up on a tick, replacing any tick it was scheduled for.
+
+        Args:
+            handle (int): The handle of the entity.
+            tick (int): The tick to wake the entity up on.
+        """
+        if self.__wake_ticks.get(handle) == tick:
+            return
+        self.__wake_ticks[handle] = tick
+        self.__order += 1
+        heapq.heappush(self.__queue, (tick, self.__order, handle))
+
+    def schedule_all(self, wake_ups: Iterable[tuple[int, int]]) -> None:
+        """
+        Wake many entities up on their ticks (i.e. when loading a saved game), reordering the queue once.
+
+        Args:
+            wake_ups (Iterable[tuple[int, int]]): The handle of each entity, and the tick to wake it up on.
+        """
+        queue, wake_ticks = self.__queue, self.__wake_ticks
+        for handle, tick in wake_ups:
+            if wake_ticks.get(handle) == tick:
+                continue
+            wake_ticks[handle] = tick
+            self.__order += 1
+            queue.append((tick, self.__order, handle))
+        heapq.heapify(queue)
+
+    def cancel(self, handle: int) -> None:
+        """
+        Stop an entity from being woken up.
+
+        Args:
+            handle (int): The handle of the entity.
+        """
+        # The queue entry is left in place, and skipped once it reaches the front
+        self.__wake_ticks.pop(handle, None)
+
+    def pop_due(self, tick: int) -> Iterator[int]:
+        """
+        Take every entity scheduled on or before a tick off the queue, in the order they are due.
+
+        Args:
+            tick (int): The current tick.
+
+        Yields:
+            int: The handle of each entity that is due.
+        """
+        queue, wake_ticks = self.__queue, self.__wake_ticks
+        while queue and queue[0][0] <= tick:
+            due_tick, _, handle = heapq.heappop(queue)
+            if wake_ticks.get(handle) == due_tick:  # Otherwise it was cancelled or rescheduled
+                del wake_ticks[handle]
+                yield handle
+
+    def park(self, handle: int, key: Hashable) -> None:
+        """
+        Park an entity under a key until the key is woken up.
+
+        Args:
+            handle (int): The handle of the entity.
+            key (Hashable): The key to park the entity under.
+        """
+        self.__parked.setdefault(key, []).append(handle)
+
+    def wake(self, key: Hashable) -> list[int]:
+        """
+        Take every entity parked under a key.
+
+        Args:
+            key (Hashable): The key the entities are parked under.
+
+        Returns:
+            list[int]: The handles of the parked entities, for the caller to schedule.
+        """
+        return self.__parked.pop(key, [])
+
+    def clear(self) -> None:
+        """
+        Remove every scheduled and parked entity.
+        """
+        self.__queue.clear()
+        self.__wake_ticks.clear()
+        self.__parked.clear()
@@ -11,7 +11,7 @@ import inspect
 import pygame
 
 # Local Imports
-from src.managers import DatabaseManager, SoundManager
+from src.managers import DatabaseManager, SoundManager, ProfileManager, HistogramManager, tracer
 from src import screens
 
 
@@ -46,6 +46,8 @@ class ScreenManager:
         self.__running = True
         self.database_manager = DatabaseManager()
         self.sound_manager = SoundManager()
+        self.profile_manager = ProfileManager()
+        self.histogram_manager = HistogramManager()
         self.display = display
         self.current_screen = None
         self.valid_screens: list[str] = _get_valid_screens()
@@ -60,9 +62,12 @@ class ScreenManager:
 
     def quit(self):
         """
-        Close the application
+        Close the application, letting the current screen keep its state, and printing the frame times of the session
         """
+        if self.current_screen:
+            self.current_screen.quit()
         self.__running = False
+        print(self.histogram_manager.get_report())
 
     def set_screen(self, screen_name: str) -> None:
         """
@@ -76,10 +81,12 @@ class ScreenManager:
         """
         if screen_name in self.valid_screens:
             screen_class = getattr(screens, screen_name)
+            self.profile_manager.counts.clear()  # Counts belong to the screen that set them
             self.current_screen = screen_class(display=self.display, screen_manager=self)
         else:
             raise ValueError("Invalid screen name")
 
+    @tracer.traced
     def run_current_screen(self) -> None:
         """
         Run the game loop of the current screen.
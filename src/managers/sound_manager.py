@@ -11,16 +11,24 @@ import sys
 # Library Imports
 import pygame
 
+# Local Imports
+from src.managers import metrics
+
 
 class SoundManager:
     """
     Functions to play sounds and music in the application
     """
-    def __init__(self):
+    def __init__(self, enabled: bool = True):
         """
         Initialize a SoundManager object.
+
+        Args:
+            enabled (bool): Whether to use the audio mixer at all (False when running headless). Default: True
         """
-        pygame.mixer.init()
+        self.enabled = enabled
+        if enabled:
+            pygame.mixer.init()
         self.paused = False
         self.muted = False
         self.volume = 0.05
@@ -37,6 +45,8 @@ class SoundManager:
         Raises:
             FileNotFoundError: If no music is found
         """
+        if not self.enabled:
+            return
         if getattr(sys, 'frozen', False):
             music_path = os.path.join(sys._MEIPASS, f"src/assets/music/{music_file}")
         else:
@@ -63,6 +73,8 @@ class SoundManager:
         Raises:
             FileNotFoundError: If no sound is found
         """
+        if not self.enabled:
+            return
         if getattr(sys, 'frozen', False):
             sound_path = os.path.join(sys._MEIPASS, f"src/assets/sounds/{effect_file}")
         else:
@@ -70,6 +82,7 @@ class SoundManager:
         if os.path.exists(sound_path):
             if not self.muted:
                 sound = pygame.mixer.Sound(sound_path)
+                metrics.count("sound_creations")
                 sound.set_volume(volume)
                 sound.play()
         else:
@@ -79,35 +92,25 @@ class SoundManager:
         """
         Pause music
         """
-        if option is not None:
-            self.paused = option
-            if self.paused:
-                pygame.mixer.music.pause()
-            else:
-                pygame.mixer.music.unpause()
+        self.paused = option if option is not None else not self.paused
+        if not self.enabled:
+            return
+        if self.paused:
+            pygame.mixer.music.pause()
         else:
-            if self.paused:
-                pygame.mixer.music.unpause()
-            else:
-                pygame.mixer.music.pause()
-            self.paused = not self.paused
+            pygame.mixer.music.unpause()
 
     def mute_sounds(self, option: bool = None) -> None:
         """
         Mute music
         """
-        if option is not None:
-            self.muted = option
-            if self.muted:
-                pygame.mixer.music.set_volume(0)
-            else:
-                pygame.mixer.music.set_volume(self.volume)
+        self.muted = option if option is not None else not self.muted
+        if not self.enabled:
+            return
+        if self.muted:
+            pygame.mixer.music.set_volume(0)
         else:
-            if self.muted:
-                pygame.mixer.music.set_volume(self.volume)
-            else:
-                pygame.mixer.music.set_volume(0)
-            self.muted = not self.muted
+            pygame.mixer.music.set_volume(self.volume)
 
     def reset(self) -> None:
         """
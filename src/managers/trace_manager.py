@@ -0,0 +1,138 @@
+"""
+Leafy Legions: TraceManager
+
+This module contains the TraceManager class
+for recording when each frame, phase and slow call runs, and saving them as a Chrome trace
+"""
+# Standard Imports
+from collections import deque
+from contextlib import contextmanager
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+# Local Imports
+from src.constants import TRACE_CAPACITY
+
+
+class TraceManager:
+    """
+    The TraceManager records a span (a name, a start time and a duration) for each frame, phase of a frame
+    and traced call (i.e. database calls), on any thread, and saves them in the Chrome trace-event format,
+    which can be opened in Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+
+    Spans are kept in a ring buffer, so a session can be traced for hours: only the latest spans are kept,
+    and recording a span costs a single append. Nothing is recorded until the tracer is started.
+    """
+    def __init__(self, capacity: int = TRACE_CAPACITY) -> None:
+        """
+        Initialize a TraceManager object.
+
+        Args:
+            capacity (int): The number of spans kept. Default: TRACE_CAPACITY
+        """
+        self.enabled: bool = False
+        self.__spans: deque[tuple[str, float, float, int]] = deque(maxlen=capacity)  # Name, start, duration, thread
+        self.__thread_names: dict[int, str] = {}  # Kept as spans are recorded, as threads may end before saving
+
+    def start(self) -> None:
+        """
+        Start recording spans.
+        """
+        self.enabled = True
+
+    def stop(self) -> None:
+        """
+        Stop recording spans, keeping the spans recorded so far.
+        """
+        self.enabled = False
+
+    def record(self, name: str, start_time: float, end_time: float) -> None:
+        """
+        Record a span that already ended, on the current thread.
+
+        Args:
+            name (str): The name of the span, i.e. "Simulation".
+            start_time (float): When the span started (see time.perf_counter), in seconds.
+            end_time (float): When the span ended, in seconds.
+        """
+        if self.enabled:
+            thread_id = threading.get_ident()
+            if thread_id not in self.__thread_names:
+                self.__thread_names[thread_id] = threading.current_thread().name
+            self.__spans.append((name, start_time, end_time - start_time, thread_id))
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Record a span around a block of code.
+
+        Args:
+            name (str): The name of the span.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start_time, time.perf_counter())
+
+    def traced(self, function: Callable) -> Callable:
+        """
+        Decorate a function to record a span, named after the function, every time it is called.
+
+        Args:
+            function (Callable): The function to trace.
+
+        Returns:
+            Callable: The traced function.
+        """
+        name = function.__qualname__
+
+        @functools.wraps(function)
+        def traced_function(*args, **kwargs) -> Any:
+            if not self.enabled:
+                return function(*args, **kwargs)
+            start_time = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(name, start_time, time.perf_counter())
+        return traced_function
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        Get the spans kept as a Chrome trace.
+
+        Returns:
+            dict[str, Any]: The trace, with a complete ("X") event per span and the name of each thread.
+        """
+        spans = list(self.__spans)
+        origin = min((start_time for _, start_time, _, _ in spans), default=0.0)
+        process_id = os.getpid()
+
+        events = [{"name": "thread_name", "ph": "M", "pid": process_id, "tid": thread_id, "args": {"name": name}}
+                  for thread_id, name in self.__thread_names.items()]
+        events += [{"name": name, "cat": "game", "ph": "X", "pid": process_id, "tid": thread_id,
+                    "ts": round((start_time - origin) * 1e6, 1), "dur": round(duration * 1e6, 1)}
+                   for name, start_time, duration, thread_id in spans]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str) -> None:
+        """
+        Save the spans kept as a Chrome trace.
+
+        Args:
+            path (str): The path of the file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as trace_file:
+            json.dump(self.to_json(), trace_file)
+
+
+# The tracer of the running game, shared by every manager and screen
+tracer = TraceManager()
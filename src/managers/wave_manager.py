@@ -5,13 +5,30 @@ This module contains the WaveManager class
 for managing how to spawn zombies in the game
 """
 # Standard Imports
+from array import array
+from bisect import bisect
+from itertools import accumulate, islice
 import math
 import random
+from typing import Iterator
 
 # Local Imports
-from src.constants import GRID_WIDTH, GRID_SIZE
+from src.constants import GRID_WIDTH, GRID_HEIGHT, GRID_SIZE, SPAWN_INTERVAL_S, WAVE_SPAWN_TIME_S
 from src.entities import Projectile, Zombie, SpeedyZombie, HulkingZombie, PolymorphZombie
-from src.managers import GameManager
+from src.managers import GameManager, memory, tracer
+
+# The wave each type of special zombie starts to spawn on
+ZOMBIE_THRESHOLDS: dict[type[Zombie], int] = {
+    SpeedyZombie: 5,
+    HulkingZombie: 10,
+    PolymorphZombie: 15
+}
+
+# Distances zombies can spawn from the right edge of the board, in pixels
+SPAWN_OFFSETS: range = range(-50, 126, 20)
+
+# Zombies drawn at a time by sample_spawns
+SPAWN_CHUNK_SIZE: int = 64
 
 
 class WaveManager:
@@ -30,30 +47,31 @@ class WaveManager:
         self.__wave = 0
         self.__num_zombies = 0
 
-    def calculate_num_zombies(self) -> int:
-        """
-        Calculate the number of zombies to spawn in a wave.
+        # The zombies of a wave enter the board over time, following a spawn schedule (see schedule_spawns)
+        self.__spawn_seed: int | None = None  # The seed of the wave's spawn schedule, None once it is exhausted
+        self.__spawn_start: int = 0  # The tick the wave began on
+        self.__spawned: int = 0  # The number of zombies of the wave spawned so far
+        self.__spawns: Iterator[tuple[int, type[Zombie], int, int]] | None = None  # The rest of the schedule
+        self.__next_spawn: tuple[int, type[Zombie], int, int] | None = None  # The next zombie to spawn
 
-        Returns:
-            int: The number of zombies to spawn in the wave.
-        """
-        if self.__wave <= 3:
-            return self.__wave
-        return self.__wave + math.ceil(3 + math.log(self.__wave, 4))
+        # Share of special zombies gained per wave past their threshold, and the maximum share
+        self.special_weight_step: float = 0.1
+        self.special_weight_cap: float = 0.9
 
-    def calculate_special_zombies(self, zombie_type: type[Zombie], threshold: int) -> list[type[Zombie]]:
+    def calculate_num_zombies(self, wave: int | None = None) -> int:
         """
-        Calculate the number of special zombies to spawn in a wave.
+        Calculate the number of zombies to spawn in a wave.
 
         Args:
-            zombie_type (type[Zombie]): The type of special zombie to spawn.
-            threshold (int): The wave number threshold to start spawning special zombies.
+            wave (int | None): The wave. Default: None (the current wave)
 
         Returns:
-            list[type[Zombie]]: The list of special zombies to spawn.
+            int: The number of zombies to spawn in the wave.
         """
-        weight = min((self.__wave - threshold - 1) * 0.1, 0.9)
-        return [zombie_type] * int(self.__num_zombies * weight)
+        wave = self.__wave if wave is None else wave
+        if wave <= 3:
+            return wave
+        return wave + math.ceil(3 + math.log(wave, 4))
 
     def get_wave(self) -> int:
         """
@@ -61,52 +79,204 @@ class WaveManager:
         """
         return self.__wave
 
+    def get_num_zombies(self) -> int:
+        """
+        Get the number of zombies spawned in the current wave
+        """
+        return self.__num_zombies
+
+    def set_wave(self, wave: int, num_zombies: int) -> None:
+        """
+        Set the wave count and the number of zombies spawned in it (i.e. when loading a saved game)
+        """
+        self.__wave = wave
+        self.__num_zombies = num_zombies
+
     def update_wave(self) -> None:
         """
         Increase the wave count
         """
         self.__wave += 1
 
-    def calculate_zombie_roles(self) -> list[type[Zombie]]:
+    def calculate_zombie_counts(self, wave: int | None = None) -> dict[type[Zombie], int]:
         """
-        Calculate the roles of zombies to spawn in a wave.
+        Calculate how many zombies of each type spawn in a wave, in constant time.
+
+        Each type of special zombie makes up a share of the wave growing by special_weight_step every wave
+        past its threshold, up to special_weight_cap. Regular zombies make up the rest, if any is left.
+
+        Args:
+            wave (int | None): The wave. Default: None (the current wave)
 
         Returns:
-            list[type[Zombie]]: The list of zombies to spawn.
+            dict[type[Zombie], int]: The number of zombies of each type, special zombies first.
+        """
+        if wave is None:
+            wave, num_zombies = self.__wave, self.__num_zombies
+        else:
+            num_zombies = self.calculate_num_zombies(wave)
+
+        zombie_counts = {}
+        for zombie_type, threshold in ZOMBIE_THRESHOLDS.items():
+            if wave >= threshold:
+                weight = min((wave - threshold) * self.special_weight_step, self.special_weight_cap)
+                zombie_counts[zombie_type] = int(num_zombies * weight)
+        zombie_counts[Zombie] = max(num_zombies - sum(zombie_counts.values()), 0)
+        return zombie_counts
+
+    @staticmethod
+    def sample_spawns(zombie_counts: dict[type[Zombie], int],
+                      seed: int,
+                      chunk_size: int = SPAWN_CHUNK_SIZE
+                      ) -> Iterator[tuple[list[type[Zombie]], array, array]]:
         """
-        zombie_roles = []
-        zombie_thresholds = {
-            # ZombieType: Wave to spawn
-            SpeedyZombie: 5,
-            HulkingZombie: 10,
-            PolymorphZombie: 15
-        }
+        Draw the type, lane and spawn offset of every zombie of a wave, in the order they spawn,
+        a chunk at a time so a large wave costs nothing up front. Types are drawn in proportion to their counts.
+        The spawn schedule of a wave with this seed (see schedule_spawns) spawns exactly these zombies.
 
-        for zombie_type, threshold in zombie_thresholds.items():
-            if self.__wave >= threshold:
-                zombie_roles.extend(self.calculate_special_zombies(zombie_type, threshold - 1))
+        Args:
+            zombie_counts (dict[type[Zombie], int]): The number of zombies of each type (see calculate_zombie_counts).
+            seed (int): The seed of the wave's spawn schedule (see get_spawn_state).
+            chunk_size (int): The number of zombies in each chunk. Default: SPAWN_CHUNK_SIZE
 
-        remaining_zombies = self.__num_zombies - len(zombie_roles)
-        zombie_roles.extend([Zombie] * remaining_zombies)
-        return zombie_roles
+        Yields:
+            tuple[list[type[Zombie]], array, array]: The type of each zombie of the chunk,
+                its row (array of unsigned bytes) and its offset from the right edge of the board (array of shorts).
+        """
+        count = sum(zombie_counts.values())
+        rng = random.Random(seed)
+        zombie_types = list(zombie_counts)
+        cum_weights = list(accumulate(zombie_counts.values()))
+        for start in range(0, count, chunk_size):
+            types, rows, offsets = [], array('B'), array('h')
+            for _ in range(min(chunk_size, count - start)):
+                # Drawn the way random.choices does, one zombie at a time
+                types.append(zombie_types[bisect(cum_weights, rng.random() * count)])
+                offsets.append(SPAWN_OFFSETS[math.floor(rng.random() * len(SPAWN_OFFSETS))])
+                rows.append(math.floor(rng.random() * GRID_HEIGHT))
+            yield types, rows, offsets
 
+    def update(self) -> None:
+        """
+        Spawn the zombies due this tick, and begin the next wave once every zombie of the wave
+        has been spawned and no zombies are left on the board.
+        """
+        if self.__next_spawn is None and not self.game_manager.get_entities(Zombie):
+            self.begin_wave()
+        self.release_zombies()
+
+    @tracer.traced
     def begin_wave(self) -> None:
         """
-        Begin the wave by spawning zombies.
+        Begin the wave by scheduling its zombies to spawn.
         """
+        memory.snapshot(self.__wave)  # Log the memory used by the wave that ended, if memory is being traced
         self.update_wave()
         self.game_manager.clear_entities(Projectile)
         self.__num_zombies = self.calculate_num_zombies()
-        zombie_roles = self.calculate_zombie_roles()
-        self.spawn_zombies(zombie_roles)
+        self.spawn_zombies(self.calculate_zombie_counts())
+
+        # Snapshot the game for seeking through its replay, now that the wave has begun
+        if self.game_manager.replay:
+            self.game_manager.replay.add_keyframe(self.game_manager, self)
 
-    def spawn_zombies(self, zombie_roles) -> None:
+    def spawn_zombies(self, zombie_counts: dict[type[Zombie], int]) -> None:
         """
-        Spawn zombies on the board.
+        Schedule zombies to spawn on the board over the next ticks, starting with the current tick.
+
+        Args:
+            zombie_counts (dict[type[Zombie], int]): The number of zombies of each type to spawn.
+        """
+        # The schedule draws from its own generator, so it can be rebuilt from its seed (see get_spawn_state)
+        seed = self.game_manager.random.get_stream("waves").getrandbits(64)
+        self.set_spawn_state((seed, self.game_manager.clock.ticks, 0), zombie_counts)
+
+    def schedule_spawns(self,
+                        zombie_counts: dict[type[Zombie], int],
+                        seed: int,
+                        start_tick: int
+                        ) -> Iterator[tuple[int, type[Zombie], int, int]]:
+        """
+        Generate the spawn schedule of a wave. Zombies enter each lane at least SPAWN_INTERVAL_S apart
+        (less for waves too large to enter within WAVE_SPAWN_TIME_S), so a wave spreads out
+        instead of being spawned all at once.
+
+        Args:
+            zombie_counts (dict[type[Zombie], int]): The number of zombies of each type to spawn.
+            seed (int): The seed of the schedule.
+            start_tick (int): The tick the first zombie spawns on.
+
+        Yields:
+            tuple[int, type[Zombie], int, int]: The tick, class, x-coordinate and y-coordinate of each zombie,
+                in the order they spawn.
+        """
+        count = sum(zombie_counts.values())
+        clock = self.game_manager.clock
+        lane_interval = min(clock.to_ticks(SPAWN_INTERVAL_S),
+                            clock.to_ticks(WAVE_SPAWN_TIME_S) * GRID_HEIGHT // max(count, 1))
+        lane_interval = max(lane_interval, 1)
+
+        lane_ready = [start_tick] * GRID_HEIGHT  # The tick each lane can take its next zombie
+        tick = start_tick
+        for zombie_types, rows, offsets in self.sample_spawns(zombie_counts, seed):
+            for zombie_type, row, offset in zip(zombie_types, rows, offsets):
+                # Zombies spawn in order, so a zombie waits for its lane (and holds back the zombies after it)
+                tick = max(tick, lane_ready[row])
+                lane_ready[row] = tick + lane_interval
+                yield tick, zombie_type, ((GRID_WIDTH - 1) * GRID_SIZE) + 75 + offset, row * GRID_SIZE
+
+    def release_zombies(self) -> None:
+        """
+        Spawn every scheduled zombie that is due.
+        """
+        tick = self.game_manager.clock.ticks
+        while self.__next_spawn is not None and self.__next_spawn[0] <= tick:
+            _, zombie_type, zombie_spawn_x, zombie_spawn_y = self.__next_spawn
+            self.game_manager.spawn(zombie_type, zombie_spawn_x, zombie_spawn_y)
+            self.__spawned += 1
+            self.__next_spawn = next(self.__spawns, None)
+        if self.__next_spawn is None:
+            self.__spawn_seed = self.__spawns = None
+
+    def is_spawning(self) -> bool:
         """
-        for _ in range(len(zombie_roles)):
-            zombie_type = random.choice(zombie_roles)
-            zombie_spawn_x = ((GRID_WIDTH - 1) * GRID_SIZE) + 75 + random.choice(list(range(-50, 126, 20)))
-            zombie_spawn_y = random.randint(0, 4) * GRID_SIZE
-            new_zombie = zombie_type(self.game_manager, zombie_spawn_x, zombie_spawn_y)
-            self.game_manager.add(new_zombie)
+        Check if zombies of the wave are still waiting to spawn.
+
+        Returns:
+            bool: True if zombies are waiting to spawn, False otherwise.
+        """
+        return self.__next_spawn is not None
+
+    def get_spawn_state(self) -> tuple[int, int, int] | None:
+        """
+        Get what is needed to rebuild the wave's spawn schedule (i.e. when saving the game).
+
+        Returns:
+            tuple[int, int, int] | None: The seed and start tick of the schedule, and the number of zombies
+                spawned so far, or None if every zombie of the wave has spawned.
+        """
+        if self.__spawn_seed is None:
+            return None
+        return self.__spawn_seed, self.__spawn_start, self.__spawned
+
+    def set_spawn_state(self, spawn_state: tuple[int, int, int] | None,
+                        zombie_counts: dict[type[Zombie], int] | None = None) -> None:
+        """
+        Rebuild the wave's spawn schedule, skipping the zombies that already spawned.
+
+        Args:
+            spawn_state (tuple[int, int, int] | None): The state from get_spawn_state.
+            zombie_counts (dict[type[Zombie], int] | None): The number of zombies of each type in the wave.
+                Default: None (calculate them)
+        """
+        self.__spawns = self.__next_spawn = None
+        self.__spawn_seed = None
+        if spawn_state is None:
+            return
+
+        self.__spawn_seed, self.__spawn_start, self.__spawned = spawn_state
+        if zombie_counts is None:
+            zombie_counts = self.calculate_zombie_counts()
+        self.__spawns = self.schedule_spawns(zombie_counts, self.__spawn_seed, self.__spawn_start)
+        # A schedule with fewer zombies than spawned (i.e. a corrupt save) is simply exhausted
+        self.__next_spawn = next(islice(self.__spawns, self.__spawned, None), None)
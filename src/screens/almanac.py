@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 import pygame
 
 # Local Imports
-from src.entities import Plant, Zombie
+from src.entities import Plant, Zombie, registry
 from src.screens import BaseScreen
 
 # The following packages are imported only for type hinting.
@@ -28,15 +28,14 @@ def grab_attributes() -> dict[str, dict[str, any]]:
         dict[str, dict[str, any]]: A dictionary containing class names as keys and their attributes as values.
     """
     all_attributes: dict[str, dict[str, any]] = {}
-    for entity_class in [Plant, Zombie]:
-        subclasses = entity_class.__subclasses__()
-        all_subclasses = [entity_class] + subclasses
-        for subclass in all_subclasses:
-            instance = subclass(None, 0, 0)  # Instantiate the class
-            attributes = instance.attributes
-            if 'images' in attributes:
-                attributes['images'] = attributes['images'][0]  # Grab the first image
-            all_attributes[subclass.__name__] = attributes
+    for base_class in [Plant, Zombie]:
+        for entity_class in registry.get_classes(base_class):
+            info = registry.get_info(entity_class)
+            all_attributes[entity_class.__name__] = {
+                "name": info["name"],
+                "images": info["images"][0],  # Grab the first image
+                "description": info["description"]
+            }
     return all_attributes
 
 
@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING
 import pygame
 
 # Local Imports
-from src.managers import ColorManager
+from src.managers import ColorManager, metrics
 
 # The following packages are imported only for type hinting.
 # They are not used in this package, preventing circular dependency errors.
@@ -42,6 +42,7 @@ class BaseScreen(ABC):
         self.display = display
         self.colors = ColorManager
         self.sound_manager = self.screen_manager.sound_manager
+        self.profile_manager = self.screen_manager.profile_manager
         self.button_hover_states = {}  # Dictionary to store hover states of buttons
         self.database_manager = self.screen_manager.database_manager
         pygame.display.set_caption(title)
@@ -68,6 +69,7 @@ class BaseScreen(ABC):
             allowed_width (int): The allowed width for text wrapping
         """
         font = pygame.font.Font(None, font_size)
+        metrics.count("font_constructions")
 
         # Wrap text if allowed_width is provided
         if allowed_width:
@@ -146,6 +148,7 @@ class BaseScreen(ABC):
             hover_color = self.colors.LIGHT_BLUE
 
         font = pygame.font.Font(None, font_size)
+        metrics.count("font_constructions")
         button_text: pygame.Surface = font.render(message, True, self.colors.WHITE)
         button_text.set_alpha(alpha)
         button_rect = button_text.get_rect(topleft=button_position)
@@ -202,6 +205,7 @@ class BaseScreen(ABC):
             base_path = f"src/assets/images/{image_filename}"
 
         image = pygame.image.load(base_path)
+        metrics.count("image_loads")
         if image_size:
             image = pygame.transform.scale(image, image_size)
         image_rect = image.get_rect(center=image_position)
@@ -250,6 +254,7 @@ class BaseScreen(ABC):
             base_path = f"src/assets/images/{image_filename}"
 
         image = pygame.image.load(base_path).convert_alpha()
+        metrics.count("image_loads")
         image = pygame.transform.scale(image, image_size)
 
         # Blit the image onto the center of the background
@@ -308,6 +313,14 @@ class BaseScreen(ABC):
         # This function is intentionally left blank and should be overridden in derived classes.
         return
 
+    def quit(self) -> None:
+        """
+        Called when the application is closed while this screen is shown (i.e. the window is closed),
+        to keep anything the screen has not saved yet
+        """
+        # This function is intentionally left blank and should be overridden in derived classes.
+        return
+
     def handle_click_events(self, mouse_pos: tuple[int, int]) -> None:
         """
         Handle events on the leaderboard screen.
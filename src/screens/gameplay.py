@@ -5,12 +5,10 @@ This module contains the GameplayScreen class
 for managing the game itself when running
 """
 # Standard Imports
-import inspect
 from enum import Enum
-import random
 import os
 import sys
-from types import ModuleType
+import time
 from typing import TYPE_CHECKING
 
 # Library Imports
@@ -18,11 +16,12 @@ import pygame
 from pygame import Surface, SurfaceType
 
 # Local Imports
-from src import entities
-from src.constants import GRID_WIDTH, GRID_SIZE, GRID_HEIGHT, GRID_OFFSET
-from src.entities import Plant, Projectile, Zombie, Shovel
-from src.entities import __all__ as all_entities
-from src.managers import ColorManager, GameManager, WaveManager
+from src.constants import GRID_WIDTH, GRID_SIZE, GRID_HEIGHT, GRID_OFFSET, GAME_SPEEDS, MAX_GAME_SPEED, \
+    MAX_SPEED_BUDGET_MS, REPLAY_DIR, SAVE_DIR
+from src.entities import Plant, Projectile, Zombie, Shovel, EntityRegistry, registry
+from src.managers import ColorManager, GameManager, WaveManager, ReplayManager, SaveManager, AutosaveManager, metrics
+from src.managers.replay_manager import ReplayCommand, REPLAY_EXTENSION
+from src.managers.save_manager import SAVE_EXTENSION
 from src.screens import BaseScreen
 
 Entity = Zombie | Plant | Projectile | Shovel
@@ -52,24 +51,21 @@ def scale_background(img: str) -> Surface:
     return scaled_img
 
 
-def load_and_scale_entity_images(entities_module: ModuleType) -> dict[type, list[Surface | SurfaceType]]:
+def load_and_scale_entity_images(entity_registry: EntityRegistry) -> dict[type, list[Surface | SurfaceType]]:
     """
-    Load and scale images for each entity class defined in the entities' module.
+    Load and scale images for each entity class in the entity registry.
 
     Args:
-        entities_module (ModuleType): The module containing entity classes.
+        entity_registry (EntityRegistry): The registry of entity classes.
 
     Returns:
         dict[type[Entity], list[Surface]]: A dictionary mapping entity classes to their scaled images.
     """
     scaled_images: dict[type, list[Surface]] = {}
-    for entity_name in all_entities:
-        entity_class: type = getattr(entities_module, entity_name)  # Get Class from modules
+    for entity_class in entity_registry.get_classes():
+        info = entity_registry.get_info(entity_class)
 
-        # Create an instance of the entity's Class for access to the image attrib
-        entity_instance = entity_class(None, 0, 0)
-
-        image_paths: list = entity_instance.attributes["images"]
+        image_paths: tuple[str, ...] = info["images"]
         if image_paths:
             images = []
             for image_path in image_paths:
@@ -77,11 +73,7 @@ def load_and_scale_entity_images(entities_module: ModuleType) -> dict[type, list
                     base_path = os.path.join(sys._MEIPASS, f"src/assets/images/entities/{image_path}")
                 else:
                     base_path = f"src/assets/images/entities/{image_path}"
-                try:
-                    image_size = entity_instance.image_size
-                    images.append(pygame.transform.scale(pygame.image.load(base_path), image_size))
-                except AttributeError:
-                    images.append(pygame.transform.scale(pygame.image.load(base_path), (GRID_SIZE, GRID_SIZE)))
+                images.append(pygame.transform.scale(pygame.image.load(base_path), info["image_size"]))
             scaled_images[entity_class] = images
 
     return scaled_images
@@ -112,7 +104,17 @@ class GameplayScreen(BaseScreen):
 
         # Setup GameManager, WaveManager, entity management attributes, & ColorManager
         self.game_manager = GameManager(self.sound_manager)
+        self.game_manager.replay = ReplayManager(self.game_manager.random.seed)
         self.wave_manager = WaveManager(self.game_manager)
+        self.wave_manager.update()  # Begin the first wave, the next waves begin at the end of a tick
+
+        # Continue the player's last game if it was not lost, and keep autosaving it
+        self.save_manager = SaveManager(self.game_manager, self.wave_manager)
+        username = "".join(char for char in self.screen_manager.user_logged_in or "guest" if char.isalnum())
+        autosave_path = os.path.join(SAVE_DIR, f"{username}{SAVE_EXTENSION}")
+        if os.path.exists(autosave_path):
+            self.load_autosave(autosave_path)
+        self.autosave = AutosaveManager(self.save_manager, autosave_path)
         self.zombies = self.game_manager.get_entities(Zombie)
         self.plants = self.game_manager.get_entities(Plant)
         self.projectiles = self.game_manager.get_entities(Projectile)
@@ -120,10 +122,11 @@ class GameplayScreen(BaseScreen):
 
         # Load all images
         self.background_img = scale_background('game_background.jpg')
-        self.entity_imgs = load_and_scale_entity_images(sys.modules['src.entities'])
+        self.entity_imgs = load_and_scale_entity_images(registry)
 
         # Set the game state to playing
         self.game_state = GameState.PLAYING
+        self.last_frame_time: int = pygame.time.get_ticks()  # Used to feed real time to the simulation clock
         self.sound_manager.play_music('gameplay.mp3')
 
         # Create a held item
@@ -175,24 +178,22 @@ class GameplayScreen(BaseScreen):
         self.plant_buttons = []
         self.plant_button_size = (130, 75)
 
-        # Create a list of all Plant classes
-        plant_classes = [cls for name, cls in inspect.getmembers(entities, inspect.isclass) if issubclass(cls, Plant)]
-
-        # Create instances of each plant class to access their cost, then sort by cost
-        self.plant_instances = [(plant_class(None, 0, 0), plant_class) for plant_class in plant_classes]
-        self.plant_instances = sorted(self.plant_instances, key=lambda instance: instance[0].cost)
+        # Get all Plant classes, sorted by cost
+        self.plant_classes = sorted(registry.get_classes(Plant),
+                                    key=lambda plant_class: registry.get_info(plant_class)["stats"]["cost"])
 
         # Create buttons for each plant
-        for i, (plant_instance, _) in enumerate(self.plant_instances):
+        for i, plant_class in enumerate(self.plant_classes):
+            info = registry.get_info(plant_class)
             button_position = (50 + self.plant_button_size[0] + i * 160, 15)
             self.plant_buttons.append({
-                "name": plant_instance.attributes["name"],  # The name of the plant
-                "cost": plant_instance.cost,  # The cost of the plant
+                "name": info["name"],  # The name of the plant
+                "cost": info["stats"]["cost"],  # The cost of the plant
                 "color": self.colors.GREEN,
                 "hover_color": self.colors.LIGHT_BLUE,
                 "position": button_position,  # Set button position
             })
-            print(f"Plant {plant_instance.attributes['name']} button created at {button_position}")
+            print(f"Plant {info['name']} button created at {button_position}")
 
     def draw_background_with_grid(self) -> None:
         """
@@ -214,35 +215,34 @@ class GameplayScreen(BaseScreen):
         """
         # Sort objects so that Zombie is on top
         objs.sort(key=lambda objName: isinstance(objName, Zombie))
-        current_time = pygame.time.get_ticks()
+        current_time = self.game_manager.clock.get_time()
 
         # Attempt to draw each entity
+        blits = 0
         for obj in objs:
-            images = self.entity_imgs.get(type(obj))
+            images = self.entity_imgs.get(obj.entity_class)
             if not images:
                 continue
             try:
                 self.draw_entity(obj, images, current_time)
+                blits += 1
             except (AttributeError, IndexError):
                 continue
+        metrics.count("blits", blits)
 
-    def draw_entity(self, obj: Entity, images: list[Surface], current_time: int):
+    def draw_entity(self, obj: Entity, images: list[Surface], current_time: float):
         """
         Draw a single game entity on the screen.
 
         Args:
             obj (Entity): The game entity to draw.
             images (list[Surface]): The images to use for drawing the entity.
-            current_time (int): The current game time.
+            current_time (float): The current simulated time, in milliseconds.
         """
-        # If the entity has no image size, match GRID_SIZE
-        if not hasattr(obj, 'image_size'):
-            obj.image_size = (GRID_SIZE, GRID_SIZE)
-
         # Handle animations, if any
         if not hasattr(obj, 'animation_offset'):
-            obj.animation_offset = random.randint(0, 10000)
-        image_index = ((current_time + obj.animation_offset) // (500 // self.screen_manager.game_speed)) % len(images)
+            obj.animation_offset = self.game_manager.random.get_stream("animation").randint(0, 10000)
+        image_index = int((current_time + obj.animation_offset) // 500) % len(images)
 
         # Display the entity at the center of the cell
         cell_center_x = obj.x + (GRID_SIZE - obj.image_size[0]) / 2
@@ -273,6 +273,7 @@ class GameplayScreen(BaseScreen):
             self.return_button = None
             self.game_state = GameState.PLAYING
         elif self.quit_button and self.quit_button.collidepoint(mouse_pos):
+            self.quit()
             self.screen_manager.game_speed = 1
             self.sound_manager.reset()
             self.screen_manager.set_screen("MainMenuScreen")
@@ -284,7 +285,7 @@ class GameplayScreen(BaseScreen):
         Args:
             mouse_pos (tuple[int, int]): The position of the mouse cursor.
         """
-        for button_info, (_, plant_class) in zip(self.plant_buttons, self.plant_instances):
+        for button_info, plant_class in zip(self.plant_buttons, self.plant_classes):
             plant_class: type[Plant]
             button_rect = pygame.Rect(button_info["position"], self.plant_button_size)
 
@@ -324,8 +325,13 @@ class GameplayScreen(BaseScreen):
                     self.held_item = None
                     self.sound_manager.mute_sounds()
                 case 'icons/fast_forward.png':
+                    # Cycle through the game speeds, then back to normal speed
                     self.held_item = None
-                    self.screen_manager.game_speed = 2 if self.screen_manager.game_speed == 1 else 1
+                    speed_index = GAME_SPEEDS.index(self.screen_manager.game_speed)
+                    self.screen_manager.game_speed = GAME_SPEEDS[(speed_index + 1) % len(GAME_SPEEDS)]
+                    if self.game_manager.replay:
+                        self.game_manager.replay.record(self.game_manager.clock.ticks, ReplayCommand.SPEED,
+                                                        self.screen_manager.game_speed)
                 case 'icons/shovel.png':
                     # If we are already holding the shovel, get rid of it
                     if self.held_item and issubclass(self.held_item, Shovel):
@@ -363,36 +369,65 @@ class GameplayScreen(BaseScreen):
             return
 
         # If holding a shovel, remove the plant in that cell
+        # Throw an error if no plant was found in that cell
         if issubclass(self.held_item, Shovel):
-            for plant in self.plants:
-                if plant.x != cell_x or plant.y != cell_y:
-                    continue
-                self.game_manager.remove(plant)
-                self.game_manager.add_coins(plant.cost // 2)
+            if self.game_manager.dig_plant(cell_x, cell_y):
                 self.held_item = None
-                break  # Stop looping through plants after it was removed
             else:
-                # Throw an error if no plant was found in that cell
                 self.throw_error()
             return
 
-        # Throw an error if there's already a plant in that cell
-        if any(plant.x == cell_x and plant.y == cell_y for plant in self.plants):
+        # Attempt to place the plant
+        # Throw an error if there's already a plant in that cell or the player does not have enough coins
+        if self.game_manager.place_plant(self.held_item, cell_x, cell_y):
+            self.held_item = None
+        else:
             self.throw_error()
-            return
 
-        # Attempt to create the entity
-        # Throw an error if the player does not have enough coins
-        new_entity = self.held_item(self.game_manager, cell_x, cell_y)
-        if self.game_manager.get_coins() < new_entity.cost:
-            self.throw_error()
-            return
+    def load_autosave(self, path: str) -> None:
+        """
+        Continue the game saved in an autosave. An autosave that can not be loaded leaves the new game as is,
+        and a corrupt one is moved aside (to the same path, ending in ".corrupt"), so the next game starts fresh.
 
-        # Otherwise, add the entity to the game_manager and remove the cost from the player's coins
-        self.game_manager.add(new_entity)
-        self.game_manager.remove_coins(new_entity.cost)
-        print(f"New {self.held_item.__name__} {new_entity.x, new_entity.y}. Health: {new_entity.health}")
-        self.held_item = None
+        Args:
+            path (str): The path of the autosave file.
+        """
+        try:
+            self.save_manager.load(path)
+        except OSError as e:
+            print(f"Could not load autosave: {e}")
+        except ValueError as e:
+            print(f"Could not load autosave, moving it to {path}.corrupt: {e}")
+            try:
+                os.replace(path, f"{path}.corrupt")
+            except OSError as e:
+                print(f"Could not move autosave: {e}")
+
+    def save_replay(self) -> None:
+        """
+        Stop recording the game, and save its replay to the replays folder.
+        """
+        replay = self.game_manager.replay
+        if replay is None or replay.is_finished():
+            return  # Continued from an autosave (which can not be replayed), or already saved
+        replay.finish(self.game_manager.clock.ticks)
+
+        filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{replay.seed}{REPLAY_EXTENSION}"
+        try:
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            replay.save(os.path.join(REPLAY_DIR, filename))
+        except OSError as e:
+            print(f"Could not save replay: {e}")
+
+    def quit(self) -> None:
+        """
+        Save the replay of the game, and autosave the game unless it is lost, waiting for the autosave to be written
+        (called when quitting to the main menu, or when the application is closed mid-game).
+        """
+        self.save_replay()
+        if self.game_state is not GameState.LOST:
+            self.autosave.save()  # Keep the game, to continue it next time
+            self.autosave.close()
 
     def throw_error(self) -> None:
         """
@@ -460,7 +495,7 @@ class GameplayScreen(BaseScreen):
             button_info["colors"] = self.get_button_colors(
                 button_info["filename"] == 'icons/pause.png' and self.game_state is GameState.PAUSED or
                 button_info["filename"] == 'icons/volume.png' and self.sound_manager.muted or
-                button_info["filename"] == 'icons/fast_forward.png' and self.screen_manager.game_speed == 2 or
+                button_info["filename"] == 'icons/fast_forward.png' and self.screen_manager.game_speed != 1 or
                 button_info["filename"] == 'icons/shovel.png' and self.held_item and issubclass(self.held_item, Shovel)
             )
 
@@ -478,30 +513,23 @@ class GameplayScreen(BaseScreen):
                 image_size=self.toolbar_button_size
             )
 
+            # Show the game speed under the fast-forward button
+            if button_info["filename"] == 'icons/fast_forward.png' and self.screen_manager.game_speed != 1:
+                speed = self.screen_manager.game_speed
+                self.display_message(
+                    message="Max" if speed == MAX_GAME_SPEED else f"{speed}x",
+                    font_color=self.colors.WHITE,
+                    text_position=(button_info["position"][0] + self.toolbar_button_size[0] // 2,
+                                   button_info["position"][1] + self.toolbar_button_size[1] + 12),
+                    text_align="center",
+                    font_size=20
+                )
+
     def render_entities(self) -> None:
         """
-        Render the entities on the screen.
-        """
-        for plant in self.plants:
-            for zombie in self.zombies:
-                if zombie.y == plant.y:
-                    # If a Zombie is inside the Plant's cell
-                    if zombie.x <= plant.x <= zombie.x + GRID_SIZE:
-                        zombie.attack_plant(plant)
-
-                    # Ensure the zombie is visible on the board, in front of the plant
-                    visible_distance = self.display.get_width() - 30
-                    if plant.x <= zombie.x <= visible_distance:
-                        plant.shoot_projectile()
-
-        for zombie in self.zombies:
-            zombie.update_position()
-            zombie.collided_with_plant = False
-            for projectile in self.projectiles:
-                if zombie.y == projectile.y and zombie.x <= projectile.x <= zombie.x + GRID_SIZE:
-                    projectile.attack_zombie(zombie)
-        for projectile in self.projectiles:
-            projectile.update_position()
+        Simulate a single tick of the entities on the board.
+        """
+        self.game_manager.update()
 
     def render_pause_screen(self) -> None:
         """
@@ -547,49 +575,77 @@ class GameplayScreen(BaseScreen):
         # Copy the speed over to game manager so entities can access it
         self.game_manager.game_speed = self.screen_manager.game_speed
 
-        self.display.fill(self.colors.BROWN)
-        self.draw_background_with_grid()
-        self.draw_entities(self.game_manager.get_entities())
-
-        self.display_message(message=f"Coins: {self.game_manager.get_coins():,}",
-                             font_color=self.colors.WHITE,
-                             text_position=(15, 20),
-                             text_align="topleft"
-                             )
-        self.display_message(message=f"Wave: {self.wave_manager.get_wave()}",
-                             font_color=self.colors.WHITE,
-                             text_position=(15, 50),
-                             text_align="topleft"
-                             )
-
-        # Draw plant/toolbar buttons
-        self.render_plant_buttons()
-        self.render_toolbar_buttons()
-
-        # Render held item if there is one
-        if self.held_item is not None:
-            img = self.entity_imgs[self.held_item][0]
-            self.render_held_item(img)
-
-        # If no zombies are on the board, spawn new ones + update wave
-        if not self.game_manager.get_entities(Zombie):
-            self.wave_manager.begin_wave()
-
-        # If the game is not paused/lost
-        if self.game_state is GameState.PLAYING:
-            self.render_entities()
+        with self.profile_manager.phase("Background"):
+            self.display.fill(self.colors.BROWN)
+            self.draw_background_with_grid()
+        with self.profile_manager.phase("Entities"):
+            self.draw_entities(self.game_manager.get_entities())
+
+        with self.profile_manager.phase("HUD"):
+            self.display_message(message=f"Coins: {self.game_manager.get_coins():,}",
+                                 font_color=self.colors.WHITE,
+                                 text_position=(15, 20),
+                                 text_align="topleft"
+                                 )
+            self.display_message(message=f"Wave: {self.wave_manager.get_wave()}",
+                                 font_color=self.colors.WHITE,
+                                 text_position=(15, 50),
+                                 text_align="topleft"
+                                 )
+
+            # Draw plant/toolbar buttons
+            self.render_plant_buttons()
+            self.render_toolbar_buttons()
+
+            # Render held item if there is one
+            if self.held_item is not None:
+                img = self.entity_imgs[self.held_item][0]
+                self.render_held_item(img)
+
+        # Feed the real time elapsed since the last frame to the simulation clock
+        current_time = pygame.time.get_ticks()
+        elapsed_time = current_time - self.last_frame_time
+        self.last_frame_time = current_time
+
+        # If the game is not paused/lost, simulate every tick owed since the last frame
+        # Faster speeds simulate more (fixed-size) ticks per frame, the screen is still drawn once per frame
+        if self.game_state is GameState.PLAYING and self.game_manager.game_speed == MAX_GAME_SPEED:
+            with self.profile_manager.phase("Simulation"):
+                deadline = time.perf_counter() + MAX_SPEED_BUDGET_MS / 1000
+                while time.perf_counter() < deadline and not self.game_manager.is_lost():
+                    self.render_entities()
+                    self.wave_manager.update()
+        elif self.game_state is GameState.PLAYING:
+            with self.profile_manager.phase("Simulation"):
+                for _ in range(self.game_manager.clock.advance(elapsed_time, self.game_manager.game_speed)):
+                    if self.game_manager.is_lost():
+                        break
+                    self.render_entities()
+                    self.wave_manager.update()
 
         # If the game is paused/lost
         else:
-            self.render_pause_screen()
+            with self.profile_manager.phase("HUD"):
+                self.render_pause_screen()
+
+        self.profile_manager.counts = {
+            "Plants": len(self.game_manager.get_entities(Plant)),
+            "Zombies": len(self.game_manager.get_entities(Zombie)),
+            "Projectiles": len(self.game_manager.get_entities(Projectile)),
+        }
+
+        if self.game_state is GameState.PLAYING and not self.game_manager.is_lost():
+            self.autosave.update()
 
         # If a zombie is not outside of screen, do not continue
-        if not any(zombie.x <= -GRID_SIZE for zombie in self.zombies):
+        if not self.game_manager.is_lost():
             return
 
         # If a Zombie goes out of the screen, the player loses
         wave = self.wave_manager.get_wave()
         self.database_manager.update_high_score(self.screen_manager.user_logged_in, wave)
+        self.save_replay()
+        self.autosave.delete()  # A lost game can not be continued
         self.screen_manager.game_speed = 1
         self.game_state = GameState.LOST
 
@@ -0,0 +1,339 @@
+"""
+Leafy Legions: Headless Simulation
+
+This module contains the HeadlessGame class
+for running the game rules without a display, audio or database,
+as fast as the CPU allows (i.e. balance testing, benchmarks and soak tests)
+
+Usage:
+    python -m src.sim --waves 50 --seed 1
+    python -m src.sim --waves 50 --seed 1 --record game.llr
+    python -m src.sim --replay game.llr
+    python -m src.sim --replay game.llr --seek 80
+    python -m src.sim --waves 30 --seed 1 --save game.lls
+    python -m src.sim --load game.lls
+    python -m src.sim --waves 20 --seed 1 --metrics metrics.csv
+    python -m src.sim --waves 20 --seed 1 --memory memory.log
+"""
+# Standard Imports
+import argparse
+import contextlib
+import time
+from typing import Any, Callable, Iterator
+
+# Local Imports
+# The managers must be imported before the entities, as the entities depend on them
+from src.constants import GRID_WIDTH, GRID_HEIGHT, GRID_SIZE
+from src.managers import GameManager, SoundManager, WaveManager, ReplayManager, SaveManager, memory, metrics
+from src.entities import Entity, Plant, Zombie, registry
+
+
+class HeadlessGame:
+    """
+    A HeadlessGame runs the GameManager and WaveManager on their own,
+    with a strategy standing in for the player.
+    """
+    def __init__(self,
+                 seed: int | None = None,
+                 vectorized: bool = False,
+                 strategy: Callable[['HeadlessGame'], None] | None = None,
+                 stat_overrides: dict[str, dict[str, Any]] | None = None,
+                 replay: ReplayManager | None = None,
+                 record: bool = False
+                 ) -> None:
+        """
+        Initialize a HeadlessGame object.
+
+        Args:
+            seed (int | None): The seed of the game. Default: None (random)
+            vectorized (bool): Whether to use the vectorized (NumPy) engine. Default: False
+                When playing back a replay, the engine the replay was recorded on is used instead.
+            strategy (Callable[[HeadlessGame], None] | None): Called every tick to play the game.
+                Default: greedy_strategy
+            stat_overrides (dict[str, dict[str, Any]] | None): Stats to override while the game runs, by class name,
+                i.e. {"Zombie": {"max_health": 250}, "WaveManager": {"special_weight_cap": 0.5}}.
+                Entity stats are class attributes, so subclasses that do not set the stat inherit the override.
+                Default: None
+            replay (ReplayManager | None): A recorded game to play back instead of running the strategy.
+                The game uses the replay's seed and engine. Default: None
+            record (bool): Whether to record the game, into game_manager.replay. Default: False
+
+        Raises:
+            ValueError: If an overridden class or stat does not exist.
+        """
+        self.replay = replay
+        self.sound_manager = SoundManager(enabled=False)
+        if replay:
+            seed, vectorized = replay.seed, replay.vectorized
+        self.game_manager = GameManager(self.sound_manager, vectorized=vectorized, seed=seed)
+        self.wave_manager = WaveManager(self.game_manager)
+        self.strategy = strategy or greedy_strategy
+        if record:
+            self.game_manager.replay = ReplayManager(self.game_manager.random.seed, vectorized=vectorized)
+
+        # Stats to override on each entity class while the game runs, i.e. {Zombie: {"max_health": 250}}
+        self.stat_overrides: dict[type[Entity], dict[str, Any]] = {}
+        for class_name, stats in (stat_overrides or {}).items():
+            if class_name == "WaveManager":
+                target = self.wave_manager
+            elif registry.get_class(class_name):
+                target = registry.get_class(class_name)
+            else:
+                raise ValueError(f"Unknown class {class_name}")
+
+            for stat in stats:
+                if not hasattr(target, stat):
+                    raise ValueError(f"{class_name} has no stat {stat}")
+                # Per-entity state (i.e. health, x) is stored on each entity, not on the class
+                if isinstance(target, type) and hasattr(type(getattr(target, stat)), "__set__"):
+                    raise ValueError(f"{class_name}.{stat} is per-entity state, not a stat")
+
+            if target is self.wave_manager:
+                for stat, value in stats.items():
+                    setattr(self.wave_manager, stat, value)
+            else:
+                self.stat_overrides[target] = stats
+
+        self.plant_costs = get_plant_costs()
+        self.coin_curve: list[int | None] = []  # Coins at the start of each wave (None if seeked past)
+
+    def step(self) -> bool:
+        """
+        Simulate a single tick of the game.
+
+        Returns:
+            bool: False if the game was lost during this tick, True otherwise.
+        """
+        self.wave_manager.update()
+        if self.wave_manager.get_wave() > len(self.coin_curve):
+            self.coin_curve.append(self.game_manager.get_coins())
+        # The player acts after the wave begins and before the tick is simulated (as in the GameplayScreen)
+        if self.replay:
+            self.replay.apply(self.game_manager)
+        else:
+            self.strategy(self)
+        self.game_manager.update()
+        metrics.end_frame()  # Each tick of a headless game is a frame
+        return not self.game_manager.is_lost()
+
+    def seek(self, wave: int) -> None:
+        """
+        Jump a replay forward to the start of a wave, restoring the last keyframe before it
+        and simulating only the ticks after the keyframe.
+
+        Args:
+            wave (int): The wave to seek to.
+
+        Raises:
+            ValueError: If the game is not playing back a replay.
+        """
+        if not self.replay:
+            raise ValueError("Only replays can be seeked")
+
+        if self.replay.seek(wave, self.game_manager, self.wave_manager):
+            # The keyframe was taken just after its wave began, so only the coins of that wave are known
+            self.coin_curve = [None] * (self.wave_manager.get_wave() - 1) + [self.game_manager.get_coins()]
+
+        with contextlib.redirect_stdout(None), override_stats(self.stat_overrides):
+            while self.wave_manager.get_wave() < wave and self.step():
+                continue
+
+    def save(self, path: str) -> None:
+        """
+        Save the game to a file, to be loaded with load.
+
+        Args:
+            path (str): The path of the file.
+        """
+        SaveManager(self.game_manager, self.wave_manager).save(path)
+
+    def load(self, path: str) -> None:
+        """
+        Replace the game with a saved game.
+
+        Args:
+            path (str): The path of the file.
+        """
+        SaveManager(self.game_manager, self.wave_manager).load(path)
+        # Only the coins of the wave the game was saved in are known
+        self.coin_curve = [None] * (self.wave_manager.get_wave() - 1) + [self.game_manager.get_coins()]
+
+    def run(self, max_waves: int | None = None, max_ticks: int | None = None) -> dict[str, Any]:
+        """
+        Simulate the game until it is lost, max_waves waves are survived, or max_ticks ticks have passed.
+        When playing back a replay, the game also stops on the tick the recording stopped.
+
+        Args:
+            max_waves (int | None): The number of waves to survive before stopping. Default: None (no limit)
+            max_ticks (int | None): The number of ticks to simulate before stopping. Default: None (no limit)
+
+        Returns:
+            dict[str, Any]: The results of the game (see get_results).
+        """
+        start_time = time.perf_counter()
+        if self.replay and self.replay.get_end_tick() is not None:
+            max_ticks = min(max_ticks or self.replay.get_end_tick(), self.replay.get_end_tick())
+
+        # Entities print every hit, which would dominate the run time, so discard any output
+        with contextlib.redirect_stdout(None), override_stats(self.stat_overrides):
+            self.plant_costs = get_plant_costs()
+            # The stop conditions are checked before each tick, so a game seeked to its end is not simulated further
+            while not self.game_manager.is_lost():
+                if max_waves is not None and self.wave_manager.get_wave() > max_waves:
+                    break
+                if max_ticks is not None and self.game_manager.clock.ticks >= max_ticks:
+                    break
+                self.step()
+
+        if self.game_manager.replay:
+            self.game_manager.replay.finish(self.game_manager.clock.ticks)
+        return self.get_results(time.perf_counter() - start_time)
+
+    def get_results(self, elapsed_time: float = 0.0) -> dict[str, Any]:
+        """
+        Get the results of the game so far.
+
+        Args:
+            elapsed_time (float): The real time spent simulating, in seconds. Default: 0.0
+
+        Returns:
+            dict[str, Any]: The seed, waves survived, ticks simulated, coins, whether the game was lost, and timings.
+        """
+        ticks = self.game_manager.clock.ticks
+        return {
+            "seed": self.game_manager.random.seed,
+            "waves": max(self.wave_manager.get_wave() - 1, 0),
+            "ticks": ticks,
+            "coins": self.game_manager.get_coins(),
+            "coin_curve": self.coin_curve,
+            "lost": self.game_manager.is_lost(),
+            "seconds": elapsed_time,
+            "ticks_per_second": ticks / elapsed_time if elapsed_time else 0.0,
+        }
+
+
+@contextlib.contextmanager
+def override_stats(stat_overrides: dict[type[Entity], dict[str, Any]]) -> Iterator[None]:
+    """
+    Override the class-level stats of entity classes, restoring the original stats afterward.
+
+    Args:
+        stat_overrides (dict[type[Entity], dict[str, Any]]): The stats to override, by entity class.
+    """
+    originals = []
+    try:
+        for entity_class, stats in stat_overrides.items():
+            for stat, value in stats.items():
+                # Remember whether the class set the stat itself, or inherited it
+                originals.append((entity_class, stat, stat in vars(entity_class), vars(entity_class).get(stat)))
+                setattr(entity_class, stat, value)
+        yield
+    finally:
+        for entity_class, stat, was_set, value in reversed(originals):
+            if was_set:
+                setattr(entity_class, stat, value)
+            else:
+                delattr(entity_class, stat)
+
+
+def get_plant_costs() -> list[tuple[int, type[Plant]]]:
+    """
+    Get the cost of each plant class, most expensive first.
+
+    Returns:
+        list[tuple[int, type[Plant]]]: The cost and class of each plant.
+    """
+    plant_costs = [(plant_class.cost, plant_class) for plant_class in registry.get_classes(Plant)]
+    return sorted(plant_costs, key=lambda cost_and_class: cost_and_class[0], reverse=True)
+
+
+def greedy_strategy(game: HeadlessGame) -> None:
+    """
+    A simple stand-in for the player: buys the most expensive plant it can afford
+    and places it in the left-most free cell of the lane that needs it most
+    (lanes with zombies first, then lanes with the fewest plants).
+
+    Args:
+        game (HeadlessGame): The game being played.
+    """
+    game_manager = game.game_manager
+    coins = game_manager.get_coins()
+    if len(game_manager.get_entities(Plant)) >= GRID_WIDTH * GRID_HEIGHT:
+        return  # The board is full
+
+    for cost, plant_class in game.plant_costs:
+        if cost > coins:
+            continue
+
+        zombie_lanes = {zombie.y for zombie in game_manager.get_entities(Zombie)}
+        y = min((row * GRID_SIZE for row in range(GRID_HEIGHT)),
+                key=lambda lane_y: (lane_y not in zombie_lanes, len(game_manager.lanes.get_lane(Plant, lane_y))))
+        taken = {plant.x for plant in game_manager.lanes.get_lane(Plant, y)}
+        for column in range(GRID_WIDTH):
+            if column * GRID_SIZE not in taken:
+                game_manager.place_plant(plant_class, column * GRID_SIZE, y)
+                break
+        return
+
+
+def main() -> None:
+    """
+    Run a headless game from the command line and print its results.
+    """
+    parser = argparse.ArgumentParser(description="Run Leafy Legions without a display, audio or database.")
+    parser.add_argument("--waves", type=int, default=None, help="stop after surviving this many waves")
+    parser.add_argument("--ticks", type=int, default=None, help="stop after simulating this many ticks")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the game")
+    parser.add_argument("--vectorized", action="store_true", help="use the vectorized (NumPy) engine")
+    parser.add_argument("--record", metavar="PATH", default=None, help="save a replay of the game to this file")
+    parser.add_argument("--replay", metavar="PATH", default=None, help="play back a replay instead of the strategy")
+    parser.add_argument("--seek", metavar="WAVE", type=int, default=None, help="jump the replay to the start of a wave")
+    parser.add_argument("--save", metavar="PATH", default=None, help="save the game to this file when it stops")
+    parser.add_argument("--load", metavar="PATH", default=None, help="continue a saved game")
+    parser.add_argument("--metrics", metavar="PATH", default=None,
+                        help="write the work counted in each tick to this CSV (.csv) or JSON-lines file")
+    parser.add_argument("--memory", metavar="PATH", default=None,
+                        help="trace allocations, logging the memory used by each wave and where it grew to this file")
+    args = parser.parse_args()
+    if args.seek is not None and not args.replay:
+        parser.error("--seek requires --replay")
+    if args.load and (args.replay or args.record):
+        parser.error("--load can not be combined with --replay or --record")
+    if args.vectorized and args.replay:
+        parser.error("--vectorized can not be combined with --replay, replays are played back on the engine they "
+                     "were recorded on")
+
+    if args.metrics:
+        metrics.open(args.metrics)
+    if args.memory:
+        memory.start(args.memory)
+    replay = ReplayManager.load(args.replay) if args.replay else None
+    game = HeadlessGame(seed=args.seed, vectorized=args.vectorized, replay=replay, record=bool(args.record))
+    if args.seek is not None:
+        start_time = time.perf_counter()
+        game.seek(args.seek)
+        print(f"Seeked to wave {game.wave_manager.get_wave()} in {time.perf_counter() - start_time:.2f}s")
+    if args.load:
+        start_time = time.perf_counter()
+        try:
+            game.load(args.load)
+        except ValueError as e:
+            parser.error(f"Could not load {args.load}: {e}")
+        print(f"Loaded wave {game.wave_manager.get_wave()} in {(time.perf_counter() - start_time) * 1000:.1f}ms")
+    results = game.run(max_waves=args.waves, max_ticks=args.ticks)
+    if args.save:
+        game.save(args.save)
+    if args.record:
+        game.game_manager.replay.save(args.record)
+    metrics.close()
+    memory.stop()
+
+    print(f"Seed: {results['seed']}")
+    print(f"Waves survived: {results['waves']}{' (lost)' if results['lost'] else ''}")
+    print(f"Ticks: {results['ticks']:,} ({results['ticks_per_second']:,.0f} ticks/s)")
+    print(f"Coins: {results['coins']:,}")
+    print(f"Time: {results['seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
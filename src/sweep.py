@@ -0,0 +1,195 @@
+"""
+Leafy Legions: Stat Sweep
+
+This module runs headless games in parallel across every CPU core
+for each combination of entity/wave stats, and merges the results
+into a table for balancing
+
+Usage:
+    python -m src.sweep --stat Zombie.max_health=150,200,250 --stat Plant.cost=10,15 --games 8 --waves 50
+"""
+# Standard Imports
+import argparse
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from statistics import mean
+from typing import Any
+
+# Local Imports
+from src.sim import HeadlessGame
+
+# A combination of stats to test, i.e. (("Zombie", "max_health", 200), ("Plant", "cost", 15))
+StatCombination = tuple[tuple[str, str, float], ...]
+
+
+def parse_stat(option: str) -> list[tuple[str, str, float]]:
+    """
+    Parse a --stat option into the values to sweep.
+
+    Args:
+        option (str): The option, formatted as Class.stat=value1,value2,...
+
+    Returns:
+        list[tuple[str, str, float]]: The class name, stat and value of each setting.
+
+    Raises:
+        argparse.ArgumentTypeError: If the option is not formatted correctly.
+    """
+    try:
+        target, values = option.split("=", 1)
+        class_name, stat = target.split(".", 1)
+        return [(class_name, stat, float(value) if "." in value else int(value)) for value in values.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid stat {option}, expected Class.stat=value1,value2,...")
+
+
+def run_game(combination: StatCombination, seed: int, max_waves: int | None, max_ticks: int | None
+             ) -> tuple[StatCombination, int, dict[str, Any]]:
+    """
+    Run a single seeded headless game with a combination of stats.
+    This runs inside a worker process.
+
+    Args:
+        combination (StatCombination): The stats to override.
+        seed (int): The seed of the game.
+        max_waves (int | None): The number of waves to survive before stopping.
+        max_ticks (int | None): The number of ticks to simulate before stopping.
+
+    Returns:
+        tuple[StatCombination, int, dict[str, Any]]: The combination, seed and results of the game.
+    """
+    stat_overrides: dict[str, dict[str, float]] = {}
+    for class_name, stat, value in combination:
+        stat_overrides.setdefault(class_name, {})[stat] = value
+
+    game = HeadlessGame(seed=seed, stat_overrides=stat_overrides)
+    return combination, seed, game.run(max_waves=max_waves, max_ticks=max_ticks)
+
+
+def sweep(stats: list[list[tuple[str, str, float]]],
+          games: int,
+          seed: int = 0,
+          max_waves: int | None = None,
+          max_ticks: int | None = None,
+          jobs: int | None = None
+          ) -> dict[StatCombination, list[dict[str, Any]]]:
+    """
+    Run seeded headless games for every combination of stats, in parallel.
+
+    Args:
+        stats (list[list[tuple[str, str, float]]]): The settings to sweep for each stat.
+        games (int): The number of games (seeds) to run for each combination.
+        seed (int): The seed of the first game, the others use the following seeds. Default: 0
+        max_waves (int | None): The number of waves to survive before stopping. Default: None (no limit)
+        max_ticks (int | None): The number of ticks to simulate before stopping. Default: None (no limit)
+        jobs (int | None): The number of worker processes. Default: None (one per CPU core)
+
+    Returns:
+        dict[StatCombination, list[dict[str, Any]]]: The results of every game, by combination.
+    """
+    combinations: list[StatCombination] = list(itertools.product(*stats))
+    results: dict[StatCombination, list[dict[str, Any]]] = {combination: [] for combination in combinations}
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(run_game, combination, game_seed, max_waves, max_ticks)
+                   for combination in combinations
+                   for game_seed in range(seed, seed + games)]
+        for future in as_completed(futures):
+            combination, game_seed, game_results = future.result()
+            game_results["seed"] = game_seed
+            results[combination].append(game_results)
+
+    for game_results in results.values():
+        game_results.sort(key=lambda result: result["seed"])
+    return results
+
+
+def summarize(results: dict[StatCombination, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """
+    Merge the results of the games of each combination into a single row.
+
+    Args:
+        results (dict[StatCombination, list[dict[str, Any]]]): The results of every game, by combination.
+
+    Returns:
+        list[dict[str, Any]]: One row per combination, best combinations first.
+    """
+    rows = []
+    for combination, game_results in results.items():
+        waves = [result["waves"] for result in game_results]
+
+        # Average coins at the start of each wave, over the games that reached it
+        longest_curve = max(len(result["coin_curve"]) for result in game_results)
+        coin_curve = [mean(result["coin_curve"][wave] for result in game_results if len(result["coin_curve"]) > wave)
+                      for wave in range(longest_curve)]
+
+        rows.append({
+            "stats": " ".join(f"{class_name}.{stat}={value}" for class_name, stat, value in combination) or "-",
+            "games": len(game_results),
+            "mean_waves": mean(waves),
+            "min_waves": min(waves),
+            "max_waves": max(waves),
+            "lost": sum(result["lost"] for result in game_results),
+            "coin_curve": coin_curve,
+        })
+    return sorted(rows, key=lambda row: row["mean_waves"], reverse=True)
+
+
+def print_table(rows: list[dict[str, Any]]) -> None:
+    """
+    Print the summarized results as a table.
+
+    Args:
+        rows (list[dict[str, Any]]): The summarized results.
+    """
+    stats_width = max([len("Stats")] + [len(row["stats"]) for row in rows])
+    print(f"{'Stats':<{stats_width}}  Games  Mean Waves  Min  Max  Lost  Coins (waves 1, 5, 10, 20)")
+    for row in rows:
+        curve = row["coin_curve"]
+        coins = ", ".join(f"{curve[wave - 1]:.0f}" if len(curve) >= wave else "-" for wave in (1, 5, 10, 20))
+        print(f"{row['stats']:<{stats_width}}  {row['games']:>5}  {row['mean_waves']:>10.2f}  "
+              f"{row['min_waves']:>3}  {row['max_waves']:>3}  {row['lost']:>4}  {coins}")
+
+
+def write_csv(rows: list[dict[str, Any]], path: str) -> None:
+    """
+    Write the summarized results, including the full coin curves, to a CSV file.
+
+    Args:
+        rows (list[dict[str, Any]]): The summarized results.
+        path (str): The path of the CSV file.
+    """
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({**row, "coin_curve": " ".join(f"{coins:.1f}" for coins in row["coin_curve"])})
+
+
+def main() -> None:
+    """
+    Run a stat sweep from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Sweep Leafy Legions stats with headless games.")
+    parser.add_argument("--stat", type=parse_stat, action="append", default=[],
+                        help="stat to sweep, as Class.stat=value1,value2,... (i.e. Zombie.max_health=150,200)")
+    parser.add_argument("--games", type=int, default=4, help="games (seeds) per combination of stats")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--waves", type=int, default=None, help="stop each game after surviving this many waves")
+    parser.add_argument("--ticks", type=int, default=None, help="stop each game after this many ticks")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--csv", default=None, help="also write the results to this CSV file")
+    args = parser.parse_args()
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+
+    rows = summarize(sweep(args.stat, args.games, args.seed, args.waves, args.ticks, args.jobs))
+    print_table(rows)
+    if args.csv:
+        write_csv(rows, args.csv)
+
+
+if __name__ == "__main__":
+    main()